@@ -0,0 +1,104 @@
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.GUI.screens.DataVisualisation_elements.GraphLayout import GraphLayout
+
+OTLLogger.logger = Mock()
+
+
+def create_tree(node_count: int) -> tuple[list[str], list[tuple[str, str]]]:
+    rng = np.random.default_rng(1)
+    node_ids = [f'node{index}' for index in range(node_count)]
+    edges = [(f'node{index}', f'node{rng.integers(0, index)}') for index in range(1, node_count)]
+    return node_ids, edges
+
+
+def get_min_distance(positions: dict) -> float:
+    position_array = np.array(list(positions.values()))
+    distances = np.linalg.norm(position_array[:, None] - position_array[None], axis=2)
+    np.fill_diagonal(distances, np.inf)
+    return distances.min()
+
+
+def test_hierarchical_layout():
+    # the hub is the top level, a separate part is placed next to it
+    node_ids = ['hub', 'a', 'b', 'c', 'a_child', 'separate_1', 'separate_2']
+    edges = [('a', 'hub'), ('hub', 'b'), ('c', 'hub'), ('a_child', 'a'),
+             ('separate_1', 'separate_2'), ('unknown', 'hub'), ('hub', 'hub')]
+
+    positions = GraphLayout.compute_layout(node_ids=node_ids, edges=edges,
+                                           method=GraphLayout.hierarchical_method)
+
+    assert list(positions) == node_ids
+    levels = {node_id: position[1] / GraphLayout.level_separation
+              for node_id, position in positions.items()}
+    assert levels == {'hub': 0, 'a': 1, 'b': 1, 'c': 1, 'a_child': 2, 'separate_1': 0,
+                      'separate_2': 1}
+    assert positions['b'][0] - positions['a'][0] == GraphLayout.node_spacing
+    # the child is below its parent
+    assert positions['a_child'][0] == positions['a'][0]
+    assert positions['separate_1'][0] > positions['c'][0]
+    assert get_min_distance(positions) >= GraphLayout.level_separation
+
+
+def test_force_directed_layout_is_deterministic():
+    node_ids, edges = create_tree(100)
+
+    positions = GraphLayout.compute_layout(node_ids=node_ids, edges=edges,
+                                           method=GraphLayout.force_directed_method)
+
+    assert positions == GraphLayout.compute_layout(node_ids=node_ids, edges=edges,
+                                                   method=GraphLayout.force_directed_method)
+    assert get_min_distance(positions) > GraphLayout.ideal_edge_length / 4
+    edge_lengths = [np.linalg.norm(np.subtract(positions[from_id], positions[to_id]))
+                    for from_id, to_id in edges]
+    assert np.median(edge_lengths) < 3 * GraphLayout.ideal_edge_length
+
+
+@pytest.mark.parametrize('method', [GraphLayout.hierarchical_method,
+                                    GraphLayout.force_directed_method])
+def test_cached_positions_are_kept(method: str):
+    node_ids, edges = create_tree(50)
+    cached_positions = GraphLayout.compute_layout(node_ids=node_ids, edges=edges, method=method)
+
+    positions = GraphLayout.compute_layout(
+        node_ids=[*node_ids, 'new'], edges=[*edges, ('new', 'node3')], method=method,
+        cached_positions=cached_positions)
+
+    assert all(positions[node_id] == position for node_id, position in cached_positions.items())
+    # the new node is placed near the node it is connected to
+    distance = np.linalg.norm(np.subtract(positions['new'], positions['node3']))
+    assert 0 < distance < 3 * GraphLayout.ideal_edge_length
+    assert GraphLayout.compute_layout(node_ids=node_ids, edges=edges, method=method,
+                                      cached_positions=cached_positions) == cached_positions
+
+
+def test_compute_layout_of_empty_network():
+    assert GraphLayout.compute_layout(node_ids=[], edges=[],
+                                      method=GraphLayout.force_directed_method) == {}
+    assert GraphLayout.compute_layout(node_ids=['node'], edges=[],
+                                      method=GraphLayout.hierarchical_method) == {'node': [0.0, 0.0]}
+
+
+@pytest.mark.benchmark
+def test_benchmark_force_directed_layout():
+    node_ids, edges = create_tree(3000)
+
+    start = time.perf_counter()
+    positions = GraphLayout.compute_layout(node_ids=node_ids, edges=edges,
+                                           method=GraphLayout.force_directed_method)
+    layout_duration = time.perf_counter() - start
+
+    cached_positions = dict(list(positions.items())[:2900])
+    start = time.perf_counter()
+    GraphLayout.compute_layout(node_ids=node_ids, edges=edges,
+                               method=GraphLayout.force_directed_method,
+                               cached_positions=cached_positions)
+    cached_layout_duration = time.perf_counter() - start
+
+    print(f'\nforce directed layout of {len(node_ids)} nodes: {layout_duration:.2f}s, '
+          f'with {len(cached_positions)} cached positions: {cached_layout_duration:.2f}s')
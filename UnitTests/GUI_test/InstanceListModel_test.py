@@ -0,0 +1,215 @@
+import time
+
+import pytest
+from PyQt6.QtCore import QPersistentModelIndex, Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
+from PyQt6.QtWidgets import QTreeView
+
+from otlmow_gui.GUI.screens.RelationChange_elements.InstanceListModel import InstanceListModel, \
+    InstanceListRow
+
+
+def create_folder_rows(instances_per_type: dict[str, list[str]]) -> list[InstanceListRow]:
+    folder_rows = []
+    for asset_type, instance_names in instances_per_type.items():
+        folder_row = InstanceListRow(key=asset_type, texts=(f"{asset_type} ({len(instance_names)})",),
+                                     sort_texts=(asset_type,), data=asset_type, item_type="type",
+                                     selectable=False)
+        folder_row.rows = [InstanceListRow(key=name, texts=(name, asset_type), data=name)
+                           for name in instance_names]
+        folder_rows.append(folder_row)
+    return folder_rows
+
+
+class SignalRecorder:
+    def __init__(self, model: InstanceListModel):
+        self.inserted = []
+        self.removed = []
+        self.changed = []
+        model.rowsInserted.connect(
+            lambda parent, first, last: self.inserted.append((parent.row(), first, last)))
+        model.rowsRemoved.connect(
+            lambda parent, first, last: self.removed.append((parent.row(), first, last)))
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: self.changed.append(
+                (top_left.parent().row(), top_left.row())))
+
+
+def test_instances_are_fetched_per_folder(qtmodeltester):
+    model = InstanceListModel()
+    model.fetch_batch_size = 2
+    model.set_column_count(2)
+    model.set_rows(create_folder_rows({'Camera': ['c3', 'c1', 'c2'], 'Armatuur': ['a1']}))
+
+    assert [model.item(row).text() for row in range(model.rowCount())] == ['Armatuur (1)',
+                                                                           'Camera (3)']
+    camera_index = model.index(1, 0)
+    assert model.hasChildren(camera_index)
+    assert model.rowCount(camera_index) == 0
+    assert model.canFetchMore(camera_index)
+
+    model.fetchMore(camera_index)
+    assert model.rowCount(camera_index) == 2
+    # the item access shows all instances, also the ones that aren't fetched yet
+    camera_item = model.item(1)
+    assert [camera_item.child(row).text() for row in range(camera_item.rowCount())] == ['c1', 'c2',
+                                                                                        'c3']
+    assert camera_item.child(0, 1).text() == 'Camera'
+    assert camera_item.child(0).parent().data(InstanceListModel.data_1_role) == 'Camera'
+    assert model.index(0, 0, camera_index).data(InstanceListModel.item_type_role) == 'instance'
+    assert not model.flags(camera_index) & Qt.ItemFlag.ItemIsSelectable
+
+    qtmodeltester.check(model)
+
+
+def test_set_rows_only_signals_the_changes():
+    model = InstanceListModel()
+    model.set_rows(create_folder_rows({'Camera': ['c1', 'c2', 'c3'], 'Armatuur': ['a1']}))
+    model.fetchMore(model.index(1, 0))
+    kept_row = model.get_instance_row('c1')
+    recorder = SignalRecorder(model)
+
+    new_rows = create_folder_rows({'Camera': ['c1', 'c3', 'c4'], 'Beugel': ['b1']})
+    new_rows[0].rows[1].texts = ('c3', 'Camera (changed)')
+    inserted_rows = model.set_rows(new_rows)
+
+    assert [model.item(row).text() for row in range(model.rowCount())] == ['Beugel (1)',
+                                                                           'Camera (3)']
+    camera_item = model.item(1)
+    assert [camera_item.child(row).text() for row in range(camera_item.rowCount())] == ['c1', 'c3',
+                                                                                        'c4']
+    assert model.get_instance_row('c1') is kept_row
+    assert model.get_instance_row('c2') is None
+    assert model.get_instance_row('a1') is None
+    # c2 is removed from and c4 is inserted in Camera, before Armatuur is replaced by Beugel
+    assert recorder.removed == [(1, 1, 1), (-1, 0, 0)]
+    assert recorder.inserted == [(1, 2, 2), (-1, 0, 0)]
+    assert recorder.changed == [(1, 1)]
+    assert sorted(row.key for row in inserted_rows) == ['Beugel', 'b1', 'c4']
+
+
+def test_rows_of_unfetched_folders_are_not_signalled():
+    model = InstanceListModel()
+    model.set_rows(create_folder_rows({'Camera': ['c1', 'c2']}))
+    recorder = SignalRecorder(model)
+
+    model.set_rows(create_folder_rows({'Camera': ['c0', 'c2']}))
+
+    assert recorder.inserted == []
+    assert recorder.removed == []
+    assert model.rowCount(model.index(0, 0)) == 0
+    assert model.item(0).child(0).text() == 'c0'
+
+
+def test_sort_keeps_persistent_indexes():
+    model = InstanceListModel()
+    model.set_rows(create_folder_rows({'Camera': ['c1', 'c2', 'c3'], 'Armatuur': ['a1']}))
+    camera_index = model.index(1, 0)
+    model.fetchMore(camera_index)
+    persistent_index = QPersistentModelIndex(model.index(0, 0, camera_index))
+
+    model.sort(0, Qt.SortOrder.DescendingOrder)
+
+    assert [model.item(row).text() for row in range(model.rowCount())] == ['Camera (3)',
+                                                                           'Armatuur (1)']
+    assert persistent_index.row() == 2
+    assert persistent_index.parent().row() == 0
+    assert persistent_index.data() == 'c1'
+
+    # new rows are inserted in the current sort order
+    model.set_rows(create_folder_rows({'Camera': ['c1', 'c2', 'c3', 'c4'], 'Armatuur': ['a1']}))
+    camera_item = model.item(0)
+    assert [camera_item.child(row).text() for row in range(camera_item.rowCount())] == [
+        'c4', 'c3', 'c2', 'c1']
+
+
+def test_search_hides_the_rows_that_dont_match(qtmodeltester):
+    model = InstanceListModel()
+    model.set_rows(create_folder_rows({'Camera': ['c1', 'c2', 'c12'], 'Armatuur': ['a1']}))
+    model.fetchMore(model.index(1, 0))
+    kept_row = model.get_instance_row('c12')
+    recorder = SignalRecorder(model)
+
+    model.set_search_text('C1')
+
+    # the folder without matches is hidden, the rows themselves are kept
+    assert [model.item(row).text() for row in range(model.rowCount())] == ['Camera (3)']
+    camera_item = model.item(0)
+    assert [camera_item.child(row).text() for row in range(camera_item.rowCount())] == ['c1', 'c12']
+    assert model.get_instance_row('c12') is kept_row
+    assert recorder.removed == [(1, 2, 2), (-1, 0, 0)]
+    assert recorder.inserted == []
+
+    # new rows are filtered on the current search text
+    model.set_rows(create_folder_rows({'Camera': ['c1', 'c2', 'c12', 'c13'], 'Armatuur': ['a1']}))
+    assert [camera_item.child(row).text() for row in range(camera_item.rowCount())] == [
+        'c1', 'c12', 'c13']
+
+    model.set_search_text('')
+    assert [model.item(row).text() for row in range(model.rowCount())] == ['Armatuur (1)',
+                                                                           'Camera (4)']
+    assert model.item(1).rowCount() == 4
+
+    model.set_search_text('c')
+    qtmodeltester.check(model)
+
+
+def test_search_narrows_the_previous_matches():
+    model = InstanceListModel()
+    folder_rows = create_folder_rows({'Camera': ['cam_1', 'cam_2', 'beugel_1']})
+    folder_rows[0].rows[0].search_terms = ('identificator_x',)
+    model.set_rows(folder_rows)
+
+    # the search terms and the other columns are searched as well
+    model.set_search_text('identificator')
+    assert [row.key for row in model.item(0).row_data.visible_rows] == ['cam_1']
+    model.set_search_text('camera')
+    assert model.item(0).rowCount() == 3
+
+    model.set_search_text('cam')
+    assert model.matching_rows == {model.get_instance_row('cam_1'), model.get_instance_row('cam_2'),
+                                   model.get_instance_row('beugel_1')}
+    model.get_instance_row('beugel_1').search_text = 'changed'
+    # only the previous matches are searched for a longer search text
+    model.set_search_text('cam_')
+    assert model.matching_rows == {model.get_instance_row('cam_1'), model.get_instance_row('cam_2')}
+
+
+@pytest.mark.benchmark
+def test_benchmark_update_list(qtbot):
+    instances_per_type = {f'type{type_index}': [f'asset{type_index}_{index}' for index in range(500)]
+                          for type_index in range(20)}
+
+    # the previous implementation rebuilt all QStandardItems on every fill and expanded all
+    # folders to fit the columns to their contents
+    standard_item_view = QTreeView()
+    standard_item_model = QStandardItemModel()
+    standard_item_view.setModel(standard_item_model)
+    start = time.perf_counter()
+    for asset_type, instance_names in instances_per_type.items():
+        folder_item = QStandardItem(asset_type)
+        for name in instance_names:
+            folder_item.appendRow((QStandardItem(name), QStandardItem(asset_type)))
+        standard_item_model.appendRow(folder_item)
+    standard_item_view.expandAll()
+    standard_item_view.resizeColumnToContents(0)
+    standard_item_view.resizeColumnToContents(1)
+    standard_item_view.collapseAll()
+    standard_item_duration = time.perf_counter() - start
+
+    view = QTreeView()
+    model = InstanceListModel()
+    view.setModel(model)
+    model.set_column_count(2)
+    model.set_rows(create_folder_rows(instances_per_type))
+    instances_per_type['type0'].append('new_asset')
+    start = time.perf_counter()
+    # the rows are still created for every fill, only the changed rows reach the view
+    model.set_rows(create_folder_rows(instances_per_type))
+    update_duration = time.perf_counter() - start
+
+    print(f'\nfilling {sum(map(len, instances_per_type.values()))} rows: QStandardItems '
+          f'{standard_item_duration:.3f}s, updating the model with one new row '
+          f'{update_duration:.3f}s')
+    assert model.get_instance_row('new_asset') is not None
+
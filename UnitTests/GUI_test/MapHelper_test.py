@@ -0,0 +1,178 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from pyproj import Transformer
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.GUI.screens.Map_elements.MapHelper import MapHelper
+
+OTLLogger.logger = Mock()
+
+root_dir = Path(__file__).parent.parent.parent
+
+
+def run_in_separate_loop(coroutine):
+    # a separate loop leaves the current event loop of other tests alone
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_convert_wkt_list_to_wgs84():
+    geojson_geometries = MapHelper.convert_wkt_list_to_wgs84([
+        'POINT Z (150000 200000 0)',
+        'LINESTRING Z (150000 200000 0, 150010 200010 0)',
+        'POLYGON Z ((150000 200000 0, 150010 200000 0, 150010 200010 0, 150000 200000 0))',
+        'MULTIPOINT ((150000 200000), (150010 200010))',
+        'POINT (150000 200000)',
+        'not a geometry'])
+
+    lng_lat = [4.3687561, 51.1100861]
+    assert geojson_geometries[0] == [{'type': 'Point', 'coordinates': lng_lat}]
+    assert [geometry['type'] for geometry in geojson_geometries[1]] == ['LineString']
+    assert geojson_geometries[1][0]['coordinates'][0] == lng_lat
+    assert len(geojson_geometries[1][0]['coordinates']) == 2
+    # a polygon is drawn by its exterior ring
+    assert [geometry['type'] for geometry in geojson_geometries[2]] == ['Polygon']
+    assert len(geojson_geometries[2][0]['coordinates']) == 1
+    assert len(geojson_geometries[2][0]['coordinates'][0]) == 4
+    assert [geometry['type'] for geometry in geojson_geometries[3]] == ['Point', 'Point']
+    assert geojson_geometries[4] == [{'type': 'Point', 'coordinates': lng_lat}]
+    assert geojson_geometries[5] == []
+
+
+def test_get_transformer_is_cached():
+    assert MapHelper.get_transformer() is MapHelper.get_transformer()
+
+
+def test_create_html_map(tmp_path: Path):
+    wkt_strings = ['POINT Z (150000 200000 0)',
+                   'LINESTRING Z (150000 200000 0, 150010 200010 0)',
+                   'POLYGON Z ((150000 200000 0, 150010 200000 0, 150010 200010 0, 150000 200000 0))']
+    id_to_object_with_text_and_data_dict = {
+        f'id{index}': (SimpleNamespace(geometry=wkt_string),
+                       {'text': SimpleNamespace(screen_name=f'asset{index}', typeURI='typeURI')})
+        for index, wkt_string in enumerate(wkt_strings)}
+    id_to_object_with_text_and_data_dict['no_geometry'] = (SimpleNamespace(geometry=None), {})
+
+    map_path, _, map_id = run_in_separate_loop(MapHelper.create_html_map(
+        id_to_object_with_text_and_data_dict, IMG_DIR=root_dir / 'otlmow_gui' / 'img',
+        HTML_DIR=tmp_path))
+
+    html = Path(map_path).read_text()
+    assert f"loadAssetFeatureCollection(featureCollection, '{map_id}');" in html
+    payload_start = html.index(f'id="{MapHelper.asset_data_element_id}">') + len(
+        f'id="{MapHelper.asset_data_element_id}">')
+    feature_collection = json.loads(html[payload_start:html.index('</script>', payload_start)])
+    assert feature_collection['typeURIs'] == ['typeURI']
+    assert [feature['geometry']['type'] for feature in feature_collection['features']] == [
+        'Point', 'LineString', 'Polygon']
+    assert feature_collection['features'][0]['properties'] == {
+        'id': 'id0', 'name': 'asset0', 'typeURIIndex': 0}
+    assert MapHelper.added_layer_asset_id_list == ['id0', 'id1', 'id2']
+
+
+@pytest.mark.parametrize('clustered_rendering', [True, False])
+def test_create_html_map_clustered_rendering(tmp_path: Path, clustered_rendering: bool):
+    id_to_object_with_text_and_data_dict = {
+        'id0': (SimpleNamespace(geometry='POINT (150000 200000)'),
+                {'text': SimpleNamespace(screen_name='asset0', typeURI='typeURI')})}
+
+    orig_clustered_rendering = MapHelper.clustered_rendering
+    MapHelper.clustered_rendering = clustered_rendering
+    try:
+        map_path, _, _ = run_in_separate_loop(MapHelper.create_html_map(
+            id_to_object_with_text_and_data_dict, IMG_DIR=root_dir / 'otlmow_gui' / 'img',
+            HTML_DIR=tmp_path))
+    finally:
+        MapHelper.clustered_rendering = orig_clustered_rendering
+
+    html = Path(map_path).read_text()
+    assert f'"clusteredRendering": {json.dumps(clustered_rendering)}' in html
+    assert ('leaflet.markercluster.js' in html) == clustered_rendering
+    assert ('MarkerCluster.Default.css' in html) == clustered_rendering
+
+
+def test_create_html_map_links_asset_bundle(tmp_path: Path):
+    map_path, _, _ = run_in_separate_loop(MapHelper.create_html_map(
+        {}, IMG_DIR=root_dir / 'otlmow_gui' / 'img', HTML_DIR=tmp_path))
+
+    html = Path(map_path).read_text()
+    asset_bundle_urls = MapHelper.get_asset_bundle_urls(root_dir / 'otlmow_gui' / 'img')
+    assert MapHelper.get_asset_bundle_urls(root_dir / 'otlmow_gui' / 'img') is asset_bundle_urls
+    assert f'<script src="{asset_bundle_urls["js"]}"></script>' in html
+    assert f'href="{asset_bundle_urls["css"]}"' in html
+    assert asset_bundle_urls["icon"] in html
+    # the icon and the static functions are no longer in every map
+    assert 'base64' not in html
+    assert 'function activateHighlightLayer' not in html
+
+    script = (root_dir / 'otlmow_gui' / 'javascripts_visualisation' / 'asset_map.js').read_text()
+    for function_name in ['initAssetMap', 'loadAssetFeatureCollection', 'updateAssets',
+                          'activateHighlightLayer', 'goToLayer', 'onMapClick']:
+        assert f'function {function_name}(' in script
+
+
+def test_create_asset_feature_collection_escapes_script_end():
+    id_to_object_with_text_and_data_dict = {
+        'id0': (SimpleNamespace(geometry='POINT (150000 200000)'),
+                {'text': SimpleNamespace(screen_name='</script><b>', typeURI='typeURI')})}
+
+    feature_collection = run_in_separate_loop(MapHelper.create_asset_feature_collection(
+        id_to_object_with_text_and_data_dict))
+    script_element = MapHelper.get_feature_collection_script_element(feature_collection)
+
+    assert script_element.count('</script>') == 1
+    payload = script_element[script_element.index('>') + 1:-len('</script>')]
+    assert json.loads(payload)['features'][0]['properties']['name'] == '</script><b>'
+
+
+def test_create_asset_changes_message():
+    id_to_object_with_text_and_data_dict = {
+        f'id{index}': (SimpleNamespace(geometry='POINT (150000 200000)'),
+                       {'text': SimpleNamespace(screen_name=f'asset{index}', typeURI='typeURI')})
+        for index in range(3)}
+    id_to_object_with_text_and_data_dict['no_geometry'] = (SimpleNamespace(geometry=None), {})
+    MapHelper.added_layer_asset_id_list[:] = ['id0', 'id1', 'removed']
+
+    asset_states = MapHelper.get_asset_states(id_to_object_with_text_and_data_dict)
+    assert list(asset_states) == ['id0', 'id1', 'id2']
+    assert asset_states['id0'] == ('POINT (150000 200000)', 'asset0', 'typeURI')
+
+    message = run_in_separate_loop(MapHelper.create_asset_changes_message(
+        id_to_object_with_text_and_data_dict, changed_ids=['id1', 'id2'], removed_ids=['removed']))
+
+    changes = json.loads(message)
+    assert changes['removedIds'] == ['removed', 'id1', 'id2']
+    assert [feature['properties']['id'] for feature in changes['featureCollection']['features']] == [
+        'id1', 'id2']
+    assert MapHelper.added_layer_asset_id_list == ['id0', 'id1', 'id2']
+
+
+@pytest.mark.benchmark
+def test_benchmark_convert_wkt_list_to_wgs84():
+    wkt_strings = [f'POINT Z ({150000 + index} {200000 + index} 0)' for index in range(30000)]
+
+    # the previous implementation created a transformer for every geometry
+    start = time.perf_counter()
+    for wkt_string in wkt_strings[:100]:
+        transformer = Transformer.from_crs(crs_from=MapHelper.source_crs,
+                                           crs_to=MapHelper.target_crs, always_xy=True)
+        transformer.transform(150000, 200000)
+    per_geometry_duration = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    geometry_parts = MapHelper.convert_wkt_list_to_wgs84(wkt_strings)
+    batch_duration = time.perf_counter() - start
+
+    print(f'\nreprojecting {len(wkt_strings)} geometries: transformer per geometry '
+          f'{per_geometry_duration * len(wkt_strings):.1f}s (extrapolated), '
+          f'batch {batch_duration:.3f}s')
+    assert len(geometry_parts) == len(wkt_strings)
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import \
+    RelationChangeHelpers
+
+ONDERDEEL = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#'
+INSTALLATIE = 'https://wegenenverkeer.data.vlaanderen.be/ns/installatie#'
+
+
+def create_objects(typeURIs: list[str]) -> list[SimpleNamespace]:
+    return [SimpleNamespace(typeURI=typeURI) for typeURI in typeURIs]
+
+
+def test_get_type_name_counts():
+    type_name_counts = RelationChangeHelpers.get_type_name_counts(
+        [f'{ONDERDEEL}Camera', f'{ONDERDEEL}Camera', f'{ONDERDEEL}Wegkantkast',
+         f'{INSTALLATIE}Wegkantkast'])
+
+    assert type_name_counts == {'Camera': 1, 'Wegkantkast': 2}
+
+
+def test_is_unique_across_namespaces():
+    objects = create_objects([f'{ONDERDEEL}Camera', f'{ONDERDEEL}Camera',
+                              f'{ONDERDEEL}Wegkantkast', f'{INSTALLATIE}Wegkantkast'])
+    type_name_counts = RelationChangeHelpers.get_type_name_counts(
+        otl_object.typeURI for otl_object in objects)
+
+    # the namespace is added when the type name is used in more than one namespace, or when
+    # the type isn't one of the objects
+    for typeURI, add_namespace in [(f'{ONDERDEEL}Camera', False),
+                                   (f'{ONDERDEEL}Wegkantkast', True),
+                                   (f'{INSTALLATIE}Wegkantkast', True),
+                                   (f'{ONDERDEEL}Bevestiging', True)]:
+        assert RelationChangeHelpers.is_unique_across_namespaces(typeURI, objects) == add_namespace
+        assert RelationChangeHelpers.is_unique_across_namespaces(
+            typeURI, type_name_counts=type_name_counts) == add_namespace
+
@@ -0,0 +1,116 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Bevestiging import Bevestiging
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Camera import Camera
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Wegkantkast import Wegkantkast
+from otlmow_visuals.PyVisWrapper import PyVisWrapper
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.GUI.screens.DataVisualisation_elements.TypeOverviewGraph import TypeOverviewGraph
+from otlmow_gui.GUI.screens.DataVisualisation_elements.VisualisationHelper import VisualisationHelper
+
+OTLLogger.logger = Mock()
+
+
+def create_objects(camera_count: int) -> list:
+    kast = Wegkantkast()
+    kast.assetId.identificator = 'kast'
+    objects = [kast]
+    for index in range(camera_count):
+        camera = Camera()
+        camera.assetId.identificator = f'camera{index}'
+        bevestiging = Bevestiging()
+        bevestiging.assetId.identificator = f'bevestiging{index}'
+        bevestiging.bronAssetId.identificator = camera.assetId.identificator
+        bevestiging.doelAssetId.identificator = kast.assetId.identificator
+        objects.extend([camera, bevestiging])
+    # a relation to an asset that is not in the project is not drawn
+    bevestiging = Bevestiging()
+    bevestiging.assetId.identificator = 'bevestiging_extern'
+    bevestiging.bronAssetId.identificator = 'extern'
+    bevestiging.doelAssetId.identificator = kast.assetId.identificator
+    objects.append(bevestiging)
+    return objects
+
+
+def test_group_nodes_and_edges():
+    type_overview_graph = TypeOverviewGraph(objects=create_objects(camera_count=5),
+                                            vis_wrap=PyVisWrapper())
+
+    group_nodes = type_overview_graph.get_group_nodes()
+    assert [group_node['id'] for group_node in group_nodes] == ['type_group_0', 'type_group_1']
+    assert group_nodes[0]['label'] == '<b>Camera</b>\n(5)'
+    assert group_nodes[1]['label'] == '<b>Wegkantkast</b>\n(1)'
+
+    edges = type_overview_graph.get_edges()
+    assert len(edges) == 1
+    assert edges[0]['from'] == 'type_group_0'
+    assert edges[0]['to'] == 'type_group_1'
+    assert edges[0]['label'] == '5'
+
+
+def test_expand_group_removes_the_edges_of_the_loaded_page():
+    # the page is loaded with the edges of a graph made for the html, the graph that handles the
+    # expansions is made again when the page has loaded and doesn't get its edges asked
+    objects = create_objects(camera_count=5)
+    group_edge_id = TypeOverviewGraph(objects=objects, vis_wrap=PyVisWrapper()).get_edges()[0]['id']
+    type_overview_graph = TypeOverviewGraph(objects=objects, vis_wrap=PyVisWrapper())
+
+    expansion = type_overview_graph.expand_group('type_group_0')
+
+    assert expansion['removeNodeIds'] == ['type_group_0']
+    assert expansion['removeEdgeIds'] == [group_edge_id]
+    assert sorted(edge['from'] for edge in expansion['addEdges']) == [
+        f'camera{index}' for index in range(5)]
+
+
+def test_expand_group():
+    type_overview_graph = TypeOverviewGraph(objects=create_objects(camera_count=5),
+                                            vis_wrap=PyVisWrapper())
+    type_overview_graph.group_page_size = 3
+    group_edge_id = type_overview_graph.get_edges()[0]['id']
+
+    expansion = type_overview_graph.expand_group('type_group_0')
+    assert [node['id'] for node in expansion['addNodes']] == ['camera0', 'camera1', 'camera2']
+    assert expansion['addNodes'][0]['title']['html'].startswith('<div')
+    assert expansion['updateNodes'][0]['label'] == '<b>Camera</b>\n(2)'
+    assert expansion['removeNodeIds'] == []
+    # the cameras that are shown have their own edge to the group of the kast
+    assert sorted((edge['from'], edge['label']) for edge in expansion['addEdges']) == [
+        ('camera0', '1'), ('camera1', '1'), ('camera2', '1'), ('type_group_0', '2')]
+    assert expansion['removeEdgeIds'] == []
+
+    expansion = type_overview_graph.expand_group('type_group_1')
+    assert [node['id'] for node in expansion['addNodes']] == ['kast']
+    assert expansion['removeNodeIds'] == ['type_group_1']
+    camera_group_edge_id = (f'{TypeOverviewGraph.group_edge_id_prefix}type_group_0_kast_'
+                            f'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Bevestiging')
+    assert sorted(edge['id'] for edge in expansion['addEdges']) == [
+        'bevestiging0', 'bevestiging1', 'bevestiging2', camera_group_edge_id]
+    assert group_edge_id not in [edge['id'] for edge in expansion['addEdges']]
+    assert len(expansion['removeEdgeIds']) == 4
+
+    expansion = type_overview_graph.expand_group('type_group_0')
+    assert [node['id'] for node in expansion['addNodes']] == ['camera3', 'camera4']
+    assert expansion['removeNodeIds'] == ['type_group_0']
+    assert sorted(type_overview_graph.shown_edges) == [f'bevestiging{index}' for index in range(5)]
+
+    assert type_overview_graph.expand_group('camera0') is None
+
+
+def test_create_type_overview_html(tmp_path: Path, monkeypatch):
+    # pyvis copies its libraries to the working directory
+    monkeypatch.chdir(tmp_path)
+    html_path = tmp_path / 'graph_visualisation.html'
+
+    type_overview_graph = VisualisationHelper.create_type_overview_html(
+        html_loc=html_path, objects_in_memory=create_objects(camera_count=5))
+
+    html = html_path.read_text()
+    assert '<script src="qrc:///qtwebchannel/qwebchannel.js"></script>' in html
+    assert 'var network = drawGraph();' in html
+    assert 'function applyTypeGroupExpansion(expansion)' in html
+    assert '"id": "type_group_0"' in html
+    assert '"camera0"' not in html
+    assert type_overview_graph.shown_asset_ids == set()
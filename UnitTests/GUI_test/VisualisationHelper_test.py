@@ -0,0 +1,243 @@
+import asyncio
+import json
+import time
+import tracemalloc
+from copy import deepcopy
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Bevestiging import Bevestiging
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Camera import Camera
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Wegkantkast import Wegkantkast
+
+from otlmow_visuals.PyVisWrapper import PyVisWrapper
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.project.Project import Project
+from otlmow_gui.GUI.screens.DataVisualisation_elements.GraphLayout import GraphLayout
+from otlmow_gui.GUI.screens.DataVisualisation_elements.VisualisationHelper import VisualisationHelper
+
+OTLLogger.logger = Mock()
+
+
+def create_objects() -> list:
+    camera = Camera()
+    camera.assetId.identificator = 'camera'
+    kast = Wegkantkast()
+    kast.assetId.identificator = 'kast'
+    bevestiging = Bevestiging()
+    bevestiging.assetId.identificator = 'bevestiging'
+    bevestiging.bronAssetId.identificator = 'camera'
+    bevestiging.doelAssetId.identificator = 'kast'
+    return [camera, kast, bevestiging]
+
+
+def run_in_separate_loop(coroutine):
+    # a separate loop leaves the current event loop of other tests alone
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def load_network_state(network_state_path: Path) -> dict:
+    network_state_script = network_state_path.read_text()
+    prefix = f'var {VisualisationHelper.network_state_variable_name} = '
+    assert network_state_script.startswith(prefix)
+    return json.loads(network_state_script[len(prefix):].rstrip().rstrip(';'))
+
+
+def test_get_network_state_path_matches_project():
+    html_path = Path('visuals') / Project.visualisation_filename
+
+    assert VisualisationHelper.get_network_state_path(html_path) == \
+           Path('visuals') / Project.visualisation_network_state_filename
+
+
+def test_get_node_layout_path_matches_project():
+    html_path = Path('visuals') / Project.visualisation_filename
+
+    assert VisualisationHelper.get_node_layout_path(html_path) == \
+           Path('visuals') / Project.visualisation_node_layout_filename
+
+
+def test_create_html_loads_network_state(tmp_path: Path, monkeypatch):
+    # pyvis copies its libraries to the working directory
+    monkeypatch.chdir(tmp_path)
+    html_path = tmp_path / 'graph_visualisation.html'
+    network_state_path = VisualisationHelper.get_network_state_path(html_path)
+    network_state_path.write_text('var savedNetworkState = {};')
+
+    VisualisationHelper.create_html(html_loc=html_path, objects_in_memory=create_objects())
+
+    html = html_path.read_text()
+    assert f'<script src="{network_state_path.name}"></script>' in html
+    assert html.index('loadSavedNetworkState(nodes, edges, options);') < html.index(
+        'network = new vis.Network(container, data, options);')
+    assert f"'networkStateVersion' : {VisualisationHelper.network_state_version}" in html
+    # the network state of the previous html doesn't belong to the new network
+    assert not network_state_path.exists()
+
+
+def test_save_network_state(tmp_path: Path):
+    html_path = tmp_path / 'graph_visualisation.html'
+    combined_data = {key: [] for key in VisualisationHelper.network_state_keys}
+    combined_data['html_path'] = str(html_path)
+    combined_data['nodeList'] = [{'id': 'camera', 'x': 10, 'y': 20, 'title': {'html': '<div>"camera"</div>'}}]
+    combined_data['edgeList'] = [{'id': 'bevestiging', 'from': 'camera', 'to': 'kast'}]
+    combined_data['relationIdToSubEdgesList'] = [['bevestiging', ['sub_edge']]]
+
+    network_state_path = VisualisationHelper.save_network_state(html_path=html_path,
+                                                                combined_data=combined_data)
+
+    assert network_state_path == VisualisationHelper.get_network_state_path(html_path)
+    network_state = load_network_state(network_state_path)
+    assert network_state['nodeList'] == combined_data['nodeList']
+    assert network_state['edgeList'] == combined_data['edgeList']
+    assert network_state['relationIdToSubEdgesList'] == [['bevestiging', ['sub_edge']]]
+    assert network_state['collection_id_to_list_of_relation_ids'] == {}
+    assert network_state['networkStateVersion'] == VisualisationHelper.network_state_version
+    assert 'html_path' not in network_state
+
+
+def test_create_html_with_layout(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    html_path = tmp_path / 'graph_visualisation.html'
+
+    run_in_separate_loop(VisualisationHelper.create_html_with_layout(
+        html_loc=html_path, objects_in_memory=create_objects()))
+
+    html = html_path.read_text()
+    node_layout_path = VisualisationHelper.get_node_layout_path(html_path)
+    assert f'<script src="{node_layout_path.name}"></script>' in html
+    assert html.index('applyPrecomputedNodeLayout(nodes, options);') < html.index(
+        'network = new vis.Network(container, data, options);')
+    node_layout = VisualisationHelper.load_script_variable(
+        node_layout_path, VisualisationHelper.node_layout_variable_name)
+    assert node_layout['method'] == GraphLayout.hierarchical_method
+    assert sorted(node_layout['positions']) == ['camera', 'kast']
+    # the camera is attached to the kast, they are in two levels
+    assert abs(node_layout['positions']['camera'][1] - node_layout['positions']['kast'][1]) == \
+           GraphLayout.level_separation
+
+
+def test_create_html_with_layout_keeps_cached_positions(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    html_path = tmp_path / 'graph_visualisation.html'
+    vis_mode = "4 ForceAtlas2Based visualisatie"
+    objects = create_objects()
+    run_in_separate_loop(VisualisationHelper.create_html_with_layout(
+        html_loc=html_path, objects_in_memory=objects, vis_mode=vis_mode))
+    node_layout_path = VisualisationHelper.get_node_layout_path(html_path)
+    first_positions = VisualisationHelper.load_script_variable(
+        node_layout_path, VisualisationHelper.node_layout_variable_name)['positions']
+    # the user moved the camera and saved the network
+    VisualisationHelper.get_network_state_path(html_path).write_text(
+        'var savedNetworkState = {"nodeList": [{"id": "camera", "x": 1000, "y": 2000}]};')
+
+    new_camera = Camera()
+    new_camera.assetId.identificator = 'new_camera'
+    run_in_separate_loop(VisualisationHelper.create_html_with_layout(
+        html_loc=html_path, objects_in_memory=[*objects, new_camera], vis_mode=vis_mode))
+
+    positions = VisualisationHelper.load_script_variable(
+        node_layout_path, VisualisationHelper.node_layout_variable_name)['positions']
+    assert positions['camera'] == [1000, 2000]
+    assert positions['kast'] == first_positions['kast']
+    assert 'new_camera' in positions
+
+    # a layout of another method isn't used as cache
+    assert VisualisationHelper.load_cached_node_positions(
+        html_path, layout_method=GraphLayout.hierarchical_method) == {}
+
+
+def test_create_html_with_layout_in_shell_visualisation(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    html_path = tmp_path / 'graph_visualisation.html'
+    node_layout_path = VisualisationHelper.get_node_layout_path(html_path)
+    node_layout_path.write_text('var precomputedNodeLayout = {};')
+
+    run_in_separate_loop(VisualisationHelper.create_html_with_layout(
+        html_loc=html_path, objects_in_memory=create_objects(), vis_mode="3 Shell visualisatie"))
+
+    # the shell visualisation positions the nodes itself
+    assert html_path.exists()
+    assert not node_layout_path.exists()
+
+
+def test_create_html_does_not_copy_objects(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    objects = create_objects()
+    shown_objects = []
+    monkeypatch.setattr(PyVisWrapper, 'show',
+                        lambda self, list_of_objects, **kwargs: shown_objects.extend(list_of_objects))
+    monkeypatch.setattr(VisualisationHelper, 'modify_html', Mock())
+
+    VisualisationHelper.create_html(html_loc=tmp_path / 'graph_visualisation.html',
+                                    objects_in_memory=objects)
+
+    assert [otl_object.typeURI for otl_object in shown_objects] == sorted(
+        otl_object.typeURI for otl_object in objects)
+    assert all(any(shown_object is otl_object for otl_object in objects)
+               for shown_object in shown_objects)
+    # the order of the list of the caller is left alone
+    assert [otl_object.assetId.identificator for otl_object in objects] == [
+        'camera', 'kast', 'bevestiging']
+
+
+def test_create_html_leaves_objects_unchanged(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    objects = create_objects()
+    kast = objects[1]
+    # enough relations to the kast to group them in a collection, which redirects the relations
+    for index in range(3):
+        camera = Camera()
+        camera.assetId.identificator = f'camera{index}'
+        bevestiging = Bevestiging()
+        bevestiging.assetId.identificator = f'bevestiging{index}'
+        bevestiging.bronAssetId.identificator = camera.assetId.identificator
+        bevestiging.doelAssetId.identificator = kast.assetId.identificator
+        objects.extend([camera, bevestiging])
+    objects_before = deepcopy(objects)
+
+    vis_wrap = VisualisationHelper.create_html(html_loc=tmp_path / 'graph_visualisation.html',
+                                               objects_in_memory=objects, collection_threshold=2)
+
+    assert vis_wrap.collection_id_to_list_of_relation_ids
+    assert objects == objects_before
+
+
+@pytest.mark.benchmark
+def test_benchmark_create_html_memory(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    objects = []
+    for index in range(2000):
+        camera = Camera()
+        camera.assetId.identificator = f'camera{index}'
+        camera.naam = f'camera_{index}'
+        objects.append(camera)
+
+    # the previous implementation made a deep copy of all objects before creating the html
+    tracemalloc.start()
+    start = time.perf_counter()
+    copied_objects = deepcopy(objects)
+    copy_duration = time.perf_counter() - start
+    _, copy_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del copied_objects
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    VisualisationHelper.create_html(html_loc=tmp_path / 'graph_visualisation.html',
+                                    objects_in_memory=objects)
+    create_duration = time.perf_counter() - start
+    _, create_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'\ncreating the html of {len(objects)} objects: peak {create_peak / 1e6:.1f} MB in '
+          f'{create_duration:.2f}s, the deep copy it no longer makes: peak {copy_peak / 1e6:.1f} MB '
+          f'in {copy_duration:.2f}s')
+    assert (tmp_path / 'graph_visualisation.html').exists()
@@ -0,0 +1,31 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from otlmow_gui.Domain.project.Project import Project
+
+
+def pytest_configure(config):
+    # also registered here, UnitTests/pytest.ini isn't used when pytest runs from the repository root
+    config.addinivalue_line(
+        "markers", "benchmark: marks slow benchmark tests, only run when OTLMOW_RUN_BENCHMARKS is set")
+
+
+def pytest_collection_modifyitems(config, items):
+    # the benchmarks only run on request: OTLMOW_RUN_BENCHMARKS=1 python -m pytest -m benchmark -s
+    if os.environ.get("OTLMOW_RUN_BENCHMARKS"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="set OTLMOW_RUN_BENCHMARKS=1 to run the benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(autouse=True)
+def mock_project_cache_folder(tmp_path: Path, monkeypatch):
+    # the test projects are in the demo_projects of the package, their caches are kept out of it
+    cache_folder = tmp_path / Project.cache_foldername
+    cache_folder.mkdir(exist_ok=True)
+    monkeypatch.setattr(Project, "get_cache_folder_path", lambda self: cache_folder)
+    yield cache_folder
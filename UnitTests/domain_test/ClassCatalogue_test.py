@@ -0,0 +1,71 @@
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_class_dict
+
+from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
+from otlmow_gui.Domain.database.ClassCatalogue import ClassCatalogue
+from otlmow_gui.Domain.database.ModelDataCache import ModelDataCache
+from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import \
+    RelationChangeHelpers
+
+ONDERDEEL = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#'
+
+
+@pytest.fixture
+def mock_model_dir(tmp_path: Path):
+    original_get_otl_wizard_model_dir = ProgramFileStructure.get_otl_wizard_model_dir
+    ProgramFileStructure.get_otl_wizard_model_dir = Mock(return_value=tmp_path)
+    ModelDataCache.data_in_memory = {}
+    ClassCatalogue.clear()
+
+    yield tmp_path
+
+    ProgramFileStructure.get_otl_wizard_model_dir = original_get_otl_wizard_model_dir
+    ModelDataCache.data_in_memory = {}
+    ClassCatalogue.clear()
+
+
+def test_entries_describe_the_classes(mock_model_dir: Path):
+    entries = ClassCatalogue.get_entries()
+
+    assert entries.keys() == get_hardcoded_class_dict().keys()
+    camera = entries[f'{ONDERDEEL}Camera']
+    assert not camera.abstract
+    assert not camera.is_relation
+    assert camera.label == 'Camera'
+    assert camera.namespace == 'onderdeel'
+    assert entries[f'{ONDERDEEL}Bevestiging'].is_relation
+    assert ClassCatalogue.get_entry('http://purl.org/dc/terms/Agent').name == 'Agent'
+    assert ClassCatalogue.get_entry(
+        'https://lgc.data.wegenenverkeer.be/ns/installatie#Kast').namespace == 'legacy'
+
+
+def test_catalogue_is_made_once_per_model_version(mock_model_dir: Path):
+    with patch.object(ClassCatalogue, 'create_catalogue',
+                      wraps=ClassCatalogue.create_catalogue) as create_catalogue:
+        entries = ClassCatalogue.get_entries()
+        assert ClassCatalogue.get_entries() is entries
+
+        # a new run of the application reads the catalogue from the file
+        ClassCatalogue.clear()
+        ModelDataCache.data_in_memory = {}
+        assert ClassCatalogue.get_entries() == entries
+
+    create_catalogue.assert_called_once()
+    assert (mock_model_dir / f'{ClassCatalogue.cache_name}.json').exists()
+
+
+def test_list_all_non_abstract_class_type_uris(mock_model_dir: Path):
+    type_uris = RelationChangeHelpers.list_all_non_abstract_class_type_uris()
+    asset_type_uris = RelationChangeHelpers.list_all_non_abstract_class_type_uris(
+        otl_assets_only=True)
+
+    assert type_uris == sorted(typeURI for typeURI, info in get_hardcoded_class_dict().items()
+                               if not info['abstract'])
+    assert f'{ONDERDEEL}Bevestiging' in type_uris
+    assert f'{ONDERDEEL}Bevestiging' not in asset_type_uris
+    assert f'{ONDERDEEL}Camera' in asset_type_uris
+    assert f'{ONDERDEEL}AbstracteAanvullendeGeometrie' not in type_uris
+
@@ -0,0 +1,111 @@
+import time
+from pathlib import Path
+
+import pytest
+from otlmow_converter.Exceptions.CannotCombineAssetsError import CannotCombineAssetsError
+from otlmow_converter.Exceptions.CannotCombineDifferentAssetsError import \
+    CannotCombineAssetsWithDifferentTypeError
+from otlmow_converter.Exceptions.ExceptionsGroup import ExceptionsGroup
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import create_dict_from_asset
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Funderingsmassief import Funderingsmassief
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Verkeersbordsteun import Verkeersbordsteun
+
+from otlmow_gui.Domain.util.CombineAssetHelper import CombineAssetHelper
+from otlmow_gui.GUI.translation.GlobalTranslate import GlobalTranslate
+
+
+@pytest.fixture
+def create_translations() -> None:
+    lang_dir = Path(__file__).absolute().parent.parent.parent / 'otlmow_gui' / 'locale/'
+    GlobalTranslate(settings={"language": "DUTCH"}, lang_dir=str(lang_dir))
+
+
+def create_fragment(identificator: str, index: int) -> Verkeersbordsteun:
+    fragment = Verkeersbordsteun()
+    fragment.assetId.identificator = identificator
+    if index == 0:
+        fragment.naam = f'naam_{identificator}'
+    elif index == 1:
+        fragment.isActief = True
+    elif index == 2:
+        fragment.toestand = 'in-gebruik'
+    elif index == 3:
+        fragment.bestekPostNummer = ['post']
+    else:
+        fragment.notitie = f'notitie_{identificator}'
+    return fragment
+
+
+def combine_pairwise(fragments: list[Verkeersbordsteun]) -> Verkeersbordsteun:
+    combined_asset = fragments[0]
+    for fragment in fragments[1:]:
+        combined_asset = CombineAssetHelper.combine_two_asset_instances(combined_asset, fragment)
+    return combined_asset
+
+
+def test_combine_assets_merges_all_fragments():
+    fragments = [create_fragment('id', index) for index in range(5)]
+    other_asset = create_fragment('other_id', 0)
+
+    combined_assets = CombineAssetHelper.combine_assets(fragments + [other_asset])
+
+    assert len(combined_assets) == 2
+    assert create_dict_from_asset(combined_assets[0]) == create_dict_from_asset(
+        combine_pairwise(fragments))
+    assert combined_assets[0].naam == 'naam_id'
+    assert combined_assets[0].notitie == 'notitie_id'
+    assert combined_assets[1] is other_asset
+
+
+def test_combine_assets_reports_conflicting_fragment(create_translations):
+    fragments = [create_fragment('id', 4), create_fragment('id', 1), create_fragment('id', 4),
+                 create_fragment('id', 4)]
+    fragments[2].notitie = 'other notitie'
+    fragments[3].notitie = 'third notitie'
+
+    with pytest.raises(ExceptionsGroup) as exception_info:
+        CombineAssetHelper.combine_assets(fragments)
+
+    exception = exception_info.value.exceptions[0]
+    assert isinstance(exception, CannotCombineAssetsError)
+    assert exception.object_id == 'id'
+    # the first conflicting fragment is reported, like when combining them one by one
+    assert exception.attribute_errors == [('notitie', ('notitie_id', 'other notitie'))]
+
+
+def test_combine_assets_reports_conflicting_types(create_translations):
+    other_type = Funderingsmassief()
+    other_type.assetId.identificator = 'id'
+
+    with pytest.raises(ExceptionsGroup) as exception_info:
+        CombineAssetHelper.combine_assets([create_fragment('id', 0), other_type])
+
+    exception = exception_info.value.exceptions[0]
+    assert isinstance(exception, CannotCombineAssetsWithDifferentTypeError)
+    assert exception.attribute_errors == [('typeURI', (Verkeersbordsteun.typeURI,
+                                                       Funderingsmassief.typeURI))]
+
+
+@pytest.mark.benchmark
+def test_benchmark_combine_assets():
+    fragment_count = 100_000
+    fragments_per_asset = 10
+    fragments_per_id = {
+        f'id_{asset_index}': [create_fragment(f'id_{asset_index}', index)
+                              for index in range(fragments_per_asset)]
+        for asset_index in range(fragment_count // fragments_per_asset)}
+
+    start = time.perf_counter()
+    pairwise_assets = [combine_pairwise(fragments) for fragments in fragments_per_id.values()]
+    pairwise_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    combined_assets = CombineAssetHelper.combine_assets(
+        [fragment for fragments in fragments_per_id.values() for fragment in fragments])
+    combine_duration = time.perf_counter() - start
+
+    print(f'\ncombining {fragment_count} fragments: pairwise {pairwise_duration:.1f}s, '
+          f'combine_assets {combine_duration:.1f}s')
+    assert len(combined_assets) == len(pairwise_assets)
+    assert create_dict_from_asset(combined_assets[-1]) == create_dict_from_asset(
+        pairwise_assets[-1])
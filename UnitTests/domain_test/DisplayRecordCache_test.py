@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pytest
+from otlmow_model.OtlmowModel.Classes.Agent import Agent
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Camera import Camera
+
+from otlmow_gui.Domain import global_vars
+from otlmow_gui.Domain.util.DisplayRecordCache import DisplayRecordCache
+from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import \
+    RelationChangeHelpers
+from otlmow_gui.GUI.translation.GlobalTranslate import GlobalTranslate
+
+LANG_DIR = Path(__file__).absolute().parent.parent.parent / 'otlmow_gui' / 'locale/'
+
+
+@pytest.fixture
+def create_translations() -> None:
+    GlobalTranslate(settings={"language": "DUTCH"}, lang_dir=str(LANG_DIR))
+
+
+def create_camera(identificator: str) -> Camera:
+    camera = Camera()
+    camera.assetId.identificator = identificator
+    return camera
+
+
+def test_record_matches_the_helpers(create_translations):
+    aim_id = 'c1ca43b9-0b6e-4b0b-b7a5-cd3d2a5fd3d0-b25kZXJkZWVsI0NhbWVyYQ'
+    camera = create_camera(aim_id)
+    external_camera = create_camera('external')
+    external_camera.assetId.toegekendDoor = global_vars.external_toegekendDoor_label
+    agent = Agent()
+    agent.agentId.identificator = 'agent'
+    agent.naam = 'Agentschap'
+
+    cache = DisplayRecordCache()
+    record = cache.get_record(camera)
+
+    assert record.identificator == aim_id
+    assert record.screen_name == RelationChangeHelpers.get_screen_name(camera)
+    assert record.abbreviated_id == RelationChangeHelpers.abbreviate_if_AIM_id(aim_id)
+    assert record.get_abbreviated_typeURI() == 'Camera'
+    assert record.get_abbreviated_typeURI(add_namespace=True) == 'onderdeel#Camera'
+    assert not record.is_external
+    assert record.icon_key == 'asset'
+
+    external_record = cache.get_record(external_camera)
+    assert external_record.screen_name == RelationChangeHelpers.get_screen_name(external_camera)
+    assert external_record.is_external
+    agent_record = cache.get_record(agent)
+    assert agent_record.screen_name == RelationChangeHelpers.get_screen_name(agent)
+    assert agent_record.is_external
+    assert agent_record.icon_key == 'agent'
+    assert cache.get_record(None) is None
+
+
+def test_record_is_made_again_after_an_edit(create_translations):
+    camera = create_camera('camera')
+    cache = DisplayRecordCache()
+    cache.build_records([camera])
+    record = cache.get_record(camera)
+
+    assert cache.get_record(camera) is record
+
+    camera.naam = 'new_name'
+    edited_record = cache.get_record(camera)
+    assert edited_record is not record
+    assert edited_record.screen_name == 'new_name'
+
+    cache.invalidate([camera])
+    assert cache.get_record(camera) is not edited_record
+
+
+def test_records_are_made_again_after_a_language_change(create_translations):
+    agent = Agent()
+    agent.agentId.identificator = 'agent'
+    cache = DisplayRecordCache()
+    record = cache.get_record(agent)
+
+    GlobalTranslate(settings={"language": "ENGLISH"}, lang_dir=str(LANG_DIR))
+    english_record = cache.get_record(agent)
+    english_screen_name = RelationChangeHelpers.get_screen_name(agent)
+    GlobalTranslate(settings={"language": "DUTCH"}, lang_dir=str(LANG_DIR))
+
+    assert english_record is not record
+    assert english_record.screen_name == english_screen_name
+
+
+def test_build_records_keeps_only_the_given_objects(create_translations):
+    kept_camera = create_camera('kept')
+    removed_camera = create_camera('removed')
+    cache = DisplayRecordCache()
+    cache.build_records([kept_camera, removed_camera])
+    kept_record = cache.get_record(kept_camera)
+
+    cache.build_records([kept_camera])
+
+    assert cache.get_record(kept_camera) is kept_record
+    assert list(cache.records) == [id(kept_camera)]
+
@@ -0,0 +1,74 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from otlmow_converter.Exceptions.ExceptionsGroup import ExceptionsGroup
+from otlmow_converter.Exceptions.NoTypeUriInExcelTabError import NoTypeUriInExcelTabError
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import create_dict_from_asset
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.step_domain.InsertDataDomain import InsertDataDomain
+from otlmow_gui.Domain.util.DocumentCheckPool import DocumentCheckPool, reduce_exception, \
+    rebuild_exception
+
+OTLLogger.logger = Mock()
+
+demo_project_dir = (Path(__file__).parent.parent.parent / 'otlmow_gui' / 'demo_projects' /
+                    'simpel_vergelijkings_project')
+
+
+async def collect_results(doc_locations: list[Path], worker_count: int) -> dict:
+    return {
+        doc_location: (objects, exception_group)
+        async for doc_location, objects, exception_group in DocumentCheckPool.check_documents(
+            doc_locations=doc_locations, check_document=InsertDataDomain.check_document,
+            worker_count=worker_count)}
+
+
+def test_reduce_and_rebuild_exception_group():
+    exception_group = ExceptionsGroup(message='Failed to create objects from Excel file')
+    exception_group.add_exception(NoTypeUriInExcelTabError(
+        message='no typeURI', file_path=Path('file.xlsx'), tab='tab'))
+    exception_group.objects = [lambda: None]
+
+    rebuilt_exception_group = rebuild_exception(reduce_exception(exception_group))
+
+    assert isinstance(rebuilt_exception_group, ExceptionsGroup)
+    assert str(rebuilt_exception_group) == str(exception_group)
+    assert rebuilt_exception_group.objects is None
+    rebuilt_exception = rebuilt_exception_group.exceptions[0]
+    assert isinstance(rebuilt_exception, NoTypeUriInExcelTabError)
+    assert rebuilt_exception.tab == 'tab'
+    assert rebuilt_exception.file_path == Path('file.xlsx')
+
+
+@pytest.mark.asyncio
+async def test_check_documents_yields_raised_exceptions():
+    async def check_document(doc_location: Path):
+        if doc_location.name == 'invalid.xlsx':
+            raise ValueError('invalid')
+        return [], ExceptionsGroup(message='valid')
+
+    results = [result async for result in DocumentCheckPool.check_documents(
+        doc_locations=[Path('valid.xlsx'), Path('invalid.xlsx')], check_document=check_document,
+        worker_count=1)]
+
+    assert [result[0] for result in results] == [Path('valid.xlsx'), Path('invalid.xlsx')]
+    assert isinstance(results[0][2], ExceptionsGroup)
+    assert isinstance(results[1][2], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_check_documents_in_worker_processes_equals_in_process():
+    doc_locations = [demo_project_dir / 'simpel_vergelijking_template2.xlsx',
+                     demo_project_dir / 'simpel_vergelijking_template3.xlsx']
+
+    in_process_results = await collect_results(doc_locations=doc_locations, worker_count=1)
+    worker_results = await collect_results(doc_locations=doc_locations, worker_count=2)
+
+    assert worker_results.keys() == in_process_results.keys()
+    for doc_location, (objects, exception_group) in in_process_results.items():
+        worker_objects, worker_exception_group = worker_results[doc_location]
+        assert ([create_dict_from_asset(o) for o in worker_objects] ==
+                [create_dict_from_asset(o) for o in objects])
+        assert str(worker_exception_group) == str(exception_group)
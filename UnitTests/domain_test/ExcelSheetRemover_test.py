@@ -0,0 +1,77 @@
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+import pytest
+from openpyxl.reader.excel import load_workbook
+
+from otlmow_gui.Domain.util.ExcelSheetRemover import ExcelSheetRemover
+
+root_dir = Path(__file__).parent.parent.parent
+template_path = (root_dir / 'otlmow_gui' / 'demo_projects' / 'simpel_vergelijkings_project' /
+                 'simpel_vergelijking_template2.xlsx')
+dropdown_sheet_names = ['Keuzelijsten', 'dropdownvalues']
+
+
+def remove_sheets_with_openpyxl(source_path: Path, target_path: Path) -> None:
+    wb = load_workbook(source_path)
+    for sheet_name in dropdown_sheet_names:
+        if sheet_name in wb.sheetnames:
+            wb.remove(wb[sheet_name])
+    wb.save(target_path)
+
+
+def get_non_empty_rows(wb, sheet_name: str) -> list[list]:
+    rows = [[cell.value for cell in row] for row in wb[sheet_name].iter_rows()]
+    return [row for row in rows if any(value is not None for value in row)]
+
+
+def test_remove_sheets_equals_openpyxl(tmp_path: Path):
+    remove_sheets_with_openpyxl(template_path, tmp_path / 'openpyxl.xlsx')
+    assert ExcelSheetRemover.remove_sheets(source_path=template_path,
+                                           target_path=tmp_path / 'removed.xlsx',
+                                           sheet_names=dropdown_sheet_names)
+
+    with zipfile.ZipFile(tmp_path / 'removed.xlsx') as removed_zip:
+        for name in [ExcelSheetRemover.workbook_path, ExcelSheetRemover.workbook_rels_path,
+                     ExcelSheetRemover.content_types_path]:
+            ET.fromstring(removed_zip.read(name))
+        # Keuzelijsten is the last sheet
+        assert 'xl/worksheets/sheet8.xml' not in removed_zip.namelist()
+
+    expected_wb = load_workbook(tmp_path / 'openpyxl.xlsx')
+    removed_wb = load_workbook(tmp_path / 'removed.xlsx')
+    assert 'Keuzelijsten' not in removed_wb.sheetnames
+    assert removed_wb.sheetnames == expected_wb.sheetnames
+    for sheet_name in expected_wb.sheetnames:
+        assert get_non_empty_rows(removed_wb, sheet_name) == get_non_empty_rows(expected_wb,
+                                                                                sheet_name)
+
+
+def test_remove_sheets_without_dropdown_sheets(tmp_path: Path):
+    source_path = root_dir / 'UnitTests' / 'test_files' / 'input' / 'original_slagbomen_DAVIE_export.xlsx'
+
+    assert not ExcelSheetRemover.remove_sheets(source_path=source_path,
+                                               target_path=tmp_path / 'removed.xlsx',
+                                               sheet_names=dropdown_sheet_names)
+    assert not (tmp_path / 'removed.xlsx').exists()
+
+
+@pytest.mark.benchmark
+def test_benchmark_remove_sheets(tmp_path: Path):
+    excel_paths = sorted((root_dir / 'UnitTests' / 'test_files').rglob('*.xlsx')) + [template_path]
+
+    start = time.perf_counter()
+    for excel_path in excel_paths:
+        remove_sheets_with_openpyxl(excel_path, tmp_path / 'openpyxl.xlsx')
+    openpyxl_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for excel_path in excel_paths:
+        ExcelSheetRemover.remove_sheets(source_path=excel_path, target_path=tmp_path / 'removed.xlsx',
+                                        sheet_names=dropdown_sheet_names)
+    remove_sheets_duration = time.perf_counter() - start
+
+    print(f'\nremoving the dropdown sheets of {len(excel_paths)} files: '
+          f'openpyxl {openpyxl_duration:.3f}s, ExcelSheetRemover {remove_sheets_duration:.3f}s')
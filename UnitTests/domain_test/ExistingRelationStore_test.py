@@ -0,0 +1,42 @@
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Bevestiging import Bevestiging
+from otlmow_model.OtlmowModel.Classes.Onderdeel.HoortBij import HoortBij
+
+from otlmow_gui.Domain.util.ExistingRelationStore import ExistingRelationStore
+
+
+def create_relation(relation_type, source_id: str, target_id: str):
+    relation = relation_type()
+    relation.bronAssetId.identificator = source_id
+    relation.doelAssetId.identificator = target_id
+    relation.assetId.identificator = f"{source_id}_{target_id}"
+    return relation
+
+
+def test_contains_relation():
+    bevestiging = create_relation(Bevestiging, "a", "b")
+    hoortbij = create_relation(HoortBij, "a", "c")
+    store = ExistingRelationStore([bevestiging, hoortbij])
+
+    assert store.contains_relation(Bevestiging.typeURI, "a", "b")
+    assert not store.contains_relation(Bevestiging.typeURI, "b", "a")
+    assert store.contains_relation(Bevestiging.typeURI, "b", "a", undirected=True)
+    assert not store.contains_relation(HoortBij.typeURI, "c", "a")
+    assert not store.contains_relation(HoortBij.typeURI, "a", "b", undirected=True)
+    assert store.get_relations(HoortBij.typeURI, "a", "c") == [hoortbij]
+
+
+def test_pop_keeps_order_and_index():
+    first = create_relation(Bevestiging, "a", "b")
+    duplicate = create_relation(Bevestiging, "a", "b")
+    last = create_relation(HoortBij, "a", "c")
+    store = ExistingRelationStore([first, duplicate, last])
+
+    assert store.pop(0) is first
+    assert len(store) == 2
+    assert store[0] is duplicate
+    assert store.contains_relation(Bevestiging.typeURI, "a", "b")
+
+    assert store.pop(0) is duplicate
+    assert not store.contains_relation(Bevestiging.typeURI, "a", "b")
+    assert list(store) == [last]
+    assert store + [first] == [last, first]
@@ -1,3 +1,8 @@
+from unittest.mock import patch
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import dynamic_create_type_from_uri
+from otlmow_model.OtlmowModel.Helpers import RelationValidator
+
 from otlmow_gui.Domain.util.Helpers import Helpers
 from UnitTests.general_fixtures.DomainFixtures import mock_get_hardcoded_class_dict
 
@@ -12,3 +17,20 @@ def test_create_external_typeURI_options(mock_get_hardcoded_class_dict):
         'lgcA (Legacy)': 'https://lgc.wegenenverkeer.data.vlaanderen.be/ns/installatie#lgcA',
         'lgcB (Legacy)': 'https://lgc.wegenenverkeer.data.vlaanderen.be/ns/installatie#lgcB'
     }
+    assert Helpers.all_OTL_asset_typeURIs == set(Helpers.all_OTL_asset_types_dict.values())
+
+
+def test_is_valid_relation_caches_result():
+    Helpers.valid_relation_cache = {}
+    bevestiging = dynamic_create_type_from_uri(
+        'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Bevestiging')
+    source_typeURI = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Funderingsmassief'
+    target_typeURI = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Verkeersbordsteun'
+
+    with patch.object(RelationValidator, 'is_valid_relation',
+                      wraps=RelationValidator.is_valid_relation) as is_valid_relation:
+        assert Helpers.is_valid_relation(bevestiging, source_typeURI, target_typeURI)
+        assert Helpers.is_valid_relation(bevestiging, source_typeURI, target_typeURI)
+        assert not Helpers.is_valid_relation(bevestiging, source_typeURI, 'not a typeURI')
+
+    assert is_valid_relation.call_count == 2
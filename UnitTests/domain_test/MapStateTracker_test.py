@@ -0,0 +1,35 @@
+from unittest.mock import Mock
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.util.MapStateTracker import MapStateTracker
+
+OTLLogger.logger = Mock()
+
+
+def test_get_changes():
+    tracker = MapStateTracker()
+    project = object()
+    tracker.set_rendered(project=project, asset_states={'unchanged': ('POINT (1 1)', 'a', 'type'),
+                                                        'changed': ('POINT (2 2)', 'b', 'type'),
+                                                        'removed': ('POINT (3 3)', 'c', 'type')})
+
+    changed_ids, removed_ids = tracker.get_changes({'unchanged': ('POINT (1 1)', 'a', 'type'),
+                                                    'changed': ('POINT (2 2)', 'b2', 'type'),
+                                                    'added': ('POINT (4 4)', 'd', 'type')})
+
+    assert changed_ids == ['changed', 'added']
+    assert removed_ids == ['removed']
+
+
+def test_is_rendered_for():
+    tracker = MapStateTracker()
+    project = object()
+    assert not tracker.is_rendered_for(project)
+
+    tracker.set_rendered(project=project, asset_states={})
+    assert tracker.is_rendered_for(project)
+    assert not tracker.is_rendered_for(object())
+
+    tracker.reset_full_state()
+    assert not tracker.is_rendered_for(project)
+    assert tracker.get_changes({'added': ('POINT (4 4)', 'd', 'type')}) == (['added'], [])
@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
+from otlmow_gui.Domain.database.ModelDataCache import ModelDataCache
+from otlmow_gui.Domain.util.Helpers import Helpers
+
+
+@pytest.fixture
+def mock_model_dir(tmp_path: Path):
+    original_get_otl_wizard_model_dir = ProgramFileStructure.get_otl_wizard_model_dir
+    original_model_version = Helpers.otlmow_model_version
+    ProgramFileStructure.get_otl_wizard_model_dir = Mock(return_value=tmp_path)
+    Helpers.otlmow_model_version = "1.0"
+    ModelDataCache.data_in_memory = {}
+
+    yield tmp_path
+
+    ProgramFileStructure.get_otl_wizard_model_dir = original_get_otl_wizard_model_dir
+    Helpers.otlmow_model_version = original_model_version
+    ModelDataCache.data_in_memory = {}
+
+
+def test_get_creates_data_once_per_model_version(mock_model_dir: Path):
+    create_data = Mock(return_value=["a", "b"])
+
+    assert ModelDataCache.get(name="test_data", create_data=create_data) == ["a", "b"]
+    assert ModelDataCache.get(name="test_data", create_data=create_data) == ["a", "b"]
+    create_data.assert_called_once()
+    assert (mock_model_dir / "test_data.json").exists()
+
+    # a new run of the application reads the data from the file
+    ModelDataCache.data_in_memory = {}
+    assert ModelDataCache.get(name="test_data", create_data=create_data) == ["a", "b"]
+    create_data.assert_called_once()
+
+    Helpers.otlmow_model_version = "2.0"
+    create_data.return_value = ["c"]
+    assert ModelDataCache.get(name="test_data", create_data=create_data) == ["c"]
+    assert create_data.call_count == 2
+
+
+def test_get_creates_data_again_for_another_format_version(mock_model_dir: Path):
+    # a cache file of a release that didn't store the format version yet
+    (mock_model_dir / "test_data.json").write_text(json.dumps({"model_version": "1.0",
+                                                               "data": ["old"]}))
+    create_data = Mock(return_value=["a", "b"])
+
+    assert ModelDataCache.get(name="test_data", create_data=create_data) == ["a", "b"]
+    create_data.assert_called_once()
+
+    ModelDataCache.data_in_memory = {}
+    create_data.return_value = [["a"], ["b"]]
+    assert ModelDataCache.get(name="test_data", create_data=create_data,
+                              format_version=2) == [["a"], ["b"]]
+    assert create_data.call_count == 2
+
+    ModelDataCache.data_in_memory = {}
+    assert ModelDataCache.get(name="test_data", create_data=create_data,
+                              format_version=2) == [["a"], ["b"]]
+    assert create_data.call_count == 2
@@ -0,0 +1,83 @@
+import gzip
+import os
+import pickle
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from otlmow_converter.Exceptions.ExceptionsGroup import ExceptionsGroup
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import create_dict_from_asset
+
+from otlmow_gui.Domain.database.ParsedDocumentCache import ParsedDocumentCache
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.step_domain.InsertDataDomain import InsertDataDomain
+from otlmow_gui.Domain.util.Helpers import Helpers
+
+OTLLogger.logger = Mock()
+
+template_path = (Path(__file__).parent.parent.parent / 'otlmow_gui' / 'demo_projects' /
+                 'simpel_vergelijkings_project' / 'simpel_vergelijking_template2.xlsx')
+
+
+@pytest.mark.asyncio
+async def test_check_document_uses_cache(tmp_path: Path):
+    objects, exception_group = await InsertDataDomain.check_document(template_path)
+    check_document = AsyncMock(return_value=(objects, exception_group))
+
+    first_result = await ParsedDocumentCache.check_document(
+        cache_folder=tmp_path, doc_location=template_path, check_document=check_document)
+    cached_objects, cached_exception_group = await ParsedDocumentCache.check_document(
+        cache_folder=tmp_path, doc_location=template_path, check_document=check_document)
+
+    check_document.assert_awaited_once()
+    assert first_result == (objects, exception_group)
+    assert ([create_dict_from_asset(o) for o in cached_objects] ==
+            [create_dict_from_asset(o) for o in objects])
+    assert str(cached_exception_group) == str(exception_group)
+
+
+def test_key_depends_on_content_and_versions(tmp_path: Path):
+    doc_path = tmp_path / 'document.csv'
+    doc_path.write_text('typeURI;assetId.identificator\n')
+    key = ParsedDocumentCache.create_key(doc_location=doc_path)
+
+    assert ParsedDocumentCache.create_key(doc_location=doc_path) == key
+    assert ParsedDocumentCache.create_key(doc_location=doc_path, delimiter=',') != key
+
+    original_model_version = Helpers.otlmow_model_version
+    Helpers.otlmow_model_version = 'other version'
+    try:
+        assert ParsedDocumentCache.create_key(doc_location=doc_path) != key
+    finally:
+        Helpers.otlmow_model_version = original_model_version
+
+    doc_path.write_text('typeURI;assetId.identificator\n;\n')
+    assert ParsedDocumentCache.create_key(doc_location=doc_path) != key
+
+
+def test_load_refuses_other_classes(tmp_path: Path):
+    key = 'key'
+    cache_path = ParsedDocumentCache.get_cache_path(cache_folder=tmp_path, key=key)
+    cache_path.parent.mkdir(parents=True)
+    with gzip.open(cache_path, mode='wb') as cache_file:
+        pickle.dump((key, ([], (Mock, (), {}))), cache_file)
+
+    assert ParsedDocumentCache.load(cache_folder=tmp_path, key=key) is None
+
+
+def test_save_keeps_most_recently_used_documents(tmp_path: Path):
+    original_max_cached_documents = ParsedDocumentCache.max_cached_documents
+    ParsedDocumentCache.max_cached_documents = 2
+    try:
+        for index, key in enumerate(['a', 'b', 'c']):
+            ParsedDocumentCache.save(cache_folder=tmp_path, key=key, objects=[],
+                                     exception_group=ExceptionsGroup(message=key))
+            cache_path = ParsedDocumentCache.get_cache_path(cache_folder=tmp_path, key=key)
+            os.utime(cache_path, (1000 + index, 1000 + index))
+        cached_keys = sorted(path.name.split('.')[0] for path in
+                             (tmp_path / ParsedDocumentCache.cache_foldername).iterdir())
+        assert cached_keys == ['b', 'c']
+        assert str(ParsedDocumentCache.load(cache_folder=tmp_path, key='c')[1]) == str(
+            ExceptionsGroup(message='c'))
+    finally:
+        ParsedDocumentCache.max_cached_documents = original_max_cached_documents
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+
+from otlmow_gui.Domain.database.PossibleRelationMatrix import PossibleRelationMatrix
+
+subset_path = (Path(__file__).parent.parent.parent / 'otlmow_gui' / 'demo_projects' /
+               'simpel_vergelijkings_project' / 'simpele_vergelijkings_subset2.db')
+
+
+def test_matrix_equals_find_all_concrete_relations():
+    collector = OSLOCollector(subset_path)
+    collector.collect_all()
+    matrix = PossibleRelationMatrix.create_from_collector(key="key", collector=collector)
+
+    concrete_classes = [oslo_class for oslo_class in collector.classes if oslo_class.abstract == 0]
+    assert concrete_classes
+    for oslo_class in concrete_classes:
+        assert matrix.contains_class(oslo_class.objectUri)
+        assert matrix.get_relations_for(oslo_class.objectUri) == collector.find_all_concrete_relations(
+            objectUri=oslo_class.objectUri, allow_duplicates=False)
+
+
+def test_save_and_load(tmp_path: Path):
+    collector = OSLOCollector(subset_path)
+    collector.collect_all()
+    key = PossibleRelationMatrix.create_key(subset_path=subset_path, model_version="1.0")
+    matrix = PossibleRelationMatrix.create_from_collector(key=key, collector=collector)
+    cache_path = tmp_path / PossibleRelationMatrix.cache_filename
+    matrix.save(cache_path=cache_path)
+
+    loaded_matrix = PossibleRelationMatrix.load(cache_path=cache_path, key=key)
+    assert loaded_matrix.relations == matrix.relations
+    for typeURI in matrix.matrix:
+        assert loaded_matrix.get_relations_for(typeURI) == matrix.get_relations_for(typeURI)
+
+    other_version_key = PossibleRelationMatrix.create_key(subset_path=subset_path,
+                                                          model_version="2.0")
+    assert PossibleRelationMatrix.load(cache_path=cache_path, key=other_version_key) is None
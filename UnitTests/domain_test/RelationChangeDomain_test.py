@@ -123,7 +123,7 @@ async def test_full_set_possible_relations(root_directory:Path,
             funderingsmassief2: AIMObject  = object
 
     # define the relations in the test subset
-    all_relations:list[OSLORelatie] = RelationChangeDomain.collector.relations
+    all_relations:list[OSLORelatie] = RelationChangeDomain.possible_relation_matrix.relations
     for relation in all_relations:
         if relation.usagenote == "fund_bevestiging_vsteun":
             fund_bevestiging_vsteun: OSLORelatie = relation
@@ -555,6 +555,9 @@ async def test_set_objects_single_item_list(mock_screen: RelationChangeScreen,mo
 
     assert len(RelationChangeDomain.shown_objects) == 1
     assert RelationChangeDomain.shown_objects[0].assetId.identificator == "dummy_identificator"
+    # the shown objects are not copied
+    assert RelationChangeDomain.shown_objects[0] is test_object
+    assert RelationChangeDomain.shown_objects is not RelationChangeDomain.internal_objects
 
 @pytest.mark.asyncio
 async def test_set_objects_double_item_list(mock_screen,mock_collect_all,mock_rel_screen,mock_save_validated_assets_function,
@@ -580,6 +583,40 @@ async def test_set_objects_double_item_list(mock_screen,mock_collect_all,mock_re
 
     global_vars.current_project = None
 
+@pytest.mark.asyncio
+async def test_get_object_uses_index_and_reports_duplicates(mock_screen,mock_collect_all,mock_rel_screen,
+                                                            mock_save_validated_assets_function,
+                                                            mock_load_validated_assets,mock_step3_visuals):
+    test_project = Project(eigen_referentie="test")
+    global_vars.current_project = test_project
+    RelationChangeDomain.init_static(test_project, asynchronous=False)
+    test_object = AllCasesTestClass()
+    test_object.assetId.identificator = "dummy_identificator"
+
+    duplicate_object = AllCasesTestClass()
+    duplicate_object.assetId.identificator = "duplicate_identificator"
+    duplicate_object2 = AnotherTestClass()
+    duplicate_object2.assetId.identificator = "duplicate_identificator"
+
+    await RelationChangeDomain.set_instances([test_object, duplicate_object, duplicate_object2])
+
+    assert RelationChangeDomain.get_object("dummy_identificator") is RelationChangeDomain.shown_objects[0]
+    assert RelationChangeDomain.get_object("unknown_identificator") is None
+    assert RelationChangeDomain.get_object("duplicate_identificator") is None
+    assert RelationChangeDomain.duplicate_identificators == {"duplicate_identificator"}
+
+    new_object = AnotherTestClass()
+    new_object.assetId.identificator = "new_identificator"
+    RelationChangeDomain.shown_objects.append(new_object)
+    RelationChangeDomain.add_to_shown_objects_index(new_object)
+    assert RelationChangeDomain.get_object("new_identificator") is new_object
+
+    RelationChangeDomain.clear_data()
+    assert RelationChangeDomain.get_object("dummy_identificator") is None
+    assert not RelationChangeDomain.duplicate_identificators
+
+    global_vars.current_project = None
+
 #################################################
 # RelationChangeDomain.set_possible_relations   #
 #################################################
@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+from otlmow_model.OtlmowModel.Classes.Onderdeel.Bevestiging import Bevestiging
+from otlmow_model.OtlmowModel.Classes.Onderdeel.HeeftBetrokkene import HeeftBetrokkene
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.util.VisualisationStateTracker import VisualisationStateTracker
+
+OTLLogger.logger = Mock()
+
+
+def create_relation(relation_type, source_id: str, target_id: str):
+    relation = relation_type()
+    relation.bronAssetId.identificator = source_id
+    relation.doelAssetId.identificator = target_id
+    relation.assetId.identificator = f"{source_id}_{target_id}"
+    return relation
+
+
+def test_insert_and_remove_cancel_each_other():
+    tracker = VisualisationStateTracker()
+    relation = create_relation(Bevestiging, "a", "b")
+
+    tracker.insert_relation(relation)
+    assert tracker.get_to_be_inserted_relations() == [relation]
+    assert not tracker.is_uptodate()
+
+    # the same relation, e.g. made again in the possible relations, cancels the insertion
+    tracker.remove_relation(create_relation(Bevestiging, "a", "b"))
+    assert tracker.get_to_be_inserted_relations() == []
+    assert tracker.get_to_be_removed_relations() == []
+    assert tracker.is_uptodate()
+
+    tracker.remove_relation(relation)
+    assert tracker.get_to_be_removed_relations() == [relation]
+    tracker.insert_relation(relation)
+    assert tracker.is_uptodate()
+
+
+def test_relations_are_matched_on_key():
+    tracker = VisualisationStateTracker()
+    first = create_relation(Bevestiging, "a", "b")
+    other = create_relation(Bevestiging, "a", "c")
+    betrokkene = create_relation(HeeftBetrokkene, "a", "agent")
+    betrokkene.rol = 'eigenaar'
+
+    tracker.insert_relations([first, other, betrokkene])
+
+    other_rol = create_relation(HeeftBetrokkene, "a", "agent")
+    other_rol.rol = 'toezichter'
+    # the active state isn't part of the key
+    other.isActief = False
+    tracker.remove_relations([other_rol, other])
+
+    assert tracker.get_to_be_inserted_relations() == [first, betrokkene]
+    assert tracker.get_to_be_removed_relations() == [other_rol]
+
+
+def test_remove_relations_cancels_every_insertion():
+    # the previous implementation popped ascending indices, so it removed the wrong insertions
+    tracker = VisualisationStateTracker()
+    relations = [create_relation(Bevestiging, "a", f"b{index}") for index in range(4)]
+    tracker.insert_relations(relations)
+
+    tracker.remove_relations([relations[0], relations[2]])
+
+    assert tracker.get_to_be_inserted_relations() == [relations[1], relations[3]]
+    assert tracker.get_to_be_removed_relations() == []
+
+
+def test_reset_full_state():
+    tracker = VisualisationStateTracker()
+    tracker.insert_relation(create_relation(Bevestiging, "a", "b"))
+    tracker.remove_relation(create_relation(Bevestiging, "a", "c"))
+    tracker.set_clear_all(True)
+
+    tracker.reset_full_state()
+
+    assert tracker.is_uptodate()
+    assert not tracker.get_clear_all()
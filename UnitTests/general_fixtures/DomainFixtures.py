@@ -9,6 +9,8 @@ from _pytest.fixtures import fixture
 
 from otlmow_gui.Domain import global_vars
 from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
+from otlmow_gui.Domain.database.ClassCatalogue import ClassCatalogue
+from otlmow_gui.Domain.database.ModelDataCache import ModelDataCache
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.Domain.project.Project import Project
 from otlmow_gui.Domain.step_domain.InsertDataDomain import InsertDataDomain
@@ -269,8 +271,13 @@ def get_and_cleanup_empty_project(mock_otl_wizard_dir,request):
             shutil.rmtree(project_path2)
 
 @fixture
-def mock_get_hardcoded_class_dict() -> None:
+def mock_get_hardcoded_class_dict(tmp_path) -> None:
     original_get_hardcoded_class_dict = Helpers.get_hardcoded_class_dict
+    # the class catalogue made from the mocked classes is kept out of the real model folder
+    original_get_otl_wizard_model_dir = ProgramFileStructure.get_otl_wizard_model_dir
+    ProgramFileStructure.get_otl_wizard_model_dir = Mock(return_value=tmp_path)
+    ModelDataCache.data_in_memory = {}
+    ClassCatalogue.clear()
 
     Helpers.get_hardcoded_class_dict = Mock(return_value={
             "https://wegenenverkeer.data.vlaanderen.be/ns/installatie#OTLB": {
@@ -310,4 +317,9 @@ def mock_get_hardcoded_class_dict() -> None:
             }
         })
     yield
-    Helpers.get_hardcoded_class_dict = original_get_hardcoded_class_dict
\ No newline at end of file
+    Helpers.get_hardcoded_class_dict = original_get_hardcoded_class_dict
+    ProgramFileStructure.get_otl_wizard_model_dir = original_get_otl_wizard_model_dir
+    ModelDataCache.data_in_memory = {}
+    ClassCatalogue.clear()
+    Helpers.all_OTL_asset_types_dict = {}
+    Helpers.all_OTL_asset_typeURIs = set()
\ No newline at end of file
@@ -13,7 +13,8 @@ import pytest_asyncio
 from otlmow_model.OtlmowModel.BaseClasses.RelationInteractor import RelationInteractor
 from otlmow_model.OtlmowModel.Classes.ImplementatieElement.RelatieObject import RelatieObject
 
-from otlmow_gui.Domain.enums import FileState
+from otlmow_gui.Domain.enums import FileState, QuickSaveChange
+from otlmow_gui.Domain.project.QuickSaveJournal import QuickSaveJournal
 from otlmow_gui.Domain.project.ProjectFile import ProjectFile
 from otlmow_gui.Domain.step_domain.HomeDomain import HomeDomain
 
@@ -1069,6 +1070,55 @@ async def test_save_validated_assets(setup_preloaded_assets_in_memory: Project):
 
     assert new_loaded_assets == expected_assets
 
+@pytest.mark.asyncio
+async def test_save_validated_assets_appends_changes_to_journal(setup_preloaded_assets_in_memory: Project):
+    project = setup_preloaded_assets_in_memory
+    await project.save_validated_assets(asynchronous=False)
+    full_quick_save = project.last_quick_save
+    full_quick_save_content = full_quick_save.read_text()
+
+    changed_asset = project.assets_in_memory[0]
+    changed_asset.notitie = "changed in journal"
+    project.record_quick_save_change(change=QuickSaveChange.MODIFY, otl_object=changed_asset)
+    removed_relation = project.assets_in_memory.pop(1)
+    project.record_quick_save_change(change=QuickSaveChange.REMOVE, otl_object=removed_relation)
+    expected_assets = deepcopy(project.assets_in_memory)
+
+    await project.save_validated_assets(asynchronous=False)
+
+    # no new quick save is made, only the journal is written
+    assert project.last_quick_save == full_quick_save
+    assert full_quick_save.read_text() == full_quick_save_content
+    assert QuickSaveJournal.get_journal_path(full_quick_save).exists()
+    assert project.quick_save_journal.entry_count == 2
+
+    new_loaded_assets = await project.load_validated_assets_async()
+
+    assert new_loaded_assets == expected_assets
+
+
+@pytest.mark.asyncio
+async def test_save_validated_assets_compacts_journal(setup_preloaded_assets_in_memory: Project):
+    project = setup_preloaded_assets_in_memory
+    await project.save_validated_assets(asynchronous=False)
+    first_quick_save = project.last_quick_save
+
+    original_max_entries = Project.max_quicksave_journal_entries
+    Project.max_quicksave_journal_entries = 1
+    try:
+        for asset in project.assets_in_memory:
+            project.record_quick_save_change(change=QuickSaveChange.MODIFY, otl_object=asset)
+        # make sure the new quick save gets another name
+        await sleep(1)
+        await project.save_validated_assets(asynchronous=False)
+    finally:
+        Project.max_quicksave_journal_entries = original_max_entries
+
+    assert project.last_quick_save != first_quick_save
+    assert not QuickSaveJournal.get_journal_path(project.last_quick_save).exists()
+    assert project.quick_save_journal.entry_count == 0
+
+
 def list_files_scandir(path='.'):
     with os.scandir(path) as entries:
         for entry in entries:
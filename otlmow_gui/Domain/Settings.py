@@ -2,6 +2,7 @@ import datetime
 import gettext
 import json
 import logging
+import os
 import platform
 from pathlib import Path
 
@@ -12,6 +13,9 @@ from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
 
 class Settings:
     settings_filename = 'settings.json'
+    # maximum number of processes used to validate documents, can be changed with
+    # "validation_worker_count" in the settings file
+    max_default_validation_worker_count = 4
 
     @classmethod
     def return_language(cls, locale_dir: Path, language: Language = Language.DUTCH):
@@ -166,4 +170,23 @@ class Settings:
             with open(settings_filepath, 'r') as json_file:
                 return json.load(json_file)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {}
\ No newline at end of file
+            return {}
+
+    @classmethod
+    def get_validation_worker_count(cls) -> int:
+        """
+        Retrieves the number of worker processes used to validate the documents of a project.
+
+        The number can be set with "validation_worker_count" in the settings file, 1 validates
+        the documents one by one in the application itself. By default the number of CPU cores is
+        used, with a maximum of max_default_validation_worker_count.
+
+        :return: The number of worker processes to validate documents with.
+        :rtype: int
+        """
+
+        settings_filepath = ProgramFileStructure.get_otl_wizard_work_dir() / cls.settings_filename
+        worker_count = cls.load_settings(settings_filepath).get('validation_worker_count')
+        if isinstance(worker_count, int) and worker_count > 0:
+            return worker_count
+        return min(cls.max_default_validation_worker_count, os.cpu_count() or 1)
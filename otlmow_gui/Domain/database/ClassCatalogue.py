@@ -0,0 +1,88 @@
+from typing import NamedTuple, Optional
+
+from otlmow_model.OtlmowModel.Helpers.GenericHelper import get_ns_and_name_from_uri
+from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_relation_dict
+
+from otlmow_gui.Domain.database.ModelDataCache import ModelDataCache
+from otlmow_gui.Domain.util.Helpers import Helpers
+
+
+class ClassCatalogueEntry(NamedTuple):
+    typeURI: str
+    abstract: bool
+    is_relation: bool
+    name: str
+    label: str
+    namespace: Optional[str]
+
+
+class ClassCatalogue:
+    """
+    Catalogue of all classes of the otlmow-model library, made from the generated class list of
+    the model so no class module has to be imported to know which classes exist. The catalogue is
+    stored in the ModelDataCache, so it is only made once per otlmow-model version.
+    """
+
+    cache_name = "class_catalogue"
+    # to be raised when the fields of ClassCatalogueEntry change
+    cache_format_version = 2
+    entries: dict[str, ClassCatalogueEntry] = {}
+    entries_model_version: Optional[str] = None
+
+    @classmethod
+    def create_catalogue(cls) -> list[list]:
+        """
+        Creates the catalogue from the class list of the model, every entry is a list of the
+        fields of ClassCatalogueEntry so it can be stored as json.
+
+        :return: the entries of the catalogue, sorted on typeURI
+        :rtype: list[list]
+        """
+
+        relation_dict = get_hardcoded_relation_dict()
+        catalogue = []
+        for typeURI, info in sorted(Helpers.get_hardcoded_class_dict().items()):
+            namespace, name = get_ns_and_name_from_uri(typeURI)
+            catalogue.append([typeURI, info['abstract'], typeURI in relation_dict, info['name'],
+                              info['label'], namespace])
+        return catalogue
+
+    @classmethod
+    def get_entries(cls) -> dict[str, ClassCatalogueEntry]:
+        """
+        Returns the entries of the catalogue of the otlmow-model version in use, keyed on typeURI.
+
+        :return: the catalogue entries per typeURI
+        :rtype: dict[str, ClassCatalogueEntry]
+        """
+
+        model_version = Helpers.get_otlmow_model_version()
+        if cls.entries_model_version != model_version:
+            catalogue = ModelDataCache.get(name=cls.cache_name, create_data=cls.create_catalogue,
+                                           format_version=cls.cache_format_version)
+            cls.entries = {entry[0]: ClassCatalogueEntry(*entry) for entry in catalogue}
+            cls.entries_model_version = model_version
+        return cls.entries
+
+    @classmethod
+    def get_entry(cls, typeURI: str) -> Optional[ClassCatalogueEntry]:
+        return cls.get_entries().get(typeURI)
+
+    @classmethod
+    def get_non_abstract_entries(cls, otl_assets_only: bool = False) -> list[ClassCatalogueEntry]:
+        """
+        Returns the entries of the classes that can be instantiated.
+
+        :param otl_assets_only: leave out the relation classes
+        :type otl_assets_only: bool
+        :return: the entries of the non-abstract classes, sorted on typeURI
+        :rtype: list[ClassCatalogueEntry]
+        """
+
+        return [entry for entry in cls.get_entries().values()
+                if not entry.abstract and not (otl_assets_only and entry.is_relation)]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.entries = {}
+        cls.entries_model_version = None
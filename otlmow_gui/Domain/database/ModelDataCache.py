@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.util.Helpers import Helpers
+
+
+class ModelDataCache:
+    """
+    Cache for data that is derived from the otlmow-model library and only changes when the model
+    is updated. The data is kept in memory and stored next to the model of the OTL wizard, so it
+    is only computed once per otlmow-model version:
+
+    │   OTLWizardProjects                       : folder
+    │   └───Model                               : folder
+    │           <name>.json                     : json-file
+
+    The data has to be json serializable. The format version of the data is stored with it, so
+    data in an older format is created again after the format changed.
+    """
+
+    data_in_memory: dict[str, Any] = {}
+
+    @classmethod
+    def get_cache_path(cls, name: str) -> Path:
+        return ProgramFileStructure.get_otl_wizard_model_dir() / f"{name}.json"
+
+    @classmethod
+    def get(cls, name: str, create_data: Callable[[], Any], format_version: int = 1) -> Any:
+        """
+        Returns the data with the given name for the current otlmow-model version. The data is
+        created with create_data if it is not in memory or in the cache file for this version.
+
+        :param name: the name of the cached data, also used as filename
+        :type name: str
+        :param create_data: function that creates the data from the model
+        :type create_data: Callable[[], Any]
+        :param format_version: version of the format of the data, to be raised when create_data
+            changes the shape of the data
+        :type format_version: int
+        :return: the cached data
+        :rtype: Any
+        """
+
+        model_version = Helpers.get_otlmow_model_version()
+        memory_key = f"{name}_{format_version}_{model_version}"
+        if memory_key in cls.data_in_memory:
+            return cls.data_in_memory[memory_key]
+
+        data = cls.load(name=name, model_version=model_version, format_version=format_version)
+        if data is None:
+            data = create_data()
+            cls.save(name=name, model_version=model_version, format_version=format_version,
+                     data=data)
+
+        cls.data_in_memory[memory_key] = data
+        return data
+
+    @classmethod
+    def load(cls, name: str, model_version: str, format_version: int = 1) -> Any:
+        cache_path = cls.get_cache_path(name)
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path) as cache_file:
+                cache_dict = json.load(cache_file)
+        except json.decoder.JSONDecodeError as e:
+            OTLLogger.logger.warning(f"Ignored invalid model cache {cache_path}: {e}")
+            return None
+
+        if (cache_dict.get("model_version") != model_version or
+                cache_dict.get("format_version") != format_version):
+            return None
+        return cache_dict.get("data")
+
+    @classmethod
+    def save(cls, name: str, model_version: str, data: Any, format_version: int = 1) -> None:
+        cache_path = cls.get_cache_path(name)
+        try:
+            with open(cache_path, mode="w") as cache_file:
+                json.dump({"model_version": model_version, "format_version": format_version,
+                           "data": data}, cache_file)
+        except OSError as e:
+            OTLLogger.logger.warning(f"Could not save model cache {cache_path}: {e}")
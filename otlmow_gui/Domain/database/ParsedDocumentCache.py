@@ -0,0 +1,153 @@
+import gzip
+import hashlib
+import importlib
+import io
+import os
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from otlmow_converter.Exceptions.ExceptionsGroup import ExceptionsGroup
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.util.DocumentCheckPool import DocumentCheckPool, CheckDocumentFunction, \
+    reduce_result
+from otlmow_gui.Domain.util.Helpers import Helpers
+
+
+class CacheUnpickler(pickle.Unpickler):
+    """Only allows the classes that are found in a parsed document: paths, dates and exceptions."""
+
+    allowed_classes = {('pathlib', 'Path'), ('pathlib', 'PosixPath'), ('pathlib', 'WindowsPath'),
+                       ('datetime', 'date'), ('datetime', 'datetime'), ('datetime', 'time'),
+                       ('decimal', 'Decimal'), ('builtins', 'set'), ('builtins', 'frozenset')}
+    exception_module_prefixes = ('otlmow_converter.', 'otlmow_model.', 'otlmow_gui.Exceptions.')
+
+    def find_class(self, module: str, name: str):
+        if (module, name) in self.allowed_classes:
+            return super().find_class(module, name)
+        if module == 'builtins' or module.startswith(self.exception_module_prefixes):
+            found_class = getattr(importlib.import_module(module), name, None)
+            if isinstance(found_class, type) and issubclass(found_class, BaseException):
+                return found_class
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a parsed document cache")
+
+
+class ParsedDocumentCache:
+    """
+    Cache of the objects and exceptions that InsertDataDomain.check_document returns for a
+    document, so documents that didn't change are not converted again on every validation.
+
+    A document is cached under the hash of its content, the otlmow-converter and otlmow-model
+    versions and the delimiter. The file name is part of the key as well, because the messages
+    of the exceptions refer to it. The objects are stored as dicts with the exceptions in a
+    gzipped pickle in the cache folder of the project:
+
+    │   cache                                   : folder
+    │   └───parsed_documents                    : folder
+    │           <key>.pickle.gz                 : gzipped pickle file
+
+    Only the max_cached_documents most recently used documents are kept.
+    """
+
+    cache_foldername = "parsed_documents"
+    # increase when the layout of the cache files changes
+    cache_format_version = 1
+    max_cached_documents = 100
+
+    @classmethod
+    def create_key(cls, doc_location: Path, delimiter: str = ";") -> str:
+        document_hash = hashlib.sha256()
+        with open(doc_location, mode="rb") as document:
+            for chunk in iter(lambda: document.read(1 << 20), b""):
+                document_hash.update(chunk)
+        key_source = "_".join([str(cls.cache_format_version), Helpers.get_otlmow_converter_version(),
+                               Helpers.get_otlmow_model_version(), delimiter,
+                               Path(doc_location).name, document_hash.hexdigest()])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_cache_path(cls, cache_folder: Path, key: str) -> Path:
+        return cache_folder / cls.cache_foldername / f"{key}.pickle.gz"
+
+    @classmethod
+    def load(cls, cache_folder: Path, key: str) -> Optional[tuple[list[OTLObject], ExceptionsGroup]]:
+        """
+        Loads the objects and exceptions of a document from the cache.
+
+        :param cache_folder: the cache folder of the project
+        :type cache_folder: Path
+        :param key: the key of the document, see create_key
+        :type key: str
+        :return: the objects and exception group or None if the document isn't cached
+        :rtype: Optional[tuple[list[OTLObject], ExceptionsGroup]]
+        """
+
+        cache_path = cls.get_cache_path(cache_folder=cache_folder, key=key)
+        if not cache_path.exists():
+            return None
+        try:
+            with gzip.open(cache_path, mode="rb") as cache_file:
+                cached_key, result = CacheUnpickler(io.BytesIO(cache_file.read())).load()
+            if cached_key != key:
+                return None
+            objects, exception_group = DocumentCheckPool.rebuild_result(result)
+            # the modification time marks the document as recently used
+            os.utime(cache_path)
+            return objects, exception_group
+        except Exception as e:
+            OTLLogger.logger.warning(f"Ignored invalid parsed document cache {cache_path}: {e}")
+            return None
+
+    @classmethod
+    def save(cls, cache_folder: Path, key: str, objects: list[OTLObject],
+             exception_group: ExceptionsGroup) -> None:
+        cache_path = cls.get_cache_path(cache_folder=cache_folder, key=key)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(cache_path, mode="wb") as cache_file:
+                pickle.dump((key, reduce_result(objects, exception_group)), cache_file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            cls.remove_least_recently_used(cache_folder=cache_folder)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            OTLLogger.logger.warning(f"Could not save parsed document cache {cache_path}: {e}")
+            cache_path.unlink(missing_ok=True)
+
+    @classmethod
+    def remove_least_recently_used(cls, cache_folder: Path) -> None:
+        cache_paths = sorted((cache_folder / cls.cache_foldername).glob("*.pickle.gz"),
+                             key=lambda path: path.stat().st_mtime, reverse=True)
+        for cache_path in cache_paths[cls.max_cached_documents:]:
+            cache_path.unlink(missing_ok=True)
+
+    @classmethod
+    async def check_document(cls, cache_folder: Path, doc_location: Path,
+                             check_document: CheckDocumentFunction) \
+            -> tuple[list[OTLObject], ExceptionsGroup]:
+        """
+        Returns the objects and exceptions of a document from the cache, or checks the document
+        with check_document and caches the result.
+
+        :param cache_folder: the cache folder of the project
+        :type cache_folder: Path
+        :param doc_location: the path of the document
+        :type doc_location: Path
+        :param check_document: the coroutine function that checks a document
+        :type check_document: CheckDocumentFunction
+        """
+
+        try:
+            key = cls.create_key(doc_location=doc_location)
+        except OSError:
+            # check_document reports the missing file
+            return await check_document(doc_location)
+
+        cached_result = cls.load(cache_folder=cache_folder, key=key)
+        if cached_result is not None:
+            return cached_result
+
+        objects, exception_group = await check_document(doc_location)
+        cls.save(cache_folder=cache_folder, key=key, objects=objects,
+                 exception_group=exception_group)
+        return objects, exception_group
@@ -0,0 +1,143 @@
+import hashlib
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+from otlmow_modelbuilder.SQLDataClasses.OSLORelatie import OSLORelatie
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+
+
+class PossibleRelationMatrix:
+    """
+    All possible relations between the concrete classes of a subset database, as a
+    typeURI x typeURI -> list[OSLORelatie] matrix.
+
+    The matrix is built once from an OSLOCollector and stored in the cache folder of the project,
+    keyed on the hash of the subset database and the otlmow-model version, so the subset doesn't
+    need to be collected again every time the relation screen is opened:
+
+    │   cache                                   : folder
+    │       possible_relations.json             : json-file
+
+    get_relations_for gives the same result as
+    OSLOCollector.find_all_concrete_relations(objectUri=typeURI, allow_duplicates=False).
+    """
+
+    cache_filename = "possible_relations.json"
+    # increase when the layout of the cache file changes
+    cache_format_version = 1
+
+    def __init__(self, key: str, relations: list[OSLORelatie],
+                 matrix: dict[str, dict[str, list[int]]]):
+        self.key: str = key
+        # every relation of the subset, the matrix refers to their index
+        self.relations: list[OSLORelatie] = relations
+        self.matrix: dict[str, dict[str, list[int]]] = matrix
+
+    @classmethod
+    def create_key(cls, subset_path: Path, model_version: str) -> str:
+        subset_hash = hashlib.sha256()
+        with open(subset_path, mode="rb") as subset_file:
+            for chunk in iter(lambda: subset_file.read(1 << 20), b""):
+                subset_hash.update(chunk)
+        return f"{cls.cache_format_version}_{model_version}_{subset_hash.hexdigest()}"
+
+    @classmethod
+    def create_from_collector(cls, key: str, collector: OSLOCollector) -> "PossibleRelationMatrix":
+        """
+        Builds the matrix in a single pass over the relations of a collected subset.
+
+        :param key: the key of the subset and model version the collector was created from
+        :type key: str
+        :param collector: an OSLOCollector on which collect_all is already executed
+        :type collector: OSLOCollector
+        :return: the matrix of possible relations
+        :rtype: PossibleRelationMatrix
+        """
+
+        relations: list[OSLORelatie] = []
+        matrix: dict[str, dict[str, list[int]]] = defaultdict(lambda: defaultdict(list))
+        for oslo_class in collector.classes:
+            if oslo_class.abstract == 0:
+                # concrete classes without relations are also part of the subset
+                matrix[oslo_class.objectUri] = defaultdict(list)
+
+        for index, relation in enumerate(collector.relations):
+            relations.append(relation)
+            bron_class = collector.class_dict.get(relation.bron_uri)
+            doel_class = collector.class_dict.get(relation.doel_uri)
+            if (bron_class is None or doel_class is None or bron_class.abstract != 0 or
+                    doel_class.abstract != 0):
+                continue
+
+            matrix[relation.bron_uri][relation.doel_uri].append(index)
+
+            if relation.doel_uri == relation.bron_uri:
+                continue
+            # an unspecified relation is only listed for the class it was defined from
+            if (relation.richting != 'Unspecified' or
+                    relation.bron_overerving == relation.doel_uri):
+                matrix[relation.doel_uri][relation.bron_uri].append(index)
+
+        return cls(key=key, relations=relations,
+                   matrix={typeURI: dict(partners) for typeURI, partners in matrix.items()})
+
+    @classmethod
+    def load(cls, cache_path: Path, key: str) -> Optional["PossibleRelationMatrix"]:
+        """
+        Loads the matrix from the cache file if it was made for the same subset and model version.
+
+        :return: the cached matrix or None if there is no valid cache
+        :rtype: Optional[PossibleRelationMatrix]
+        """
+
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path) as cache_file:
+                cache_dict = json.load(cache_file)
+            if cache_dict.get("key") != key:
+                return None
+            relations = [OSLORelatie(*relation_fields) for relation_fields in cache_dict["relations"]]
+            return cls(key=key, relations=relations, matrix=cache_dict["matrix"])
+        except (json.decoder.JSONDecodeError, KeyError, TypeError) as e:
+            OTLLogger.logger.warning(f"Ignored invalid possible relation cache {cache_path}: {e}")
+            return None
+
+    def save(self, cache_path: Path) -> None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_dict = {
+            "key": self.key,
+            "relations": [
+                [relation.bron_overerving, relation.doel_overerving, relation.bron_uri,
+                 relation.doel_uri, relation.objectUri, relation.richting, relation.usagenote,
+                 relation.deprecated_version]
+                for relation in self.relations],
+            "matrix": self.matrix}
+        with open(cache_path, mode="w") as cache_file:
+            json.dump(cache_dict, cache_file)
+
+    def contains_class(self, typeURI: str) -> bool:
+        return typeURI in self.matrix
+
+    def get_relations_between(self, typeURI: str, partner_typeURI: str) -> list[OSLORelatie]:
+        return [self.relations[index]
+                for index in self.matrix.get(typeURI, {}).get(partner_typeURI, [])]
+
+    def get_relations_for(self, typeURI: str) -> list[OSLORelatie]:
+        """
+        Returns all possible relations of a class with all other classes of the subset, sorted on
+        the relation type. A new list is returned on every call.
+
+        :param typeURI: the typeURI of the class
+        :type typeURI: str
+        :return: the possible relations of the class
+        :rtype: list[OSLORelatie]
+        """
+
+        indices = sorted({index for partner_indices in self.matrix.get(typeURI, {}).values()
+                          for index in partner_indices})
+        return sorted((self.relations[index] for index in indices), key=lambda r: r.objectUri)
@@ -18,3 +18,9 @@ class ReportAction(Enum):
     ATC = 'attribute changed'
     ASS = 'asset added'
     REL = 'relation added'
+
+
+class QuickSaveChange(Enum):
+    ADD = 'add'
+    REMOVE = 'remove'
+    MODIFY = 'modify'
@@ -19,7 +19,8 @@ from otlmow_gui.Domain.util.Helpers import Helpers
 from otlmow_gui.Domain.database.ModelBuilder import ModelBuilder
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.Domain.project.ProjectFile import ProjectFile
-from otlmow_gui.Domain.enums import FileState
+from otlmow_gui.Domain.project.QuickSaveJournal import QuickSaveJournal
+from otlmow_gui.Domain.enums import FileState, QuickSaveChange
 from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
 from otlmow_gui.Domain.util.VisualisationStateTracker import VisualisationStateTracker
 from otlmow_gui.Exceptions.ExcelFileUnavailableError import ExcelFileUnavailableError
@@ -40,8 +41,11 @@ class Project:
     │   │   <self.subset_path_name>.db          : sqlite file
     │   ├───project-files                       : folder
     │   │       <saved_project_files[0]>.xlsx   : xlsx,json,geojson,csv file
-    │   └───quick_saves                         : folder
-    │           quick_save-<date>_<time>.json   : json-file
+    │   ├───quick_saves                         : folder
+    │   │       quick_save-<date>_<time>.json   : json-file
+    │   │       quick_save-<date>_<time>.journal: json-lines-file (changes after the quick save)
+    │   └───cache                               : folder (data derived from the subset and the
+    │                                             project files, can be removed)
     """
 
     project_details_filename = 'project_details.json'
@@ -51,10 +55,15 @@ class Project:
     quick_saves_foldername =  "quick_saves"
     visualisation_foldername = "visuals"
     visualisation_filename = "graph_visualisation.html"
+    visualisation_network_state_filename = "graph_visualisation_network_state.js"
+    visualisation_node_layout_filename = "graph_visualisation_layout.js"
     visualisation_python_support_data_filename = "visuals_python_support_data.json"
+    cache_foldername = "cache"
 
     max_days_quicksave_stored = 7
     quicksave_date_format = "%y%m%d_%H%M%S"
+    # when the journal grows beyond this many entries a new full quick save is made
+    max_quicksave_journal_entries = 500
 
     def __init__(self, eigen_referentie: str, project_path: Path = None, subset_path: Path = None,
                  saved_documents_overview_path: Path = None, bestek: str = None,
@@ -97,6 +106,10 @@ class Project:
         self.laatst_bewerkt: datetime.datetime = laatst_bewerkt
 
         self.assets_in_memory:list[Union[RelatieObject, RelationInteractor]] = []
+        # changes to assets_in_memory that can be appended to the journal of the last quick save
+        self.quick_save_journal: QuickSaveJournal = QuickSaveJournal()
+        self.full_quick_save_required: bool = True
+        self.quick_save_in_progress: bool = False
 
         self.saved_project_files: list[ProjectFile] = []
         self.model_builder = None
@@ -204,9 +217,23 @@ class Project:
 
         return visuals_folder
 
+    def get_cache_folder_path(self) -> Path:
+        cache_folder = self.get_project_local_path() / self.cache_foldername
+
+        if not cache_folder.exists():
+            os.makedirs(cache_folder, exist_ok=True)
+
+        return cache_folder
+
     def get_current_visuals_html_path(self) -> Path:
         return self.get_current_visuals_folder_path() / self.visualisation_filename
 
+    def get_current_visuals_network_state_path(self) -> Path:
+        return self.get_current_visuals_folder_path() / self.visualisation_network_state_filename
+
+    def get_current_visuals_node_layout_path(self) -> Path:
+        return self.get_current_visuals_folder_path() / self.visualisation_node_layout_filename
+
     def get_visualisation_python_support_data_path(self) -> Path:
         visuals_uptodate_state_path = self.get_current_visuals_folder_path() / self.visualisation_python_support_data_filename
 
@@ -309,7 +336,8 @@ class Project:
         Loads validated assets from the most recent quick save file.
 
         If a valid quick save path is found, it converts the file contents into a list of AIMObject
-        instances; otherwise, it returns an empty list.
+        instances and replays the journal of that quick save on top of them; otherwise, it returns
+        an empty list.
 
         :param self: The instance of the class managing asset loading.
 
@@ -334,6 +362,8 @@ class Project:
             saved_objects, exceptions_group = await Helpers.converter_from_file_to_object_async(
                 path,
                 allow_non_otl_conform_attributes=True)
+            saved_objects = self.quick_save_journal.replay(quick_save_path=path,
+                                                           saved_objects=saved_objects)
 
             object_count = len(saved_objects)
             OTLLogger.logger.debug(
@@ -351,7 +381,8 @@ class Project:
         Loads validated assets from the most recent quick save file.
 
         If a valid quick save path is found, it converts the file contents into a list of AIMObject
-        instances; otherwise, it returns an empty list.
+        instances and replays the journal of that quick save on top of them; otherwise, it returns
+        an empty list.
 
         :param self: The instance of the class managing asset loading.
 
@@ -375,6 +406,8 @@ class Project:
             # noinspection PyTypeChecker
             saved_objects, exceptions_group = Helpers.converter_from_file_to_object(
                 path)
+            saved_objects = self.quick_save_journal.replay(quick_save_path=path,
+                                                           saved_objects=saved_objects)
 
             object_count = len(saved_objects)
             OTLLogger.logger.debug(
@@ -389,6 +422,11 @@ class Project:
         """
         Saves validated assets to the project quick save directory.
 
+        If only a limited number of changes were recorded since the last quick save
+        (see record_quick_save_change), these changes are appended to the journal of that quick
+        save. Otherwise, a new full quick save is made of assets_in_memory, which also compacts
+        the journal.
+
         It manages the quick save files by removing old saves and generating a new save file with a unique name.
 
         The format of the save file is: quick_save_{date}_{time}.json:
@@ -405,6 +443,21 @@ class Project:
         @param asynchronous: do the save asynchronous or not
         """
 
+        if not self.full_quick_save_required:
+            if not self.quick_save_journal.has_pending_changes():
+                return
+            if self.quick_save_in_progress:
+                # the changes are written to the journal of the new quick save when it is done
+                return
+
+            last_quick_save_path = self.get_last_quick_save_path()
+            journal_size = (self.quick_save_journal.entry_count +
+                            len(self.quick_save_journal.pending_changes))
+            if (last_quick_save_path and last_quick_save_path.exists() and
+                    journal_size <= Project.max_quicksave_journal_entries):
+                self.write_quick_save_journal(save_path=last_quick_save_path)
+                return
+
         if self.quick_save_dir_path.exists():
             current_date = datetime.datetime.now()
 
@@ -417,6 +470,12 @@ class Project:
         current_date_str = datetime.datetime.now().strftime(Project.quicksave_date_format)
 
         save_path = self.quick_save_dir_path  / f"quick_save-{current_date_str}.json"
+
+        # the new quick save contains all changes so far
+        self.quick_save_journal.reset()
+        QuickSaveJournal.get_journal_path(save_path).unlink(missing_ok=True)
+        self.full_quick_save_required = False
+
         if asynchronous:
             try:
                 create_task_reraise_exception(self.make_quick_save_async(save_path=save_path))
@@ -432,9 +491,15 @@ class Project:
         OTLLogger.logger.debug(f"Execute Project.make_quick_save({save_path.name}) for project {self.eigen_referentie} ({object_count} objects)", extra={
             "timing_ref": f"make_quick_save_{save_path.stem}"})
 
-        await Helpers.from_objects_to_file_async(save_path,self.assets_in_memory)
+        self.quick_save_in_progress = True
+        try:
+            await Helpers.from_objects_to_file_async(save_path,self.assets_in_memory)
+        finally:
+            self.quick_save_in_progress = False
         self.last_quick_save = save_path
         self.save_project_to_dir()
+        # changes made while the quick save was being written
+        self.write_quick_save_journal(save_path=save_path)
         OTLLogger.logger.debug(
             f"Execute Project.make_quick_save({save_path.name}) for project {self.eigen_referentie} ({object_count} objects)",
             extra={
@@ -455,7 +520,44 @@ class Project:
             extra={
                 "timing_ref": f"make_quick_save_{save_path.stem}"})
 
+    def write_quick_save_journal(self, save_path: Path) -> None:
+        if not self.quick_save_journal.has_pending_changes():
+            return
 
+        OTLLogger.logger.debug(f"Execute Project.write_quick_save_journal({save_path.name}) for project {self.eigen_referentie}", extra={
+            "timing_ref": f"write_quick_save_journal_{save_path.stem}"})
+        entry_count = self.quick_save_journal.write_pending_changes(quick_save_path=save_path)
+        OTLLogger.logger.debug(
+            f"Execute Project.write_quick_save_journal({save_path.name}) for project {self.eigen_referentie} ({entry_count} changes)",
+            extra={
+                "timing_ref": f"write_quick_save_journal_{save_path.stem}"})
+
+    def record_quick_save_change(self, change: QuickSaveChange,
+                                 otl_object: Union[RelatieObject, RelationInteractor]) -> None:
+        """
+        Registers a change to a single asset or relation so the next call to
+        save_validated_assets only has to append this change to the quick save journal.
+
+        :param change: The kind of change that was made.
+        :type change: QuickSaveChange
+        :param otl_object: The asset or relation that was added, removed or modified.
+        :type otl_object: Union[RelatieObject, RelationInteractor]
+
+        :return: None
+        """
+
+        self.quick_save_journal.record_change(change=change, otl_object=otl_object)
+
+    def request_full_quick_save(self) -> None:
+        """
+        Makes sure the next call to save_validated_assets writes all assets_in_memory to a new
+        quick save, use this when the assets are replaced instead of changed one by one.
+
+        :return: None
+        """
+
+        self.quick_save_journal.clear_pending_changes()
+        self.full_quick_save_required = True
 
     def remove_too_old_quicksaves(self, current_date: datetime, max_days_stored: datetime,
                                    date_format: str) -> None:
@@ -484,7 +586,8 @@ class Project:
         files = os.listdir(path=self.quick_save_dir_path )
         for filename in files:
             try:
-                file_date = datetime.datetime.strptime(filename.split("-")[-1].split(".json")[0],
+                # the journal of a quick save has the same name, only another extension
+                file_date = datetime.datetime.strptime(Path(filename).stem.split("-")[-1],
                                                        date_format)
             except ValueError:
                 # if the save file doesn't adhere to standard naming convention it is never deleted
@@ -551,12 +654,31 @@ class Project:
                 last_quick_save_zip_path = Path(self.quick_saves_foldername) / last_quick_save_path.name
                 project_zip.write(last_quick_save_path, arcname=last_quick_save_zip_path)
 
+                journal_path = QuickSaveJournal.get_journal_path(last_quick_save_path)
+                if journal_path.exists():
+                    project_zip.write(journal_path,
+                                      arcname=Path(self.quick_saves_foldername) / journal_path.name)
+
             visualisation_html_path = self.get_current_visuals_html_path()
             if visualisation_html_path and visualisation_html_path.exists():
                 visualisation_html_zip_path = Path(
                     self.visualisation_foldername) / visualisation_html_path.name
                 project_zip.write(visualisation_html_path, arcname=visualisation_html_zip_path)
 
+            visualisation_network_state_path = self.get_current_visuals_network_state_path()
+            if visualisation_network_state_path.exists():
+                visualisation_network_state_zip_path = Path(
+                    self.visualisation_foldername) / visualisation_network_state_path.name
+                project_zip.write(visualisation_network_state_path,
+                                  arcname=visualisation_network_state_zip_path)
+
+            visualisation_node_layout_path = self.get_current_visuals_node_layout_path()
+            if visualisation_node_layout_path.exists():
+                visualisation_node_layout_zip_path = Path(
+                    self.visualisation_foldername) / visualisation_node_layout_path.name
+                project_zip.write(visualisation_node_layout_path,
+                                  arcname=visualisation_node_layout_zip_path)
+
             visualisation_uptodate_json_path = self.get_visualisation_python_support_data_path()
             if visualisation_uptodate_json_path and visualisation_uptodate_json_path.exists():
                 visualisation_uptodate_json_zip_path = Path(
@@ -831,7 +953,10 @@ class Project:
         if self.last_quick_save and self.last_quick_save.exists():
             path = self.last_quick_save
         elif quick_save_path_dir.exists():
-            file_list = sorted(os.listdir(quick_save_path_dir), reverse=True)
+            # journals are never a quick save on their own
+            file_list = sorted([filename for filename in os.listdir(quick_save_path_dir)
+                                if not filename.endswith(QuickSaveJournal.journal_extension)],
+                               reverse=True)
             if file_list:
                 path = Path(quick_save_path_dir, file_list[0])
         return path
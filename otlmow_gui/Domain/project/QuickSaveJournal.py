@@ -0,0 +1,170 @@
+import json
+from pathlib import Path
+from typing import Union, Optional
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, create_dict_from_asset
+from otlmow_model.OtlmowModel.BaseClasses.RelationInteractor import RelationInteractor
+from otlmow_model.OtlmowModel.Classes.ImplementatieElement.RelatieObject import RelatieObject
+from otlmow_model.OtlmowModel.Helpers.OTLObjectHelper import is_relation
+
+from otlmow_gui.Domain.enums import QuickSaveChange
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+
+
+class QuickSaveJournal:
+    """
+    Append-only journal of changes made to the assets of a project since its last full quick
+    save.
+
+    Every line in the journal file is a json object with the type of change and the json
+    representation of the changed OTL object (the same representation as in the quick save
+    itself). The journal is stored next to the quick save it belongs to:
+
+    │   quick_saves                             : folder
+    │       quick_save-<date>_<time>.json       : snapshot of all assets
+    │       quick_save-<date>_<time>.journal    : changes made after the snapshot
+
+    On load the journal is replayed on top of the snapshot, ADD and MODIFY changes replace the
+    object with the same key (or add it), REMOVE changes remove it.
+    """
+
+    journal_extension = ".journal"
+
+    def __init__(self):
+        self.pending_changes: list[tuple[QuickSaveChange, Union[RelatieObject, RelationInteractor]]] = []
+        self.entry_count: int = 0
+
+    @classmethod
+    def get_journal_path(cls, quick_save_path: Path) -> Path:
+        return quick_save_path.with_suffix(cls.journal_extension)
+
+    @classmethod
+    def get_change_key(cls, otl_object: Union[RelatieObject, RelationInteractor]) -> tuple:
+        """
+        Creates the key used to match changes in the journal with the objects of the snapshot.
+
+        Assets and agents are identified by their typeURI and identificator, relations also
+        include the identificators of their source and target.
+
+        :param otl_object: the OTL object to create a key for
+        :return: a hashable key for the object
+        :rtype: tuple
+        """
+
+        identificator = None
+        if hasattr(otl_object, "assetId"):
+            identificator = otl_object.assetId.identificator
+        elif hasattr(otl_object, "agentId"):
+            identificator = otl_object.agentId.identificator
+
+        if is_relation(otl_object):
+            return (otl_object.typeURI, identificator, otl_object.bronAssetId.identificator,
+                    otl_object.doelAssetId.identificator)
+        return otl_object.typeURI, identificator
+
+    def record_change(self, change: QuickSaveChange,
+                      otl_object: Union[RelatieObject, RelationInteractor]) -> None:
+        """
+        Registers a change that still has to be written to the journal. The object is only
+        serialised when the journal is written so later edits to the same object are included.
+        """
+
+        self.pending_changes.append((change, otl_object))
+
+    def has_pending_changes(self) -> bool:
+        return len(self.pending_changes) > 0
+
+    def clear_pending_changes(self) -> None:
+        self.pending_changes = []
+
+    def reset(self) -> None:
+        self.clear_pending_changes()
+        self.entry_count = 0
+
+    def write_pending_changes(self, quick_save_path: Path) -> int:
+        """
+        Appends all pending changes to the journal of the given quick save.
+
+        :param quick_save_path: the path to the quick save the journal belongs to
+        :type quick_save_path: Path
+        :return: the number of entries written to the journal
+        :rtype: int
+        """
+
+        pending_changes = self.pending_changes
+        self.pending_changes = []
+
+        lines = []
+        for change, otl_object in pending_changes:
+            object_dict = create_dict_from_asset(otl_object, cast_datetime=True, waarde_shortcut=True,
+                                                 warn_for_non_otl_conform_attributes=False)
+            object_dict['typeURI'] = otl_object.typeURI
+            lines.append(json.dumps({"change": change.value, "object": object_dict}))
+
+        if lines:
+            with open(self.get_journal_path(quick_save_path), mode="a") as journal_file:
+                journal_file.write("\n".join(lines) + "\n")
+
+        self.entry_count += len(lines)
+        return len(lines)
+
+    def read_entries(self, quick_save_path: Path) -> list[dict]:
+        journal_path = self.get_journal_path(quick_save_path)
+        if not journal_path.exists():
+            return []
+
+        entries = []
+        with open(journal_path, mode="r") as journal_file:
+            for line in journal_file:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.decoder.JSONDecodeError as e:
+                    # a line can be incomplete if the application was closed while writing
+                    OTLLogger.logger.warning(f"Skipped corrupt line in {journal_path.name}: {e}")
+        return entries
+
+    def replay(self, quick_save_path: Optional[Path],
+               saved_objects: list[Union[RelatieObject, RelationInteractor]]) \
+            -> list[Union[RelatieObject, RelationInteractor]]:
+        """
+        Applies the journal of the given quick save to the objects loaded from that quick save.
+
+        :param quick_save_path: the path to the quick save the objects were loaded from
+        :type quick_save_path: Path
+        :param saved_objects: the objects loaded from the quick save
+        :type saved_objects: list[Union[RelatieObject, RelationInteractor]]
+        :return: the objects with all changes in the journal applied, in their original order
+            with added objects at the end
+        :rtype: list[Union[RelatieObject, RelationInteractor]]
+        """
+
+        self.reset()
+        if not quick_save_path:
+            return saved_objects
+
+        entries = self.read_entries(quick_save_path)
+        self.entry_count = len(entries)
+        if not entries:
+            return saved_objects
+
+        replayed_objects: list[Optional[Union[RelatieObject, RelationInteractor]]] = list(saved_objects)
+        index_by_key = {self.get_change_key(otl_object): index
+                        for index, otl_object in enumerate(replayed_objects)}
+        for entry in entries:
+            otl_object = OTLObject.from_dict(entry["object"], waarde_shortcut=True, cast_datetime=True,
+                                             warn_for_non_otl_conform_attributes=False)
+            key = self.get_change_key(otl_object)
+            if QuickSaveChange(entry["change"]) == QuickSaveChange.REMOVE:
+                if key in index_by_key:
+                    replayed_objects[index_by_key.pop(key)] = None
+            elif key in index_by_key:
+                replayed_objects[index_by_key[key]] = otl_object
+            else:
+                index_by_key[key] = len(replayed_objects)
+                replayed_objects.append(otl_object)
+
+        OTLLogger.logger.debug(
+            f"Replayed {len(entries)} journal entries on {quick_save_path.name}")
+        return [otl_object for otl_object in replayed_objects if otl_object is not None]
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from pathlib import Path
 
 from otlmow_model.OtlmowModel.Classes.ImplementatieElement.RelatieObject import RelatieObject
@@ -83,8 +82,7 @@ class ExportDataDomain:
                         f"No Assets in memory for project {global_vars.current_project.eigen_referentie}")
 
             else:
-                objects_in_memory = deepcopy(assets)
-                objects_in_memory.extend(relations)
+                objects_in_memory = [*assets, *relations]
                 await Helpers.start_async_converter_from_object_to_file(file_path=Path(end_file),
                                                                   sequence_of_objects=objects_in_memory,
                                                                   split_per_type=separate_per_class_csv_option,
@@ -7,6 +7,7 @@ from otlmow_model.OtlmowModel.BaseClasses.OTLObject import create_dict_from_asse
 from otlmow_model.OtlmowModel.Helpers.OTLObjectHelper import \
     compare_two_lists_of_objects_attribute_level, is_relation
 from otlmow_gui.Domain import global_vars
+from otlmow_gui.Domain.database.ParsedDocumentCache import ParsedDocumentCache
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.Domain.enums import ReportAction
 from otlmow_gui.Domain.step_domain.ExportDataDomain import ExportDataDomain
@@ -163,8 +164,12 @@ class ExportFilteredDataSubDomain:
     async def generate_original_assets_from_files(cls,original_documents: List[Path]) -> tuple[List[OTLObject],list]:
         original_assets = []
         error_set = []
+        # the original documents only change when the user picks other ones
+        cache_folder = global_vars.current_project.get_cache_folder_path()
         for path in original_documents:
-            assets, exceptions_group = await InsertDataDomain.check_document( doc_location=path)
+            assets, exceptions_group = await ParsedDocumentCache.check_document(
+                cache_folder=cache_folder, doc_location=path,
+                check_document=InsertDataDomain.check_document)
 
             if exceptions_group and exceptions_group.exceptions:
                 for ex in exceptions_group.exceptions:
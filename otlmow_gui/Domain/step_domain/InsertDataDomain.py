@@ -1,3 +1,4 @@
+import zipfile
 from pathlib import Path
 from typing import List, Iterable, Optional, cast, Union
 
@@ -14,7 +15,11 @@ from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper, RelationValidator
 
 from otlmow_gui.Domain import global_vars
 from otlmow_gui.Domain.project.ProjectFile import ProjectFile
+from otlmow_gui.Domain.Settings import Settings
+from otlmow_gui.Domain.database.ParsedDocumentCache import ParsedDocumentCache
 from otlmow_gui.Domain.util.CombineAssetHelper import CombineAssetHelper
+from otlmow_gui.Domain.util.DocumentCheckPool import DocumentCheckPool
+from otlmow_gui.Domain.util.ExcelSheetRemover import ExcelSheetRemover
 from otlmow_gui.Domain.util.Helpers import Helpers
 from otlmow_gui.Domain.util.SDFHandler import SDFHandler
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
@@ -59,6 +64,9 @@ class InsertDataDomain:
         external_object_added (bool): Flag indicating if an external object has been added.
     """
 
+    # sheets of the templates that only hold the values of the dropdowns
+    dropdown_sheet_names = ['Keuzelijsten', 'dropdownvalues']
+
     @classmethod
     def init_static(cls,force_refresh = False):
         """
@@ -150,24 +158,34 @@ class InsertDataDomain:
         """
         Removes specific dropdown sheets from an Excel document.
 
-        This method loads an Excel workbook from the specified document path,
-        removes the sheets named 'Keuzelijsten' and 'dropdownvalues' if they exist,
-        and saves the modified workbook to a temporary path. It returns the path
-        of the modified workbook.
+        This method removes the sheets named 'Keuzelijsten' and 'dropdownvalues' from
+        the Excel document at the specified path, if they exist, and saves the result
+        to a temporary path. Only the workbook manifest is rewritten, the cell data is
+        not parsed, so the document is only read once by the converter. If the document
+        has none of these sheets, the path of the document itself is returned.
 
         :param cls: The class itself.
         :param doc: The path to the Excel document to be modified.
         :type doc: Path
-        :returns: The path to the modified Excel document.
+        :returns: The path to the Excel document without dropdown sheets.
         """
 
         OTLLogger.logger.debug("starting excel changes")
-        wb = load_workbook(doc)
         temp_path = Helpers.create_temp_path(path_to_template_file_and_extension=doc)
-        if 'Keuzelijsten' in wb.sheetnames:
-            wb.remove(wb['Keuzelijsten'])
-        if 'dropdownvalues' in wb.sheetnames:
-            wb.remove(wb['dropdownvalues'])
+        if Path(doc).resolve() != temp_path.resolve():
+            try:
+                if not ExcelSheetRemover.remove_sheets(source_path=doc, target_path=temp_path,
+                                                       sheet_names=cls.dropdown_sheet_names):
+                    return doc
+                return temp_path
+            except (zipfile.BadZipFile, KeyError, UnicodeDecodeError, ValueError) as e:
+                OTLLogger.logger.warning(
+                    f"Could not remove the dropdown sheets from {doc} without loading it: {e}")
+
+        wb = load_workbook(doc)
+        for sheet_name in cls.dropdown_sheet_names:
+            if sheet_name in wb.sheetnames:
+                wb.remove(wb[sheet_name])
 
         wb.save(temp_path)
         return temp_path
@@ -338,11 +356,16 @@ class InsertDataDomain:
         relations_per_filepath_str_dict: dict[str,list[RelatieObject]] = {}
         assets_per_filepath_str_dict: dict[str, list[AIMObject]] = {}
 
-        for project_file in global_vars.current_project.get_saved_projectfiles():
+        project_files = global_vars.current_project.get_saved_projectfiles()
+        checked_documents = await cls.check_project_documents(project_files=project_files)
+
+        # the results are processed in the order of the project files
+        for project_file in project_files:
             file_path = project_file.file_path
             try:
-
-                objects, exception_group = await cls.check_document(file_path)
+                objects, exception_group = checked_documents[file_path]
+                if not isinstance(exception_group, ExceptionsGroup):
+                    raise exception_group
 
                 assets, relations = cls.divide_otl_objects(objects)
 
@@ -416,6 +439,8 @@ class InsertDataDomain:
         # passing objects to other screens
         # global_vars.otl_wizard.main_window.step3_visuals.create_html(
         #     objects_in_memory=objects_in_memory)
+        # all assets are replaced so the quick save journal can't be used
+        global_vars.current_project.request_full_quick_save()
         await RelationChangeDomain.set_instances(objects_list=objects_in_memory)
         # global_vars.otl_wizard.main_window.step3_visuals.reload_html()
         global_vars.current_project.visualisation_uptodate.set_clear_all(True)
@@ -464,7 +489,8 @@ class InsertDataDomain:
         :type exception_group: ExceptionsGroup
         :returns: None
         """
-        id_to_typeURI_dict: Optional[dict[str,str]] = None
+        # built once per validation, instead of for every relation without a bron/doel.typeURI
+        id_to_typeURI_dict: dict[str, str] = Helpers.create_id_to_typeURI_dict(ref_assets)
         for relation in relations:
 
             bron_type_uri = Helpers.extract_corrected_relation_partner_typeURI(
@@ -530,15 +556,9 @@ class InsertDataDomain:
                 # the rest of the check will fail anyway
                 continue
 
-            try:
-                is_valid_relation = RelationValidator.is_valid_relation(
-                    relation_type=type(relation),
-                    source_typeURI=bron_type_uri,
-                    target_typeURI=doel_type_uri)
-            except Exception as e:
-                OTLLogger.logger.warning(e)
-                is_valid_relation = False
-
+            is_valid_relation = Helpers.is_valid_relation(relation_type=type(relation),
+                                                          source_typeURI=bron_type_uri,
+                                                          target_typeURI=doel_type_uri)
             if not is_valid_relation:
                 ex = cls.raise_wrong_doel_or_target(relation=relation,
                                                     tab=RelationChangeHelpers.get_abbreviated_typeURI(
@@ -549,7 +569,7 @@ class InsertDataDomain:
 
     @classmethod
     def does_typeURI_exist(cls, bron_type_uri):
-        return bron_type_uri in Helpers.all_OTL_asset_types_dict.values()
+        return bron_type_uri in Helpers.all_OTL_asset_typeURIs
 
 
 
@@ -603,6 +623,73 @@ class InsertDataDomain:
             objects_in_memory.extend(objects_list)
         return objects_in_memory
 
+    @classmethod
+    async def check_project_documents(cls, project_files: list[ProjectFile]) \
+            -> dict[Path, tuple[list[OTLObject], Union[ExceptionsGroup, Exception]]]:
+        """
+        Checks the documents of the project files and sets their state as soon as a document is
+        checked. Documents that are in the parsed document cache of the project are not converted
+        again, the other documents are checked concurrently in worker processes.
+
+        :param cls: The class itself.
+        :param project_files: The project files to check.
+        :type project_files: list[ProjectFile]
+        :returns: The objects and the exception group per file path, or the exception that was
+            raised while checking the document.
+        :rtype: dict[Path, tuple[list[OTLObject], Union[ExceptionsGroup, Exception]]]
+        """
+
+        project_file_per_path = {project_file.file_path: project_file
+                                 for project_file in project_files}
+        cache_folder = global_vars.current_project.get_cache_folder_path()
+        checked_documents: dict[Path, tuple[list[OTLObject], Union[ExceptionsGroup, Exception]]] = {}
+        cache_key_per_path: dict[Path, str] = {}
+        for file_path in project_file_per_path:
+            try:
+                cache_key_per_path[file_path] = ParsedDocumentCache.create_key(doc_location=file_path)
+            except OSError:
+                # check_document reports the missing file
+                continue
+            cached_result = ParsedDocumentCache.load(cache_folder=cache_folder,
+                                                     key=cache_key_per_path[file_path])
+            if cached_result is not None:
+                checked_documents[file_path] = cached_result
+                cls.set_checked_file_state(project_file=project_file_per_path[file_path],
+                                           exception_group=cached_result[1])
+
+        # the documents are checked concurrently, every file shows its state as soon as it is done
+        async for file_path, objects, exception_group in DocumentCheckPool.check_documents(
+                doc_locations=[file_path for file_path in project_file_per_path
+                               if file_path not in checked_documents],
+                check_document=cls.check_document,
+                worker_count=cls.get_validation_worker_count()):
+            checked_documents[file_path] = objects, exception_group
+            cls.set_checked_file_state(project_file=project_file_per_path[file_path],
+                                       exception_group=exception_group)
+            if isinstance(exception_group, ExceptionsGroup) and file_path in cache_key_per_path:
+                ParsedDocumentCache.save(cache_folder=cache_folder,
+                                         key=cache_key_per_path[file_path], objects=objects,
+                                         exception_group=exception_group)
+
+        return checked_documents
+
+    @classmethod
+    def set_checked_file_state(cls, project_file: ProjectFile,
+                               exception_group: Union[ExceptionsGroup, Exception]) -> None:
+        if isinstance(exception_group, ExceptionsGroup) and not exception_group.exceptions:
+            project_file.state = FileState.OK
+        else:
+            project_file.state = FileState.ERROR
+        cls.get_screen().update_file_state(file=project_file.file_path,
+                                           asset_state=project_file.state)
+
+    @classmethod
+    def get_validation_worker_count(cls) -> int:
+        # the unit tests check the documents in the test process
+        if global_vars.test_mode:
+            return 1
+        return Settings.get_validation_worker_count()
+
     @classmethod
     def get_screen(cls):
         return global_vars.otl_wizard.main_window.step2
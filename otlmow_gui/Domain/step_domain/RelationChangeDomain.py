@@ -1,7 +1,6 @@
 import asyncio
 import gc
 from collections import defaultdict
-from copy import deepcopy
 from pathlib import Path
 from typing import Optional, Union, Callable
 
@@ -20,7 +19,12 @@ from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_class
 from otlmow_modelbuilder.OSLOCollector import OSLOCollector
 from otlmow_modelbuilder.SQLDataClasses.OSLORelatie import OSLORelatie
 from otlmow_gui.Domain import global_vars
+from otlmow_gui.Domain.database.ModelDataCache import ModelDataCache
+from otlmow_gui.Domain.database.PossibleRelationMatrix import PossibleRelationMatrix
+from otlmow_gui.Domain.enums import QuickSaveChange
 
+from otlmow_gui.Domain.util.DisplayRecordCache import DisplayRecordCache, DisplayRecord
+from otlmow_gui.Domain.util.ExistingRelationStore import ExistingRelationStore
 from otlmow_gui.Domain.util.Helpers import Helpers
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.Domain.project.Project import Project
@@ -36,7 +40,9 @@ def async_save_assets(func):
     """Decorator that saves assets after executing the decorated function.
 
     This decorator wraps a function to ensure that after its execution, the current
-    project's assets in memory are updated and saved. It also starts the event loop
+    project's assets in memory are updated and saved. Changes recorded with
+    Project.record_quick_save_change are appended to the quick save journal instead of
+    rewriting the whole quick save. It also starts the event loop
     for the header in the main window to animate the OTL Wizard 2 logo during saving.
 
     :param func: The function to be decorated.
@@ -58,16 +64,34 @@ class RelationChangeDomain:
 
     Attributes:
         project (Project): The current project being managed.
-        collector (OSLOCollector): The collector for OSLO data.
+        collector (OSLOCollector): The collector for OSLO data, only collected when there is no
+            cached possible_relation_matrix.
+        possible_relation_matrix (PossibleRelationMatrix): The possible relations between the
+            classes of the subset.
+        full_model_relations_per_class_dict (dict[str, list[OSLORelatie]]): Relations from the
+            full model, collected once per class.
+        legacy_hoortbij_relations_dict (dict[str, list[OSLORelatie]]): HoortBij relations from all
+            non-legacy concrete classes to a legacy class, per legacy class.
+        hoortbij_OSLORelatie_templates (dict[tuple[str, str], OSLORelatie]): Shared HoortBij
+            relations per (legacy class, OTL class).
         internal_objects (list[Union[RelatieObject, RelationInteractor]]): Objects placed by the contractor within the project.
         external_objects (list[Union[RelatieObject, RelationInteractor]]): Object outside the project (from DAVIE)
         agent_objects (list[Agent]): Agent objects that are not AIM objects.
         shown_objects (list[RelationInteractor]): All objects displayed in the GUI.
+        shown_objects_by_identificator (dict[str, RelationInteractor]): Index of shown_objects on
+            their (corrected) identificator.
+        duplicate_identificators (set[str]): Identificators shared by multiple shown objects.
+        shown_typeURIs (set[str]): The typeURIs of the shown objects.
+        shown_type_name_counts (dict[str, int]): Per type name the number of shown typeURIs
+            with that name, to decide if the namespace is shown.
+        display_records (DisplayRecordCache): The texts shown for the shown objects in the lists
+            and map popups, computed once per object.
         possible_relations_per_class_dict (dict[str, list[OSLORelatie]]): Possible relations
             categorized by class type
         possible_object_to_object_relations_dict (dict[str, dict[str, list[RelatieObject]]]):
             Possible Relations between objects that the user can choose from.
-        existing_relations (list[RelatieObject]): Currently active relations.
+        existing_relations (ExistingRelationStore): Currently active relations, indexed on
+            (typeURI, source, target).
         aim_id_relations (list): Pre-existing relations sourced from DAVIE.
         selected_object (Optional[RelationInteractor]): The currently selected object from
             the OTL-asset column in the GUI.
@@ -79,6 +103,8 @@ class RelationChangeDomain:
 
     Methods:
         init_static(project: Project) -> None: Initializes static resources for the class.
+        load_possible_relation_matrix(project: Project) -> None: Loads the possible relations of
+            the subset from cache or builds them.
         load_project_relation_data() -> None: Loads project relation data asynchronously.
         set_instances(objects_list: list[Union[RelatieObject, RelationInteractor]]) -> None: Processes and categorizes AIM objects.
         create_and_add_missing_external_assets_from_relations() -> None: Creates missing external
@@ -86,6 +112,13 @@ class RelationChangeDomain:
         get_all_relations() -> list[RelatieObject]: Retrieves all existing relations.
         get_object(identificator: str) -> Optional[RelationInteractor]: Retrieves an object by its
             identifier.
+        index_shown_objects() -> None: Rebuilds the identificator index of the shown objects.
+        add_to_shown_objects_index(otl_object: RelationInteractor) -> None: Adds a shown object to
+            the identificator index.
+        get_display_record(otl_object: RelationInteractor) -> Optional[DisplayRecord]: Retrieves
+            the texts that are shown for an object.
+        is_unique_across_namespaces(typeURI: str) -> bool: Checks if the namespace is shown
+            with the type name.
         filter_on_id(id_to_check: str): Filters objects based on a specified identifier.
         set_possible_relations(selected_object: RelationInteractor) -> None: Sets possible
             relations for a selected object.
@@ -106,6 +139,9 @@ class RelationChangeDomain:
         get_same_relations_in_list(relation_list: list[RelatieObject], relation_def: OSLORelatie,
             selected_object: RelationInteractor, related_object: RelationInteractor,
             reverse: bool = False) -> list: Retrieves relations matching a specified definition.
+        is_existing_relation(relation_def: OSLORelatie, selected_id: str, related_id: str,
+            reverse: bool = False) -> bool: Checks the index of existing relations for a matching
+            relation.
         is_same_relation(existing_relation: RelatieObject, relation_def: OSLORelatie,
             selected: RelationInteractor, related: RelationInteractor, reverse: bool = False)
             -> bool: Determines if an existing relation matches a specified definition.
@@ -127,12 +163,16 @@ class RelationChangeDomain:
             relations.
         add_relation_object_to_existing_relations(relation_object: RelatieObject): Adds a relation
             object to existing relations.
+        add_relation_objects_to_existing_relations(relation_objects: list[RelatieObject]): Adds
+            multiple relation objects to existing relations.
         update_frontend(): Updates the user interface to reflect the current state of objects and
             relations.
         remove_multiple_existing_relations(indices: list[int]) -> None: Removes multiple existing
             relations based on indices.
         remove_existing_relation(index: int) -> RelatieObject: Removes an existing relation by
             index.
+        remove_existing_relations(indices: list[int]) -> list[RelatieObject]: Removes multiple
+            existing relations by index.
         select_existing_relation_indices(indices: list[int]) -> None: Selects existing relations
             based on indices.
         select_possible_relation_data(selected_relations_data: list) -> None: Selects and displays
@@ -155,17 +195,26 @@ class RelationChangeDomain:
 
     project: Project = None
     collector: OSLOCollector = None
+    possible_relation_matrix: Optional[PossibleRelationMatrix] = None
+    full_model_relations_per_class_dict: dict[str, list[OSLORelatie]] = {}
+    legacy_hoortbij_relations_dict: dict[str, list[OSLORelatie]] = {}
+    hoortbij_OSLORelatie_templates: dict[tuple[str, str], OSLORelatie] = {}
 
     internal_objects: list[RelationInteractor] = []  # Object in the project (placed by contractor)
     external_objects: list[RelationInteractor] = []  # Object outside the project (from DAVIE)
     agent_objects: list[Agent] = []  # Agent objects (not an AIMobject)
     shown_objects: list[RelationInteractor] = []  # All objects combined that are displayed on GUI (col 1)
+    shown_objects_by_identificator: dict[str, RelationInteractor] = {}  # index on shown_objects
+    duplicate_identificators: set[str] = set()
+    shown_typeURIs: set[str] = set()
+    shown_type_name_counts: dict[str, int] = {}
+    display_records: DisplayRecordCache = DisplayRecordCache()
 
     possible_relations_per_class_dict: dict[str, list[OSLORelatie]] = {}
     possible_object_to_object_relations_dict: dict[
         str, dict[str, list[RelatieObject]]] = {}  # (col 2)
 
-    existing_relations: list[RelatieObject] = []  # relations
+    existing_relations: ExistingRelationStore = ExistingRelationStore()  # relations
     aim_id_relations = []  # pre-existing relations from DAVIE
 
     selected_object: Optional[RelationInteractor] = None  # the asset/agent in col 1 selected by user
@@ -197,13 +246,11 @@ class RelationChangeDomain:
         """
 
         cls.project = project
-        cls.collector = OSLOCollector(project.subset_path)
-        cls.collector.collect_all()
+        cls.load_possible_relation_matrix(project=project)
 
         cls.clear_data()
 
-        if not Helpers.all_OTL_asset_types_dict:
-            Helpers.create_external_typeURI_options()
+        Helpers.get_external_typeURI_options()
 
         if global_vars.current_project:
             if asynchronous:
@@ -220,6 +267,46 @@ class RelationChangeDomain:
                     cls.load_project_relation_data()
 
 
+    @classmethod
+    def load_possible_relation_matrix(cls, project: Project) -> None:
+        """
+        Loads the matrix of possible relations of the subset of the project from the cache folder
+        of the project. If there is no cache for this subset and otlmow-model version the subset is
+        collected and the matrix is built and saved for the next time.
+
+        :param cls: The class itself.
+        :param project: The project of which the subset is used.
+        :type project: Project
+        :returns: None
+        """
+
+        cls.possible_relation_matrix = None
+        cls.collector = None
+
+        subset_path = project.subset_path
+        matrix_key = None
+        cache_path = None
+        if isinstance(subset_path, Path) and subset_path.is_file():
+            matrix_key = PossibleRelationMatrix.create_key(
+                subset_path=subset_path, model_version=Helpers.get_otlmow_model_version())
+            cache_path = project.get_cache_folder_path() / PossibleRelationMatrix.cache_filename
+            cls.possible_relation_matrix = PossibleRelationMatrix.load(cache_path=cache_path,
+                                                                       key=matrix_key)
+            if cls.possible_relation_matrix:
+                OTLLogger.logger.debug(f"Loaded possible relations of {subset_path.name} from cache")
+                return
+
+        cls.collector = OSLOCollector(subset_path)
+        cls.collector.collect_all()
+
+        if matrix_key:
+            cls.possible_relation_matrix = PossibleRelationMatrix.create_from_collector(
+                key=matrix_key, collector=cls.collector)
+            try:
+                cls.possible_relation_matrix.save(cache_path=cache_path)
+            except OSError as e:
+                OTLLogger.logger.warning(f"Could not save the possible relations cache: {e}")
+
     @classmethod
     def get_empty_visualisation_uptodate(cls):
         return {"remove":[],"add":[],"clear_all": False}
@@ -230,9 +317,14 @@ class RelationChangeDomain:
         cls.selected_object = None
 
         cls.shown_objects = []
+        cls.shown_objects_by_identificator = {}
+        cls.duplicate_identificators = set()
+        cls.shown_typeURIs = set()
+        cls.shown_type_name_counts = {}
+        cls.display_records.invalidate()
         cls.internal_objects = []
         cls.external_objects = []
-        cls.existing_relations = []
+        cls.existing_relations = ExistingRelationStore()
         cls.possible_relations_per_class_dict = {}
         cls.possible_object_to_object_relations_dict = {}
         cls.aim_id_relations = []
@@ -327,7 +419,7 @@ class RelationChangeDomain:
             f"{global_vars.current_project.eigen_referentie}",
             extra={"timing_ref": timing_ref})
 
-        cls.existing_relations = []
+        cls.existing_relations = ExistingRelationStore()
         cls.aim_id_relations = []
 
         cls.internal_objects = []
@@ -364,9 +456,11 @@ class RelationChangeDomain:
 
         cls.apply_active_aim_id_relations()
 
-        cls.shown_objects = deepcopy(cls.internal_objects)
+        # the shown objects are the internal objects themselves, only the list is new
+        cls.shown_objects = list(cls.internal_objects)
         cls.add_external_objects_to_shown_objects()
         cls.add_agent_objects_to_shown_objects()
+        cls.index_shown_objects()
 
         await cls.create_and_add_missing_external_assets_from_relations()
 
@@ -403,13 +497,17 @@ class RelationChangeDomain:
             extra={"timing_ref": timing_ref})
 
 
+        # built once, the objects that are added in this loop are found by get_object
+        id_to_typeURI_dict: dict[str, str] = {
+            identificator: otl_object.typeURI
+            for identificator, otl_object in cls.shown_objects_by_identificator.items()}
+
         for relation_object in RelationChangeDomain.get_all_relations():
             await asyncio.sleep(0)
             source_id =  relation_object.bronAssetId.identificator
             target_id = relation_object.doelAssetId.identificator
 
             source_object = RelationChangeDomain.get_object(identificator=source_id)
-            id_to_typeURI_dict: Optional[dict[str, str]] = None
             if not source_object:
                 try:
                     bron_type_uri = Helpers.extract_corrected_relation_partner_typeURI(
@@ -461,13 +559,12 @@ class RelationChangeDomain:
 
     @classmethod
     def get_object(cls, identificator: str) -> Optional[RelationInteractor]:
-        # sourcery skip: use-named-expression
         """
         Retrieves an object from the list of shown objects based on its identificator.
 
-        This method filters the list of shown objects to find an object that matches
-        the provided identificator. If multiple objects are found, it currently does
-        not handle the error case, but if exactly one object is found, it returns that object.
+        This method looks up the identificator in the index of shown objects. If multiple
+        objects share the identificator, the conflict is reported and no object is returned, if
+        exactly one object is found, it returns that object.
 
         :param cls: The class itself.
         :param identificator: The identificator of the object to retrieve.
@@ -475,16 +572,92 @@ class RelationChangeDomain:
         :returns: The matching OTL object if found, otherwise None.
         :rtype: Optional[RelationInteractor]
         """
-        filtered_objects = list(filter(cls.filter_on_id(id_to_check=identificator), cls.shown_objects))
 
-        if filtered_objects:
-            if len(filtered_objects) > 1:
-                OTLLogger.logger.debug(f"ERROR RelationChangeDomain.get_object function found multiple "
-                              f"objects with id: {identificator}")
-                pass  # TODO: raise error of 2 objects with the same identificator in the list
-            else:
-                return filtered_objects[0]
-        return None
+        if identificator in cls.duplicate_identificators:
+            OTLLogger.logger.warning(f"RelationChangeDomain.get_object found multiple "
+                                     f"objects with id: {identificator}")
+            return None
+        return cls.shown_objects_by_identificator.get(identificator)
+
+    @classmethod
+    def index_shown_objects(cls) -> None:
+        """
+        Rebuilds the index of the shown objects on their (corrected) identificator.
+        Identificators that are used by more than one object are collected in
+        duplicate_identificators and reported in the log.
+
+        :param cls: The class itself.
+        :returns: None
+        """
+
+        cls.shown_objects_by_identificator = {}
+        cls.duplicate_identificators = set()
+        cls.shown_typeURIs = set()
+        cls.shown_type_name_counts = {}
+        for otl_object in cls.shown_objects:
+            cls.add_to_shown_objects_index(otl_object)
+        cls.display_records.build_records(cls.shown_objects)
+
+        if cls.duplicate_identificators:
+            OTLLogger.logger.warning(
+                f"RelationChangeDomain found multiple objects with the same id: "
+                f"{sorted(cls.duplicate_identificators)}")
+
+    @classmethod
+    def add_to_shown_objects_index(cls, otl_object: RelationInteractor) -> None:
+        """
+        Adds a shown object to the index on identificator, keeping track of identificators that
+        are already in use by another object, and counts its type name if its typeURI is new.
+
+        :param cls: The class itself.
+        :param otl_object: The object that was added to shown_objects.
+        :type otl_object: RelationInteractor
+        :returns: None
+        """
+
+        identificator = RelationChangeHelpers.get_corrected_identificator(otl_object)
+        if identificator in cls.shown_objects_by_identificator:
+            cls.duplicate_identificators.add(identificator)
+        else:
+            cls.shown_objects_by_identificator[identificator] = otl_object
+
+        if otl_object.typeURI not in cls.shown_typeURIs:
+            cls.shown_typeURIs.add(otl_object.typeURI)
+            type_name = otl_object.typeURI.split("#")[-1]
+            cls.shown_type_name_counts[type_name] = cls.shown_type_name_counts.get(type_name, 0) + 1
+
+    @classmethod
+    def get_display_record(cls, otl_object: Optional[RelationInteractor]
+                           ) -> Optional[DisplayRecord]:
+        """
+        Retrieves the texts that are shown for an object in the lists and the map popups
+        (screen name, identificator, abbreviated typeURI, ...) without computing them again.
+
+        :param cls: The class itself.
+        :param otl_object: The object to get the texts of.
+        :type otl_object: Optional[RelationInteractor]
+        :returns: The display record of the object, None if no object is given.
+        :rtype: Optional[DisplayRecord]
+        """
+
+        return cls.display_records.get_record(otl_object)
+
+    @classmethod
+    def is_unique_across_namespaces(cls, typeURI: str) -> bool:
+        """
+        Checks if the namespace has to be shown with the type name of the typeURI, because
+        another typeURI of the shown objects has the same type name. The type names of the
+        shown objects are counted when they are indexed, so this is a lookup.
+
+        :param cls: The class itself.
+        :param typeURI: The typeURI to check.
+        :type typeURI: str
+        :returns: True if the namespace has to be shown.
+        :rtype: bool
+        """
+
+        return RelationChangeHelpers.is_unique_across_namespaces(
+            typeURI=typeURI, type_name_counts=cls.shown_type_name_counts)
 
     @classmethod
     def filter_on_id(cls, id_to_check: str):
@@ -614,9 +787,12 @@ class RelationChangeDomain:
             selected_object)
 
         related_objects_dict = defaultdict(list)
+        related_object_ids: dict[int, str] = {}
         legacy_hoortbij_relations_dict = {}
         for related_object in related_objects:
             related_objects_dict[related_object.typeURI].append(related_object)
+            related_object_ids[id(related_object)] = RelationChangeHelpers.get_corrected_identificator(
+                related_object)
             # if the related object is a legacy object create a new OSLO relation from legacy to otl_class
             if related_object.typeURI.startswith("https://lgc"):
                 hoortbij_relation = RelationChangeDomain.create_hoortbij_OSLORelatie_with_legacy_class(
@@ -633,19 +809,18 @@ class RelationChangeDomain:
         for relation in relation_list:
             if relation.bron_uri == selected_object.typeURI:
                 for related_object in related_objects_dict[relation.doel_uri]:
-                    if cls.get_same_relations_in_list(
-                            relation_list=cls.existing_relations, relation_def=relation,
-                            selected_object=selected_object, related_object=related_object):
+                    if cls.is_existing_relation(
+                            relation_def=relation, selected_id=selected_object_id,
+                            related_id=related_object_ids[id(related_object)]):
                         continue
                     cls.add_relation_between(relation=relation,selected_object=selected_object,
                                              related_object=related_object)
 
             if relation.doel_uri == selected_object.typeURI:
                 for related_object in related_objects_dict[relation.bron_uri]:
-                    if cls.get_same_relations_in_list(
-                            relation_list=cls.existing_relations, relation_def=relation,
-                            selected_object=selected_object, related_object=related_object,
-                            reverse=True):
+                    if cls.is_existing_relation(
+                            relation_def=relation, selected_id=selected_object_id,
+                            related_id=related_object_ids[id(related_object)], reverse=True):
                         continue
                     cls.add_relation_between(relation=relation,selected_object=selected_object,
                                              related_object=related_object, reverse=True)
@@ -730,6 +905,15 @@ class RelationChangeDomain:
                 cls.possible_relations_per_class_dict[selected_typeURI] = (
                     RelationChangeDomain.get_all_concrete_relation_from_full_model(
                         selected_object=selected_object))
+            elif cls.possible_relation_matrix:
+                if cls.possible_relation_matrix.contains_class(selected_typeURI):
+                    cls.possible_relations_per_class_dict[selected_typeURI] = \
+                        cls.possible_relation_matrix.get_relations_for(typeURI=selected_typeURI)
+                else:
+                    OTLLogger.logger.debug(f"Didn't find relations in subset for {log_typeURI}")
+                    cls.possible_relations_per_class_dict[selected_typeURI] = (
+                        RelationChangeDomain.get_all_concrete_relation_from_full_model(
+                            selected_object=selected_object))
             else:
                 try:
                     cls.possible_relations_per_class_dict[selected_typeURI] = \
@@ -748,32 +932,57 @@ class RelationChangeDomain:
 
     @classmethod
     def get_hoortbij_relaties_from_legacy_asset(cls, selected_typeURI):
-        all_concrete_classes = []
-        all_classes_in_OTL = get_hardcoded_class_dict()
-        for otl_class in all_classes_in_OTL.keys():
-            if not otl_class.startswith("https://lgc"):
-                concrete_classes = [non_legacy_class for non_legacy_class in
-                                    get_concrete_subclasses_from_class_dict(otl_class) if
-                                    not non_legacy_class.startswith("https://lgc")]
-                all_concrete_classes.extend(concrete_classes)
-        all_concrete_classes = list(set(all_concrete_classes))
-        possible_relations = [
-            RelationChangeDomain.create_hoortbij_OSLORelatie_with_legacy_class(selected_typeURI,
-                                                                               concrete_class) for concrete_class in all_concrete_classes]
-        return possible_relations
+        if selected_typeURI not in cls.legacy_hoortbij_relations_dict:
+            cls.legacy_hoortbij_relations_dict[selected_typeURI] = [
+                RelationChangeDomain.create_hoortbij_OSLORelatie_with_legacy_class(
+                    selected_typeURI, concrete_class)
+                for concrete_class in cls.get_non_legacy_concrete_classes()]
+        # a new list because legacy relations get added to the possible relations of a class
+        return list(cls.legacy_hoortbij_relations_dict[selected_typeURI])
+
+    @classmethod
+    def get_non_legacy_concrete_classes(cls) -> list[str]:
+        """
+        Returns the typeURIs of all concrete classes of the OTL that are not legacy classes.
+        These only change with the otlmow-model version so they are stored in the ModelDataCache.
+
+        :return: the sorted typeURIs of the non-legacy concrete classes
+        :rtype: list[str]
+        """
+
+        def create_non_legacy_concrete_classes() -> list[str]:
+            all_concrete_classes = set()
+            for otl_class in get_hardcoded_class_dict().keys():
+                if not otl_class.startswith("https://lgc"):
+                    all_concrete_classes.update(
+                        non_legacy_class for non_legacy_class in
+                        get_concrete_subclasses_from_class_dict(otl_class) if
+                        not non_legacy_class.startswith("https://lgc"))
+            return sorted(all_concrete_classes)
+
+        return ModelDataCache.get(name="non_legacy_concrete_classes",
+                                  create_data=create_non_legacy_concrete_classes)
 
     @classmethod
     def create_hoortbij_OSLORelatie_with_legacy_class(cls, legacy_class_typeURI,
                                                       OTL_class_typeURI):
-        return OSLORelatie(
-            bron_overerving="",
-            doel_overerving="",
-            bron_uri=OTL_class_typeURI,
-            doel_uri=legacy_class_typeURI,
-            objectUri="https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#HoortBij",
-            richting="Source -> Destination",
-            deprecated_version="",
-            usagenote="")
+        """
+        Returns the HoortBij relation from an OTL class to a legacy class. The relations are
+        created once and shared, they should not be changed.
+        """
+
+        template_key = (legacy_class_typeURI, OTL_class_typeURI)
+        if template_key not in cls.hoortbij_OSLORelatie_templates:
+            cls.hoortbij_OSLORelatie_templates[template_key] = OSLORelatie(
+                bron_overerving="",
+                doel_overerving="",
+                bron_uri=OTL_class_typeURI,
+                doel_uri=legacy_class_typeURI,
+                objectUri="https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#HoortBij",
+                richting="Source -> Destination",
+                deprecated_version="",
+                usagenote="")
+        return cls.hoortbij_OSLORelatie_templates[template_key]
 
     @classmethod
     def get_all_concrete_relation_from_full_model(cls, selected_object:RelationInteractor):
@@ -789,6 +998,10 @@ class RelationChangeDomain:
         :rtype: list[OSLORelatie]
         """
 
+        if selected_object.typeURI in cls.full_model_relations_per_class_dict:
+            # the relations in the model don't change while the application runs
+            return list(cls.full_model_relations_per_class_dict[selected_object.typeURI])
+
         # noinspection PyProtectedMember
         all_relations = selected_object._get_all_concrete_relations()
         concrete_OSLO_relations: list[OSLORelatie] = [OSLORelatie(
@@ -800,7 +1013,8 @@ class RelationChangeDomain:
             richting=concrete_relation[3],
             deprecated_version=concrete_relation[4],
             usagenote="") for concrete_relation in all_relations]
-        return concrete_OSLO_relations
+        cls.full_model_relations_per_class_dict[selected_object.typeURI] = concrete_OSLO_relations
+        return list(concrete_OSLO_relations)
 
     @classmethod
     def get_same_relations_in_list(cls, relation_list: list[RelatieObject],
@@ -840,6 +1054,40 @@ class RelationChangeDomain:
                 ]
 
 
+    @classmethod
+    def is_existing_relation(cls, relation_def: OSLORelatie, selected_id: str, related_id: str,
+                             reverse: bool = False) -> bool:
+        """
+        Checks with the index of the existing relations if a relation matching the relation
+        definition already exists between the selected and related object. This gives the same
+        result as is_same_relation over all existing relations.
+
+        :param relation_def: The relation definition to match.
+        :type relation_def: OSLORelatie
+
+        :param selected_id: The corrected identificator of the selected object.
+        :type selected_id: str
+
+        :param related_id: The corrected identificator of the related object.
+        :type related_id: str
+
+        :param reverse: A boolean indicating whether to check for reverse relations. Defaults to False.
+        :type reverse: bool, optional
+
+        :return: True if a matching relation exists, otherwise False.
+        :rtype: bool
+        """
+
+        if relation_def.richting == "Unspecified":
+            return cls.existing_relations.contains_relation(
+                typeURI=relation_def.objectUri, source_id=selected_id, target_id=related_id,
+                undirected=True)
+        if reverse:
+            return cls.existing_relations.contains_relation(
+                typeURI=relation_def.objectUri, source_id=related_id, target_id=selected_id)
+        return cls.existing_relations.contains_relation(
+            typeURI=relation_def.objectUri, source_id=selected_id, target_id=related_id)
+
     @classmethod
     def is_same_relation(cls, existing_relation: RelatieObject, relation_def: OSLORelatie,
                          selected:RelationInteractor, related: RelationInteractor,
@@ -987,9 +1235,13 @@ class RelationChangeDomain:
         :rtype: Callable
         """
 
+        id_to_filter_for = RelationChangeHelpers.get_corrected_identificator(object_to_filter_for)
+        object_with_id_to_filter_for = cls.shown_objects_by_identificator.get(id_to_filter_for)
+
         def filter_func(related_object: RelationInteractor):
-            return (RelationChangeHelpers.get_corrected_identificator(object_to_filter_for) !=
-                    RelationChangeHelpers.get_corrected_identificator(related_object))
+            if related_object is object_with_id_to_filter_for:
+                return False
+            return id_to_filter_for != RelationChangeHelpers.get_corrected_identificator(related_object)
 
         return filter_func
 
@@ -1081,10 +1333,11 @@ class RelationChangeDomain:
             cls.get_screen().showMultiSelectionHeeftBetrokkeneAttributeDialogWindow(
                 data_list_and_relation_objects=data_list_and_relation_objects)
         else:
-            cls.last_added_to_existing = [
-                RelationChangeDomain.add_possible_relation_to_existing_relations(
-                    bron_asset_id=data.source_id,target_asset_id=data.target_id,
-                    relation_object_index=data.index) for data in data_list]
+            relation_objects = [
+                cls.possible_object_to_object_relations_dict[data.source_id][data.target_id].pop(
+                    data.index) for data in data_list]
+            cls.add_relation_objects_to_existing_relations(relation_objects=relation_objects)
+            cls.last_added_to_existing = relation_objects
         cls.update_frontend()
 
     @classmethod
@@ -1128,11 +1381,31 @@ class RelationChangeDomain:
 
         :return: None
         """
-        global_vars.current_project.visualisation_uptodate.insert_relation(relation_object)
-        relation_object.isActief = True
-        cls.existing_relations.append(relation_object)
-        cls.get_screen().expand_existing_relations_folder_of(
-            relation_typeURI=relation_object.typeURI)
+        cls.add_relation_objects_to_existing_relations(relation_objects=[relation_object])
+
+    @classmethod
+    def add_relation_objects_to_existing_relations(cls, relation_objects: list[RelatieObject]):
+        """
+        Adds multiple relation objects to the list of existing relations and marks them as active.
+        The visualisation state is updated once for all relations and the folder of each relation
+        type is expanded once.
+
+        :param relation_objects: The relation objects to be added to the existing relations.
+        :type relation_objects: list[RelatieObject]
+
+        :return: None
+        """
+        global_vars.current_project.visualisation_uptodate.insert_relations(relation_objects)
+        for relation_object in relation_objects:
+            relation_object.isActief = True
+            global_vars.current_project.record_quick_save_change(
+                change=(QuickSaveChange.MODIFY if cls.is_aim_id_relation(relation_object)
+                        else QuickSaveChange.ADD),
+                otl_object=relation_object)
+        cls.existing_relations.extend(relation_objects)
+        for relation_typeURI in dict.fromkeys(relation_object.typeURI
+                                              for relation_object in relation_objects):
+            cls.get_screen().expand_existing_relations_folder_of(relation_typeURI=relation_typeURI)
 
 
 
@@ -1197,7 +1470,7 @@ class RelationChangeDomain:
         :return: None
         """
 
-        cls.last_added_to_possible = [cls.remove_existing_relation(index) for index in indices]
+        cls.last_added_to_possible = cls.remove_existing_relations(indices)
 
         cls.update_frontend()
 
@@ -1215,15 +1488,56 @@ class RelationChangeDomain:
         :rtype: RelatieObject
         """
 
-        removed_relation = cls.existing_relations.pop(index)
-        global_vars.current_project.visualisation_uptodate.remove_relation(removed_relation)
-        # if the removed relation already had an AIM ID it is set to false and kept if not it is
-        # removed and made again in the possible relations
-        removed_relation.isActief = False
-        cls.get_screen().expand_possible_relations_folder_of(
-            relation_typeURI=removed_relation.typeURI)
+        return cls.remove_existing_relations([index])[0]
 
-        return removed_relation
+    @classmethod
+    def remove_existing_relations(cls, indices: list[int]) -> list[RelatieObject]:
+        """
+        Removes multiple existing relations based on their indices in the list of existing
+        relations. The visualisation state is updated once for all relations and the folder of
+        each relation type is expanded once.
+
+        :param indices: The indices of the existing relations to be removed.
+        :type indices: list[int]
+
+        :return: The removed relation objects, in the order of the indices.
+        :rtype: list[RelatieObject]
+        """
+
+        removed_relations = [cls.existing_relations[index] for index in indices]
+        # delete from the highest index down so the other indices stay valid
+        for index in sorted(set(indices), reverse=True):
+            cls.existing_relations.pop(index)
+        global_vars.current_project.visualisation_uptodate.remove_relations(removed_relations)
+
+        for removed_relation in removed_relations:
+            # if the removed relation already had an AIM ID it is set to false and kept if not it
+            # is removed and made again in the possible relations
+            removed_relation.isActief = False
+            global_vars.current_project.record_quick_save_change(
+                change=(QuickSaveChange.MODIFY if cls.is_aim_id_relation(removed_relation)
+                        else QuickSaveChange.REMOVE),
+                otl_object=removed_relation)
+        for relation_typeURI in dict.fromkeys(removed_relation.typeURI
+                                              for removed_relation in removed_relations):
+            cls.get_screen().expand_possible_relations_folder_of(relation_typeURI=relation_typeURI)
+
+        return removed_relations
+
+    @classmethod
+    def is_aim_id_relation(cls, relation_object: RelatieObject) -> bool:
+        """
+        Checks if the relation object is one of the relations that were already in DAVIE.
+        These relations are kept (inactive) in the quick save when they are removed.
+
+        :param relation_object: The relation object to check.
+        :type relation_object: RelatieObject
+
+        :return: True if the relation object is an AIM ID relation, otherwise False.
+        :rtype: bool
+        """
+
+        return any(aim_id_relation is relation_object for aim_id_relation in cls.aim_id_relations)
 
     @classmethod
     async def select_existing_relation_indices(cls, indices: list[int]) -> None:
@@ -1433,6 +1747,11 @@ class RelationChangeDomain:
             cls.external_objects.append(new_external_object)
 
         cls.shown_objects.append(new_external_object)
+        cls.add_to_shown_objects_index(new_external_object)
+        cls.display_records.get_record(new_external_object)
+
+        global_vars.current_project.record_quick_save_change(change=QuickSaveChange.ADD,
+                                                             otl_object=new_external_object)
 
         cls.regenerate_relation_types = True
 
@@ -31,12 +31,8 @@ class CombineAssetHelper:
                 if len(asset_list) == 1:
                     combined_assets.append(asset_list[0])
                 else:
-                    combined_asset = cls.combine_two_asset_instances(asset_list[0], asset_list[1],
-                                                                 model_directory)
-                    for asset in asset_list[2:]:
-                        combined_asset = cls.combine_two_asset_instances(combined_asset, asset,
-                                                                     model_directory)
-                    combined_assets.append(combined_asset)
+                    combined_assets.append(cls.combine_asset_instances(asset_list,
+                                                                       model_directory))
 
             except CannotCombineAssetsWithDifferentTypeError as ex:
                 object_id = ex.object_id
@@ -78,57 +74,85 @@ class CombineAssetHelper:
         if asset1 is None or asset2 is None:
             raise ValueError('One of the assets is None')
 
-        id1 = asset1.assetId.identificator if asset1.typeURI != 'http://purl.org/dc/terms/Agent' \
-            else asset1.agentId.identificator
-        id2 = asset2.assetId.identificator if asset2.typeURI != 'http://purl.org/dc/terms/Agent' \
-            else asset2.agentId.identificator
-
-        if id1 is None or id2 is None:
-            raise NoIdentificatorError('One of the assets has no assetId.identificator')
-
-        if id1 != id2:
-            ex = CannotCombineAssetsWithDifferentIdError(
-                'The assets have different identificator values')
-            ex.attribute_errors = [('identificator', (id1, id2))]
-            ex.type_uri = asset1.typeURI
-            raise ex
-
-        if asset1.typeURI != asset2.typeURI:
-            ex = CannotCombineAssetsWithDifferentTypeError('The assets have different types')
-            ex.attribute_errors = [('typeURI', (asset1.typeURI, asset2.typeURI))]
-            ex.object_id = id1
-            raise ex
-
-        ddict1 = DotnotationDictConverter.to_dict(asset1)
-        ddict2 = DotnotationDictConverter.to_dict(asset2)
-        if asset2.typeURI == 'http://purl.org/dc/terms/Agent':
-            ddict2.pop('agentId.identificator')
-        else:
-            ddict2.pop('assetId.identificator')
-
-        attribute_errors = []
-        for key, value in ddict2.items():
-            if value is None:
-                continue
-            if key == 'typeURI':
-                continue
-
-            if key in ddict1 and ddict1[key] is not None and ddict1[key] != value:
-                attribute_errors.append((key, ddict1[key], value))
+        return cls.combine_asset_instances([asset1, asset2], model_directory)
+
+    @classmethod
+    def get_identificator(cls, asset: OTLObject):
+        if asset.typeURI == 'http://purl.org/dc/terms/Agent':
+            return asset.agentId.identificator
+        return asset.assetId.identificator
+
+    @classmethod
+    def combine_asset_instances(cls, asset_list: list[OTLObject],
+                                model_directory: Path = None) -> OTLObject:
+        """
+        Combines the fragments of an asset in a single pass: every fragment is converted to a
+        dotnotation dict once, the values are merged in the order of the fragments and only the
+        combined asset is created. The errors are the same as when the fragments are combined
+        one by one with combine_two_asset_instances: the first fragment that has another
+        identificator, type or conflicting attribute values raises the error.
+
+        :param asset_list: the fragments of the asset, at least one
+        :type asset_list: list[OTLObject]
+        :param model_directory: the directory of the otlmow model to create the asset with
+        :type model_directory: Path
+        :return: the combined asset
+        :rtype: OTLObject
+        """
+
+        first_asset = asset_list[0]
+        id1 = cls.get_identificator(first_asset)
+        combined_ddict = DotnotationDictConverter.to_dict(first_asset)
+
+        for asset in asset_list[1:]:
+            id2 = cls.get_identificator(asset)
+            if id1 is None or id2 is None:
+                raise NoIdentificatorError('One of the assets has no assetId.identificator')
+
+            if id1 != id2:
+                ex = CannotCombineAssetsWithDifferentIdError(
+                    'The assets have different identificator values')
+                ex.attribute_errors = [('identificator', (id1, id2))]
+                ex.type_uri = first_asset.typeURI
+                raise ex
+
+            if first_asset.typeURI != asset.typeURI:
+                ex = CannotCombineAssetsWithDifferentTypeError('The assets have different types')
+                ex.attribute_errors = [('typeURI', (first_asset.typeURI, asset.typeURI))]
+                ex.object_id = id1
+                raise ex
+
+            ddict = DotnotationDictConverter.to_dict(asset)
+            if asset.typeURI == 'http://purl.org/dc/terms/Agent':
+                ddict.pop('agentId.identificator')
             else:
-                ddict1[key] = value
-
-        if attribute_errors:
-            error_str = '\n'.join(
-                [f'{key}: {ddict1[key]}, {value}' for key, _, value in sorted(attribute_errors)])
-            ex = CannotCombineAssetsError(
-                message=f'Cannot combine the assets with id {id1} because some attributes '
-                        'have conflicting values:\n'
-                        f'{error_str}')
-            ex.object_id = id1
-            ex.type_uri = asset1.typeURI
-            ex.attribute_errors = [(key, (ddict1[key], value)) for key, _, value in
-                                   attribute_errors]
-            raise ex
-
-        return DotnotationDictConverter.from_dict(ddict1, model_directory=model_directory)
\ No newline at end of file
+                ddict.pop('assetId.identificator')
+
+            attribute_errors = []
+            for key, value in ddict.items():
+                if value is None:
+                    continue
+                if key == 'typeURI':
+                    continue
+
+                combined_value = combined_ddict.get(key)
+                if combined_value is not None and combined_value != value:
+                    attribute_errors.append((key, combined_value, value))
+                else:
+                    combined_ddict[key] = value
+
+            if attribute_errors:
+                error_str = '\n'.join(
+                    [f'{key}: {combined_value}, {value}'
+                     for key, combined_value, value in sorted(attribute_errors)])
+                ex = CannotCombineAssetsError(
+                    message=f'Cannot combine the assets with id {id1} because some attributes '
+                            'have conflicting values:\n'
+                            f'{error_str}')
+                ex.object_id = id1
+                ex.type_uri = first_asset.typeURI
+                ex.attribute_errors = [(key, (combined_value, value))
+                                       for key, combined_value, value in attribute_errors]
+                raise ex
+
+        return DotnotationDictConverter.from_dict(combined_ddict, model_directory=model_directory)
@@ -0,0 +1,134 @@
+from typing import Iterable, NamedTuple, Optional
+
+from otlmow_model.OtlmowModel.BaseClasses.RelationInteractor import RelationInteractor
+from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper
+
+from otlmow_gui.Domain import global_vars
+from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import \
+    RelationChangeHelpers
+from otlmow_gui.GUI.translation.GlobalTranslate import GlobalTranslate
+
+
+class DisplayRecord(NamedTuple):
+    identificator: str
+    screen_name: str
+    abbreviated_id: str
+    type_name: str
+    namespaced_type_name: str
+    is_external: bool
+    icon_key: str
+
+    def get_abbreviated_typeURI(self, add_namespace: bool = False) -> str:
+        return self.namespaced_type_name if add_namespace else self.type_name
+
+
+class DisplayRecordCache:
+    """
+    The texts that are shown for an object in the lists of the RelationChangeScreen and in the
+    map popups, computed once per object instead of on every refresh of the lists.
+
+    A record is made again when an attribute that is shown (identificator, toegekendDoor or
+    naam) of its object is changed, all records are made again when the language changes.
+    """
+
+    agent_typeURI = 'http://purl.org/dc/terms/Agent'
+
+    def __init__(self):
+        # keyed on id(), the objects themselves aren't hashable, the object is kept with its
+        # record so its id can't be reused by another object
+        self.records: dict[int, tuple[RelationInteractor, tuple, DisplayRecord]] = {}
+        self.translate = GlobalTranslate.instance
+
+    @classmethod
+    def get_shown_attributes(cls, otl_object: RelationInteractor) -> tuple:
+        if hasattr(otl_object, "assetId"):
+            return (otl_object.assetId.identificator, otl_object.assetId.toegekendDoor,
+                    getattr(otl_object, 'naam', None))
+        if hasattr(otl_object, "agentId"):
+            return otl_object.agentId.identificator, None, getattr(otl_object, 'naam', None)
+        return None, None, None
+
+    @classmethod
+    def create_record(cls, otl_object: RelationInteractor) -> DisplayRecord:
+        identificator = RelationChangeHelpers.get_corrected_identificator(otl_object)
+        is_relation = OTLObjectHelper.is_relation(otl_object)
+
+        is_agent = otl_object.typeURI == cls.agent_typeURI
+        is_external = is_agent or (
+            hasattr(otl_object, "assetId") and
+            otl_object.assetId.toegekendDoor == global_vars.external_toegekendDoor_label)
+
+        icon_key = "asset"
+        if is_relation:
+            icon_key = "relation"
+        elif is_agent:
+            icon_key = "agent"
+        elif otl_object.typeURI.startswith('https://lgc.'):
+            icon_key = "legacy"
+
+        return DisplayRecord(
+            identificator=identificator,
+            screen_name=RelationChangeHelpers.get_screen_name(otl_object),
+            abbreviated_id=RelationChangeHelpers.abbreviate_if_AIM_id(identificator),
+            type_name=RelationChangeHelpers.get_abbreviated_typeURI(
+                otl_object.typeURI, add_namespace=False, is_relation=is_relation),
+            namespaced_type_name=RelationChangeHelpers.get_abbreviated_typeURI(
+                otl_object.typeURI, add_namespace=True, is_relation=is_relation),
+            is_external=is_external,
+            icon_key=icon_key)
+
+    def get_record(self, otl_object: Optional[RelationInteractor]) -> Optional[DisplayRecord]:
+        """
+        Returns the display record of the object, the record is made if the object doesn't
+        have one yet or if a shown attribute of the object changed since it was made.
+
+        :param otl_object: the object to get the record of
+        :type otl_object: Optional[RelationInteractor]
+        :return: the record, None for None
+        :rtype: Optional[DisplayRecord]
+        """
+        if otl_object is None:
+            return None
+        self.check_language()
+
+        shown_attributes = self.get_shown_attributes(otl_object)
+        cached = self.records.get(id(otl_object))
+        if cached is not None and cached[0] is otl_object and cached[1] == shown_attributes:
+            return cached[2]
+
+        record = self.create_record(otl_object)
+        self.records[id(otl_object)] = (otl_object, shown_attributes, record)
+        return record
+
+    def build_records(self, otl_objects: Iterable[RelationInteractor]) -> None:
+        """
+        Makes the records of the objects that enter the RelationChangeDomain, the records of
+        objects that aren't given are dropped.
+
+        :param otl_objects: all objects the records are kept for
+        :type otl_objects: Iterable[RelationInteractor]
+        :return: None
+        """
+        otl_objects = list(otl_objects)
+        self.check_language()
+        previous_records = self.records
+        self.records = {}
+        for otl_object in otl_objects:
+            cached = previous_records.get(id(otl_object))
+            if cached is not None and cached[0] is otl_object:
+                self.records[id(otl_object)] = cached
+        for otl_object in otl_objects:
+            self.get_record(otl_object)
+
+    def invalidate(self, otl_objects: Optional[Iterable[RelationInteractor]] = None) -> None:
+        if otl_objects is None:
+            self.records.clear()
+            return
+        for otl_object in otl_objects:
+            self.records.pop(id(otl_object), None)
+
+    def check_language(self) -> None:
+        # the screen names contain translated texts, a new translation replaces all records
+        if GlobalTranslate.instance is not self.translate:
+            self.translate = GlobalTranslate.instance
+            self.records.clear()
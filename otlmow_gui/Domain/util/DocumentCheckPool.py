@@ -0,0 +1,166 @@
+import asyncio
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Union
+
+from otlmow_converter.Exceptions.ExceptionsGroup import ExceptionsGroup
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, create_dict_from_asset
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+
+CheckDocumentFunction = Callable[[Path], Awaitable[tuple[list[OTLObject], ExceptionsGroup]]]
+CheckDocumentResult = tuple[Path, list[OTLObject], Union[ExceptionsGroup, Exception]]
+
+
+def init_worker() -> None:
+    """Runs once in every worker process, the logger of the application is not set up there."""
+    OTLLogger.logger = OTLLogger("otlmow_gui.worker")
+
+
+def check_document_in_worker(doc_location: str) -> tuple[list[dict], tuple]:
+    """
+    Checks a document in a worker process with InsertDataDomain.check_document.
+
+    OTL objects and the exceptions of otlmow-converter can't be pickled, so the objects are
+    returned as dicts and the exceptions as (type, args, attributes).
+    """
+
+    # imported here, InsertDataDomain uses this module
+    from otlmow_gui.Domain.step_domain.InsertDataDomain import InsertDataDomain
+
+    objects, exception_group = asyncio.run(InsertDataDomain.check_document(doc_location))
+    return reduce_result(objects, exception_group)
+
+
+def reduce_result(objects: list[OTLObject], exception_group: ExceptionsGroup) -> tuple[list[dict],
+                                                                                       tuple]:
+    """Converts the result of check_document to a form that can be pickled, see rebuild_result."""
+    object_dicts = [create_dict_from_asset(otl_object, waarde_shortcut=True, cast_datetime=True,
+                                           warn_for_non_otl_conform_attributes=False)
+                    for otl_object in objects]
+    return object_dicts, reduce_exception(exception_group)
+
+
+def reduce_exception(exception: BaseException) -> tuple:
+    state = {}
+    for attribute_name, value in vars(exception).items():
+        if isinstance(value, BaseException):
+            state[attribute_name] = reduce_exception(value)
+        elif attribute_name == "exceptions" and isinstance(value, list):
+            state[attribute_name] = [reduce_exception(ex) for ex in value]
+        else:
+            try:
+                pickle.dumps(value)
+                state[attribute_name] = value
+            except Exception:
+                # e.g. the OTL objects in ExceptionsGroup.objects
+                state[attribute_name] = None
+    return type(exception), exception.args, state
+
+
+def rebuild_exception(reduced_exception: tuple) -> BaseException:
+    exception_type, args, state = reduced_exception
+    exception = exception_type.__new__(exception_type)
+    exception.args = args
+    for attribute_name, value in state.items():
+        if attribute_name == "exceptions" and isinstance(value, list):
+            value = [rebuild_exception(ex) for ex in value]
+        elif isinstance(value, tuple) and len(value) == 3 and isinstance(value[0], type) and \
+                issubclass(value[0], BaseException):
+            value = rebuild_exception(value)
+        setattr(exception, attribute_name, value)
+    return exception
+
+
+class DocumentCheckPool:
+    """
+    Checks multiple documents concurrently in a pool of worker processes.
+
+    Converting a document to OTL objects is CPU bound, running it in worker processes keeps the
+    event loop of the GUI responsive and uses multiple cores for projects with many files.
+    The results are yielded as soon as a document is checked. When there is only one worker or
+    one document, or the worker processes can't be used, the documents are checked in this process.
+    """
+
+    @classmethod
+    async def check_documents(cls, doc_locations: list[Path],
+                              check_document: CheckDocumentFunction,
+                              worker_count: int) -> AsyncIterator[CheckDocumentResult]:
+        """
+        Checks the documents and yields (document, objects, exception group) per document in the
+        order in which they are finished. If check_document raised an exception for a document,
+        that exception is yielded instead of the exception group.
+
+        :param doc_locations: the paths of the documents to check
+        :type doc_locations: list[Path]
+        :param check_document: the coroutine function that checks a document in this process
+        :type check_document: CheckDocumentFunction
+        :param worker_count: the maximum number of worker processes
+        :type worker_count: int
+        """
+
+        if worker_count <= 1 or len(doc_locations) <= 1:
+            for doc_location in doc_locations:
+                yield await cls.check_document_in_this_process(doc_location, check_document)
+            return
+
+        loop = asyncio.get_running_loop()
+        remaining_doc_locations = list(doc_locations)
+        try:
+            # spawn instead of fork, forking a process that runs Qt is not safe
+            with ProcessPoolExecutor(max_workers=min(worker_count, len(doc_locations)),
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=init_worker) as executor:
+                pending: dict[asyncio.Future, Path] = {
+                    loop.run_in_executor(executor, check_document_in_worker, str(doc_location)):
+                        doc_location
+                    for doc_location in doc_locations}
+
+                while pending:
+                    done, _ = await asyncio.wait(pending.keys(),
+                                                 return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        doc_location = pending.pop(future)
+                        try:
+                            objects, exception_group = cls.rebuild_result(future.result())
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            OTLLogger.logger.warning(
+                                f"Checking {doc_location.name} in a worker process failed, "
+                                f"checking it in the application instead: {e}")
+                            remaining_doc_locations.remove(doc_location)
+                            yield await cls.check_document_in_this_process(doc_location,
+                                                                           check_document)
+                            continue
+                        remaining_doc_locations.remove(doc_location)
+                        yield doc_location, objects, exception_group
+        except BrokenProcessPool as e:
+            OTLLogger.logger.warning(f"Worker processes stopped, checking the remaining documents "
+                                     f"in the application instead: {e}")
+            for doc_location in remaining_doc_locations:
+                yield await cls.check_document_in_this_process(doc_location, check_document)
+
+    @classmethod
+    async def check_document_in_this_process(cls, doc_location: Path,
+                                             check_document: CheckDocumentFunction) \
+            -> CheckDocumentResult:
+        try:
+            objects, exception_group = await check_document(doc_location)
+            return doc_location, objects, exception_group
+        except Exception as ex:
+            return doc_location, [], ex
+
+    @classmethod
+    def rebuild_result(cls, result: tuple[list[dict], tuple]) -> tuple[list[OTLObject],
+                                                                        ExceptionsGroup]:
+        object_dicts, reduced_exception_group = result
+        objects = [OTLObject.from_dict(object_dict, waarde_shortcut=True, cast_datetime=True,
+                                       warn_for_non_otl_conform_attributes=False)
+                   for object_dict in object_dicts]
+        # noinspection PyTypeChecker
+        exception_group: ExceptionsGroup = rebuild_exception(reduced_exception_group)
+        return objects, exception_group
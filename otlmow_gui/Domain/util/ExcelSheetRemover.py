@@ -0,0 +1,132 @@
+import html
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+
+SHEET_PATTERN = re.compile(r'<sheet\b[^>]*?/>')
+DEFINED_NAME_PATTERN = re.compile(r'<definedName\b([^>]*)>(.*?)</definedName>', re.DOTALL)
+RELATIONSHIP_PATTERN = re.compile(r'<Relationship\b[^>]*?/>')
+OVERRIDE_PATTERN = re.compile(r'<Override\b[^>]*?/>')
+
+
+def get_attribute(element: str, attribute_name: str) -> str:
+    """Returns the value of an attribute of an xml element, the name may include a prefix."""
+    match = re.search(rf'\s{attribute_name}="([^"]*)"', element)
+    return html.unescape(match[1]) if match else None
+
+
+class ExcelSheetRemover:
+    """
+    Removes sheets from an .xlsx file by rewriting only the zip entries that describe the
+    workbook, the cell data of the other sheets is copied without being parsed.
+
+    An .xlsx file is a zip with a workbook manifest (xl/workbook.xml), its relations
+    (xl/_rels/workbook.xml.rels), the content types ([Content_Types].xml) and one xml file per
+    worksheet. Removing a sheet means removing it from those three files and leaving out its
+    worksheet file. The xml is edited as text: the namespace prefixes have to stay exactly the
+    same for Excel to open the result.
+    """
+
+    workbook_path = 'xl/workbook.xml'
+    workbook_rels_path = 'xl/_rels/workbook.xml.rels'
+    content_types_path = '[Content_Types].xml'
+
+    @classmethod
+    def remove_sheets(cls, source_path: Path, target_path: Path, sheet_names: list[str]) -> bool:
+        """
+        Writes a copy of the workbook at source_path without the given sheets to target_path.
+
+        :param source_path: the path of the .xlsx file
+        :type source_path: Path
+        :param target_path: the path to write the copy to, can't be the same as source_path
+        :type target_path: Path
+        :param sheet_names: the names of the sheets to remove, missing sheets are ignored
+        :type sheet_names: list[str]
+        :return: False if the workbook has none of the sheets, then nothing is written
+        :rtype: bool
+        :raises zipfile.BadZipFile: if the file is not an .xlsx file
+        :raises KeyError: if the workbook manifest is missing
+        """
+
+        with zipfile.ZipFile(source_path) as source_zip:
+            workbook_xml = source_zip.read(cls.workbook_path).decode('utf-8')
+            sheets = SHEET_PATTERN.findall(workbook_xml)
+            removed_indices = [index for index, sheet in enumerate(sheets)
+                               if get_attribute(sheet, 'name') in sheet_names]
+            if not removed_indices:
+                return False
+
+            removed_sheets = [sheets[index] for index in removed_indices]
+            removed_rel_ids = {get_attribute(sheet, r'\w+:id') for sheet in removed_sheets}
+            removed_names = [get_attribute(sheet, 'name') for sheet in removed_sheets]
+
+            rels_xml = source_zip.read(cls.workbook_rels_path).decode('utf-8')
+            removed_parts = set()
+            for relationship in RELATIONSHIP_PATTERN.findall(rels_xml):
+                if get_attribute(relationship, 'Id') in removed_rel_ids:
+                    removed_parts.add(cls.get_part_name(get_attribute(relationship, 'Target')))
+                    rels_xml = rels_xml.replace(relationship, '', 1)
+            removed_parts |= {posixpath.join(posixpath.dirname(part), '_rels',
+                                             f'{posixpath.basename(part)}.rels')
+                              for part in list(removed_parts)}
+
+            content_types_xml = source_zip.read(cls.content_types_path).decode('utf-8')
+            for override in OVERRIDE_PATTERN.findall(content_types_xml):
+                if get_attribute(override, 'PartName').lstrip('/') in removed_parts:
+                    content_types_xml = content_types_xml.replace(override, '', 1)
+
+            workbook_xml = cls.remove_sheets_from_workbook_xml(
+                workbook_xml=workbook_xml, sheets=sheets, removed_indices=removed_indices,
+                removed_names=removed_names)
+
+            changed_entries = {cls.workbook_path: workbook_xml,
+                               cls.workbook_rels_path: rels_xml,
+                               cls.content_types_path: content_types_xml}
+            with zipfile.ZipFile(target_path, mode='w') as target_zip:
+                for zip_info in source_zip.infolist():
+                    if zip_info.filename in removed_parts:
+                        continue
+                    if zip_info.filename in changed_entries:
+                        target_zip.writestr(zip_info,
+                                            changed_entries[zip_info.filename].encode('utf-8'))
+                    else:
+                        target_zip.writestr(zip_info, source_zip.read(zip_info))
+        return True
+
+    @classmethod
+    def get_part_name(cls, target: str) -> str:
+        # the target of a workbook relation is relative to xl/ unless it starts with /
+        if target.startswith('/'):
+            return target.lstrip('/')
+        return posixpath.normpath(posixpath.join('xl', target))
+
+    @classmethod
+    def remove_sheets_from_workbook_xml(cls, workbook_xml: str, sheets: list[str],
+                                        removed_indices: list[int],
+                                        removed_names: list[str]) -> str:
+        for index in removed_indices:
+            workbook_xml = workbook_xml.replace(sheets[index], '', 1)
+
+        def new_index(old_index: int) -> int:
+            if old_index in removed_indices:
+                return 0
+            return old_index - len([index for index in removed_indices if index < old_index])
+
+        def replace_index_attribute(match: re.Match) -> str:
+            return f'{match[1]}="{new_index(int(match[2]))}"'
+
+        # the tabs of the workbook view and the sheet local names refer to the sheets by index
+        workbook_xml = re.sub(r'(\s(?:activeTab|firstSheet))="(\d+)"', replace_index_attribute,
+                              workbook_xml)
+
+        def replace_defined_name(match: re.Match) -> str:
+            local_sheet_id = get_attribute(match[0], 'localSheetId')
+            if local_sheet_id is not None and int(local_sheet_id) in removed_indices:
+                return ''
+            formula = html.unescape(match[2])
+            if any(f'{name}!' in formula or f"'{name}'!" in formula for name in removed_names):
+                return ''
+            return re.sub(r'(\slocalSheetId)="(\d+)"', replace_index_attribute, match[0])
+
+        return DEFINED_NAME_PATTERN.sub(replace_defined_name, workbook_xml)
@@ -0,0 +1,94 @@
+from collections import defaultdict
+from typing import Iterator, Optional, Union
+
+from otlmow_model.OtlmowModel.Classes.ImplementatieElement.RelatieObject import RelatieObject
+
+
+class ExistingRelationStore:
+    """
+    Ordered collection of the existing relations with an index on
+    (relation typeURI, source identificator, target identificator).
+
+    The order of the relations is kept so the indices used by the ExistingRelationListWidget
+    keep pointing to the same relation, while checking if a relation between 2 objects already
+    exists does not need to go over all relations.
+    """
+
+    def __init__(self, relations: Optional[list[RelatieObject]] = None):
+        self.relations: list[RelatieObject] = []
+        self.relations_by_key: dict[tuple[str, str, str], list[RelatieObject]] = defaultdict(list)
+        if relations:
+            self.extend(relations)
+
+    @classmethod
+    def get_key(cls, relation_object: RelatieObject) -> tuple[str, str, str]:
+        return (relation_object.typeURI, relation_object.bronAssetId.identificator,
+                relation_object.doelAssetId.identificator)
+
+    def append(self, relation_object: RelatieObject) -> None:
+        self.relations.append(relation_object)
+        self.relations_by_key[self.get_key(relation_object)].append(relation_object)
+
+    def extend(self, relation_objects: list[RelatieObject]) -> None:
+        for relation_object in relation_objects:
+            self.append(relation_object)
+
+    def pop(self, index: int = -1) -> RelatieObject:
+        relation_object = self.relations.pop(index)
+
+        key = self.get_key(relation_object)
+        same_key_relations = self.relations_by_key[key]
+        for i, same_key_relation in enumerate(same_key_relations):
+            if same_key_relation is relation_object:
+                same_key_relations.pop(i)
+                break
+        if not same_key_relations:
+            del self.relations_by_key[key]
+
+        return relation_object
+
+    def clear(self) -> None:
+        self.relations.clear()
+        self.relations_by_key.clear()
+
+    def contains_relation(self, typeURI: str, source_id: str, target_id: str,
+                          undirected: bool = False) -> bool:
+        """
+        Checks if a relation of the given type exists between the source and target.
+
+        :param typeURI: The typeURI of the relation.
+        :type typeURI: str
+        :param source_id: The identificator of the source of the relation.
+        :type source_id: str
+        :param target_id: The identificator of the target of the relation.
+        :type target_id: str
+        :param undirected: If True, a relation from target to source also counts.
+        :type undirected: bool
+        :return: True if such a relation exists, otherwise False.
+        :rtype: bool
+        """
+
+        if (typeURI, source_id, target_id) in self.relations_by_key:
+            return True
+        return undirected and (typeURI, target_id, source_id) in self.relations_by_key
+
+    def get_relations(self, typeURI: str, source_id: str, target_id: str) -> list[RelatieObject]:
+        return list(self.relations_by_key.get((typeURI, source_id, target_id), []))
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self.relations[index]
+
+    def __iter__(self) -> Iterator[RelatieObject]:
+        return iter(self.relations)
+
+    def __len__(self) -> int:
+        return len(self.relations)
+
+    def __contains__(self, relation_object: RelatieObject) -> bool:
+        return relation_object in self.relations_by_key.get(self.get_key(relation_object), [])
+
+    def __add__(self, other: list[RelatieObject]) -> list[RelatieObject]:
+        return self.relations + list(other)
+
+    def __radd__(self, other: list[RelatieObject]) -> list[RelatieObject]:
+        return list(other) + self.relations
@@ -1,5 +1,7 @@
 
 import base64
+import importlib.metadata
+import json
 import os
 import subprocess
 import sys
@@ -15,12 +17,13 @@ from otlmow_converter.OtlmowConverter import OtlmowConverter
 from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, \
     dynamic_create_instance_from_ns_and_name, dynamic_create_instance_from_uri
 
-from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper
-from otlmow_model.OtlmowModel.Helpers.GenericHelper import validate_guid, get_ns_and_name_from_uri, \
+from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper, RelationValidator
+from otlmow_model.OtlmowModel.Helpers.GenericHelper import validate_guid, \
     get_titlecase_from_ns
-from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_class_dict, get_hardcoded_relation_dict
+from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_class_dict
 from packaging.version import Version
 
+from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.GUI.dialog_windows.LoadingImageWindow import add_loading_screen
 from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import RelationChangeHelpers
@@ -29,25 +32,64 @@ from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import
 
 class Helpers:
     all_OTL_asset_types_dict = {}
+    # the values of all_OTL_asset_types_dict, for membership tests
+    all_OTL_asset_typeURIs: set[str] = set()
+    # the result of RelationValidator.is_valid_relation per relation type, bron and doel typeURI
+    valid_relation_cache: dict[tuple[type, str, str], bool] = {}
+    otlmow_model_version: Optional[str] = None
+    otlmow_converter_version: Optional[str] = None
 
     @classmethod
     def get_hardcoded_class_dict(cls) -> dict:
         return get_hardcoded_class_dict()
 
+    @classmethod
+    def get_otlmow_model_version(cls) -> str:
+        """
+        Returns the version of the otlmow-model library that is in use, determined the same way
+        as Updater.get_local_otl_model_library_version. The version is only determined once per
+        run of the application and is used to key caches of data derived from the model.
+
+        :return: the version of the otlmow-model library
+        :rtype: str
+        """
+
+        if cls.otlmow_model_version is None:
+            version_file_path = (ProgramFileStructure.get_dynamic_library_path("otlmow_model") /
+                                 "version_info.json")
+            if version_file_path.exists():
+                with open(version_file_path) as version_file:
+                    cls.otlmow_model_version = json.load(version_file)["current"]["model_version"]
+            else:
+                cls.otlmow_model_version = importlib.metadata.metadata("otlmow-model")['Version']
+        return cls.otlmow_model_version
+
+    @classmethod
+    def get_otlmow_converter_version(cls) -> str:
+        """
+        Returns the version of the otlmow-converter library that is in use, to key caches of
+        documents converted with it.
+
+        :return: the version of the otlmow-converter library
+        :rtype: str
+        """
+
+        if cls.otlmow_converter_version is None:
+            cls.otlmow_converter_version = importlib.metadata.version("otlmow-converter")
+        return cls.otlmow_converter_version
+
     @classmethod
     def create_external_typeURI_options(cls):
+        # imported here, the ModelDataCache behind the catalogue uses Helpers itself
+        from otlmow_gui.Domain.database.ClassCatalogue import ClassCatalogue
+
         cls.all_OTL_asset_types_dict = {}
-        all_type_uris = cls.get_hardcoded_class_dict()
         buckets_dict = {'assets': {}, 'legacy':{}}
 
-        for uri, info in all_type_uris.items():
-            if info['abstract']:
-                continue
-            if uri in get_hardcoded_relation_dict():
-                continue
-
-            ns, name = get_ns_and_name_from_uri(uri)
-            screen_name = info['name'] if ns == 'legacy' else info['label']
+        for entry in ClassCatalogue.get_non_abstract_entries(otl_assets_only=True):
+            uri = entry.typeURI
+            ns = entry.namespace
+            screen_name = entry.name if ns == 'legacy' else entry.label
             if ns is not None:
                 screen_name += f" ({get_titlecase_from_ns(ns)})"
 
@@ -62,6 +104,22 @@ class Helpers:
         # combine and sort the dictionary by keys (screen name)
         cls.all_OTL_asset_types_dict = dict(sorted(buckets_dict['assets'].items()))
         cls.all_OTL_asset_types_dict.update(dict(sorted(buckets_dict['legacy'].items())))
+        cls.all_OTL_asset_typeURIs = set(cls.all_OTL_asset_types_dict.values())
+
+    @classmethod
+    def get_external_typeURI_options(cls) -> dict[str, str]:
+        """
+        Returns the typeURIs that can be chosen for an external asset, keyed on their screen name.
+        The options are made from the class catalogue the first time they are needed.
+
+        :return: the typeURI per screen name, sorted on screen name with the legacy types last
+        :rtype: dict[str, str]
+        """
+
+        if not cls.all_OTL_asset_types_dict:
+            cls.create_external_typeURI_options()
+        return cls.all_OTL_asset_types_dict
+
 
     @classmethod
     def sort_nested_dict(cls, dictionary, by='keys'):
@@ -238,14 +296,19 @@ class Helpers:
         except ValueError:
             return None
 
+    @classmethod
+    def create_id_to_typeURI_dict(cls, ref_assets: Iterable[OTLObject]) -> dict[str, str]:
+        return {RelationChangeHelpers.get_corrected_identificator(asset): asset.typeURI
+                for asset in ref_assets}
+
     @classmethod
     def extract_corrected_relation_partner_typeURI(cls, partner_type_uri, partner_id,
                                                    id_to_typeURI_dict, ref_assets) -> Optional[
         str]:
         if partner_type_uri is None:
-            if not id_to_typeURI_dict:
-                id_to_typeURI_dict = {RelationChangeHelpers.get_corrected_identificator(asset): asset.typeURI
-                                      for asset in ref_assets}
+            # pass the dict of create_id_to_typeURI_dict when checking multiple relations
+            if id_to_typeURI_dict is None:
+                id_to_typeURI_dict = cls.create_id_to_typeURI_dict(ref_assets)
 
             if partner_id in id_to_typeURI_dict.keys():
                 partner_type_uri = id_to_typeURI_dict[partner_id]
@@ -256,6 +319,35 @@ class Helpers:
 
         return partner_type_uri
 
+    @classmethod
+    def is_valid_relation(cls, relation_type: type, source_typeURI: str,
+                          target_typeURI: str) -> bool:
+        """
+        Returns RelationValidator.is_valid_relation for the relation type between the source and
+        target typeURI. The result only depends on the model, so it is cached for every
+        combination. If the validation fails, the relation is not valid.
+
+        :param relation_type: the class of the relation
+        :type relation_type: type
+        :param source_typeURI: the typeURI of the source (bron) of the relation
+        :type source_typeURI: str
+        :param target_typeURI: the typeURI of the target (doel) of the relation
+        :type target_typeURI: str
+        :return: True if the relation is allowed between the source and target
+        :rtype: bool
+        """
+
+        key = (relation_type, source_typeURI, target_typeURI)
+        if key not in cls.valid_relation_cache:
+            try:
+                cls.valid_relation_cache[key] = RelationValidator.is_valid_relation(
+                    relation_type=relation_type, source_typeURI=source_typeURI,
+                    target_typeURI=target_typeURI)
+            except Exception as e:
+                OTLLogger.logger.warning(e)
+                cls.valid_relation_cache[key] = False
+        return cls.valid_relation_cache[key]
+
     @classmethod
     def open_folder_and_select_document(cls, document_path):
         document_path = str(document_path)
@@ -0,0 +1,47 @@
+from typing import Hashable, Optional
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+
+
+class MapStateTracker:
+    """
+    Keeps the state of the assets that are drawn on the map of a project, so a refresh of the map
+    only has to send the assets that were added, removed or changed since the last render.
+    The state of an asset is anything that changes how it is drawn, like its geometry and name.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.project: Optional[object] = None
+        self.rendered_asset_states: dict[str, Hashable] = {}
+
+    def is_rendered_for(self, project: object) -> bool:
+        return self.project is not None and self.project is project
+
+    def set_rendered(self, project: object, asset_states: dict[str, Hashable]) -> None:
+        self.project = project
+        self.rendered_asset_states = dict(asset_states)
+
+    def get_changes(self, asset_states: dict[str, Hashable]) -> tuple[list[str], list[str]]:
+        """
+        Compares the states of the assets with the rendered states.
+
+        :param asset_states: the current state per asset id
+        :type asset_states: dict[str, Hashable]
+        :return: the ids of the assets that were added or changed and the ids of the assets that
+            were removed
+        :rtype: tuple[list[str], list[str]]
+        """
+
+        changed_ids = [asset_id for asset_id, asset_state in asset_states.items()
+                       if self.rendered_asset_states.get(asset_id) != asset_state]
+        removed_ids = [asset_id for asset_id in self.rendered_asset_states
+                       if asset_id not in asset_states]
+        OTLLogger.logger.debug(f"Map changes: {len(changed_ids)} added or changed, "
+                               f"{len(removed_ids)} removed")
+        return changed_ids, removed_ids
+
+    def reset_full_state(self) -> None:
+        self.project = None
+        self.rendered_asset_states = {}
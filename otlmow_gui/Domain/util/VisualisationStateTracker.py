@@ -1,46 +1,71 @@
+from typing import Iterable, Optional
+
 from otlmow_model.OtlmowModel.Classes.ImplementatieElement.RelatieObject import RelatieObject
 
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
-from otlmow_gui.Domain.util.Helpers import Helpers
+
+RelationKey = tuple[str, Optional[str], Optional[str], Optional[str], Optional[str], Optional[str],
+                    Optional[str]]
 
 
 class VisualisationStateTracker:
+    """
+    Keeps the relations that are added or removed since the visualisation was last updated.
+    A relation that is removed before the visualisation is updated cancels its insertion and the
+    other way around. The pending relations are kept in dicts per relation key, so cancelling
+    doesn't compare the relation with every pending relation.
+    """
 
     def __init__(self):
         super().__init__()
 
-        self.relations_to_be_inserted: list[RelatieObject] =  []
-        self.relations_to_be_removed: list[RelatieObject] = []
+        self.relations_to_be_inserted: dict[RelationKey, RelatieObject] = {}
+        self.relations_to_be_removed: dict[RelationKey, RelatieObject] = {}
         self.clear_all: bool = False
 
-    def insert_relation(self,relation_object:RelatieObject) -> None:
-        indexes_list = []
-        for i,relation_to_remove in enumerate(self.relations_to_be_removed):
-            if Helpers.compare_RelatieObjects(relation_to_remove,relation_object):
-                indexes_list.append(i)
-
-        if indexes_list:
-            OTLLogger.logger.debug("cancel insert_relation " + str(indexes_list))
-            for i in indexes_list:
-                # if this relation has been removed before updating the visual
-                self.relations_to_be_removed.pop(i)
-        else:
-            self.relations_to_be_inserted.append(relation_object)
+    @classmethod
+    def get_relation_key(cls, relation_object: RelatieObject) -> RelationKey:
+        # the visualisation identifies a relation by its assetId, the role is the only attribute
+        # of a relation (HeeftBetrokkene) that changes how it is drawn
+        return (relation_object.typeURI,
+                relation_object.assetId.identificator,
+                relation_object.bronAssetId.identificator,
+                relation_object.bronAssetId.toegekendDoor,
+                relation_object.doelAssetId.identificator,
+                relation_object.doelAssetId.toegekendDoor,
+                getattr(relation_object, 'rol', None))
+
+    def insert_relation(self, relation_object: RelatieObject) -> None:
+        self.insert_relations([relation_object])
+
+    def insert_relations(self, relation_objects: Iterable[RelatieObject]) -> None:
+        cancelled_count = 0
+        for relation_object in relation_objects:
+            relation_key = self.get_relation_key(relation_object)
+            # if this relation has been removed before updating the visual
+            if self.relations_to_be_removed.pop(relation_key, None) is not None:
+                cancelled_count += 1
+            else:
+                self.relations_to_be_inserted[relation_key] = relation_object
+
+        if cancelled_count:
+            OTLLogger.logger.debug(f"cancel remove_relation of {cancelled_count} relations")
 
     def remove_relation(self, relation_object: RelatieObject) -> None:
+        self.remove_relations([relation_object])
 
-        indexes_list = []
-        for i, relation_to_add in enumerate(self.relations_to_be_inserted):
-            if Helpers.compare_RelatieObjects(relation_to_add, relation_object):
-                indexes_list.append(i)
+    def remove_relations(self, relation_objects: Iterable[RelatieObject]) -> None:
+        cancelled_count = 0
+        for relation_object in relation_objects:
+            relation_key = self.get_relation_key(relation_object)
+            # if this relation has been added before updating the visual
+            if self.relations_to_be_inserted.pop(relation_key, None) is not None:
+                cancelled_count += 1
+            else:
+                self.relations_to_be_removed[relation_key] = relation_object
 
-        if indexes_list:
-            OTLLogger.logger.debug("cancel remove_relation " + str(indexes_list))
-            for i in indexes_list:
-                # if this relation has been added before updating the visual
-                self.relations_to_be_inserted.pop(i)
-        else:
-            self.relations_to_be_removed.append(relation_object)
+        if cancelled_count:
+            OTLLogger.logger.debug(f"cancel insert_relation of {cancelled_count} relations")
 
     def reset_relations_uptodate(self) -> None:
         self.relations_to_be_inserted.clear()
@@ -62,10 +87,9 @@ class VisualisationStateTracker:
         self.clear_all = clear_all
 
     def get_to_be_inserted_relations(self) -> list[RelatieObject]:
-        OTLLogger.logger.debug("self.relations_to_be_inserted " + str(self.relations_to_be_inserted))
-        return self.relations_to_be_inserted
+        OTLLogger.logger.debug(f"{len(self.relations_to_be_inserted)} relations to be inserted")
+        return list(self.relations_to_be_inserted.values())
 
     def get_to_be_removed_relations(self) -> list[RelatieObject]:
-        OTLLogger.logger.debug(
-            "self.relations_to_be_removed " + str(self.relations_to_be_removed))
-        return self.relations_to_be_removed
\ No newline at end of file
+        OTLLogger.logger.debug(f"{len(self.relations_to_be_removed)} relations to be removed")
+        return list(self.relations_to_be_removed.values())
@@ -42,7 +42,7 @@ class AddExternalAssetWindow:
         container_subset = QHBoxLayout()
         label_asset_type = QLabel(self._("asset_type") + ":")
 
-        self.combobox_asset_type = self.create_combobox(Helpers.all_OTL_asset_types_dict)
+        self.combobox_asset_type = self.create_combobox(Helpers.get_external_typeURI_options())
         self.combobox_asset_type.setPlaceholderText(self._("asset_type_dummy"))
         container_subset.addWidget(label_asset_type, alignment=Qt.AlignmentFlag.AlignLeft)
         container_subset.addWidget(self.combobox_asset_type)
@@ -82,7 +82,7 @@ class AddExternalAssetWindow:
 
         combobox_choice = self.combobox_asset_type.currentText()
 
-        type_uri = Helpers.all_OTL_asset_types_dict[combobox_choice]
+        type_uri = Helpers.get_external_typeURI_options()[combobox_choice]
 
         # Replaced by an async call
         # RelationChangeDomain.create_and_add_new_external_asset(id_or_name=id_or_name, type_uri=type_uri)
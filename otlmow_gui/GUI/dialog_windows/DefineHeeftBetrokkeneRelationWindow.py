@@ -81,14 +81,13 @@ class DefineHeeftBetrokkeneRelationWindow:
         optie = KlBetrokkenheidRol.options[combobox_choice]
 
         RelationChangeDomain.last_added_to_existing.clear()
-        for data in self.data_list_and_relation_objects:
-            relation_object = data[2]
-
+        relation_objects = [data[2] for data in self.data_list_and_relation_objects]
+        for relation_object in relation_objects:
             if relation_object.typeURI == 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#HeeftBetrokkene':
                 relation_object.rol = optie.invulwaarde
 
-            RelationChangeDomain.add_relation_object_to_existing_relations(relation_object)
-            RelationChangeDomain.last_added_to_existing.append(relation_object)
+        RelationChangeDomain.add_relation_objects_to_existing_relations(relation_objects)
+        RelationChangeDomain.last_added_to_existing.extend(relation_objects)
 
         RelationChangeDomain.update_frontend()
         dialog_window.close()
@@ -31,7 +31,7 @@ class OverwriteGraphWarningWindow:
     def accept_action(self,dialog:QDialog):
         visuals_screen = global_vars.otl_wizard.main_window.step3_visuals
         current_visuals_html_path = global_vars.current_project.get_current_visuals_html_path()
-        visuals_screen.recreate_html(current_visuals_html_path)
+        create_task_reraise_exception(visuals_screen.recreate_html(current_visuals_html_path))
         dialog.close()
 
     def create_button_box(self):
@@ -0,0 +1,311 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import numpy as np
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+
+NodePositions = dict[str, list[float]]
+
+
+def init_layout_worker() -> None:
+    """Runs once in the worker process, the logger of the application is not set up there."""
+    OTLLogger.logger = OTLLogger("otlmow_gui.layout_worker")
+
+
+def compute_layout_in_worker(node_ids: list[str], edges: list[tuple[str, str]], method: str,
+                             cached_positions: NodePositions) -> NodePositions:
+    return GraphLayout.compute_layout(node_ids=node_ids, edges=edges, method=method,
+                                      cached_positions=cached_positions)
+
+
+class GraphLayout:
+    """
+    Computes the positions of the nodes of the visualisation in Python, so the browser doesn't
+    have to stabilise the physics of the network before it is shown.
+
+    The hierarchical layout places the nodes of each connected part in levels around the node with
+    the most edges, like the hubsize sorting of vis.js. The force directed layout is a
+    Fruchterman-Reingold layout. Both are vectorised with numpy, the repulsion between all nodes is
+    calculated in blocks of rows to bound the memory that is used.
+
+    Nodes with a cached position keep that position, only the new nodes are placed around them.
+    """
+
+    hierarchical_method = "hierarchical"
+    force_directed_method = "force_directed"
+
+    # the same distances as the hierarchical options of the visualisation
+    level_separation = 290.0
+    node_spacing = 467.0
+    component_spacing = 492.0
+
+    ideal_edge_length = 300.0
+    force_directed_iterations = 100
+    minimum_force_directed_iterations = 30
+    # limits the work of the force directed layout to about this number of node pairs
+    force_directed_pair_budget = 2 * 10 ** 8
+    # the number of node pairs of which the repulsion is calculated at once
+    repulsion_block_pair_count = 2 * 10 ** 6
+
+    # starting a worker process takes longer than the layout of a small network
+    worker_process_node_count = 500
+
+    @classmethod
+    async def compute_layout_in_worker_process(cls, node_ids: list[str],
+                                               edges: list[tuple[str, str]], method: str,
+                                               cached_positions: Optional[NodePositions] = None
+                                               ) -> NodePositions:
+        """
+        Computes the layout in a worker process so the event loop of the GUI stays responsive.
+        Small networks and networks of which all nodes are cached are computed in this process,
+        which is also the fallback when the worker process can't be used.
+        """
+
+        cached_positions = cached_positions or {}
+        new_node_count = sum(node_id not in cached_positions for node_id in node_ids)
+        if new_node_count == 0 or len(node_ids) < cls.worker_process_node_count:
+            return cls.compute_layout(node_ids=node_ids, edges=edges, method=method,
+                                      cached_positions=cached_positions)
+
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(max_workers=1,
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=init_layout_worker) as executor:
+                return await loop.run_in_executor(executor, compute_layout_in_worker, node_ids,
+                                                  edges, method, cached_positions)
+        except (BrokenProcessPool, OSError) as e:
+            OTLLogger.logger.warning(
+                f"Computing the layout in a worker process failed, computing it in the "
+                f"application instead: {e}")
+            return cls.compute_layout(node_ids=node_ids, edges=edges, method=method,
+                                      cached_positions=cached_positions)
+
+    @classmethod
+    def compute_layout(cls, node_ids: list[str], edges: list[tuple[str, str]], method: str,
+                       cached_positions: Optional[NodePositions] = None,
+                       seed: int = 0) -> NodePositions:
+        """
+        Computes the position of every node.
+
+        :param node_ids: the ids of the nodes
+        :type node_ids: list[str]
+        :param edges: the (from, to) node ids of the edges, edges to unknown nodes are ignored
+        :type edges: list[tuple[str, str]]
+        :param method: hierarchical_method or force_directed_method
+        :type method: str
+        :param cached_positions: the positions of nodes that keep their position
+        :type cached_positions: Optional[NodePositions]
+        :param seed: the seed of the random start positions, the same network gets the same layout
+        :type seed: int
+        :return: the [x, y] position per node id
+        :rtype: NodePositions
+        """
+
+        node_count = len(node_ids)
+        if node_count == 0:
+            return {}
+        cached_positions = cached_positions or {}
+        sources, targets = cls.get_edge_index_arrays(node_ids, edges)
+        rng = np.random.default_rng(seed)
+
+        fixed = np.array([node_id in cached_positions for node_id in node_ids], dtype=bool)
+        positions = np.zeros((node_count, 2))
+        if fixed.any():
+            positions[fixed] = [cached_positions[node_id]
+                                for node_id, is_fixed in zip(node_ids, fixed) if is_fixed]
+            if not fixed.all():
+                cls.place_new_nodes(positions, fixed, sources, targets, rng)
+                cls.force_directed_layout(positions, sources, targets, fixed)
+        elif method == cls.hierarchical_method:
+            positions = cls.hierarchical_layout(node_count, sources, targets)
+        else:
+            radius = cls.ideal_edge_length * np.sqrt(node_count)
+            angles = rng.uniform(0, 2 * np.pi, node_count)
+            radii = radius * np.sqrt(rng.uniform(0, 1, node_count))
+            positions = np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+            cls.force_directed_layout(positions, sources, targets, fixed)
+
+        OTLLogger.logger.debug(f"Computed the {method} layout of {node_count} nodes "
+                               f"({int(fixed.sum())} cached)")
+        return dict(zip(node_ids, positions.round(1).tolist()))
+
+    @classmethod
+    def get_edge_index_arrays(cls, node_ids: list[str], edges: list[tuple[str, str]]) \
+            -> tuple[np.ndarray, np.ndarray]:
+        index_per_node_id = {node_id: index for index, node_id in enumerate(node_ids)}
+        index_pairs = [(index_per_node_id[from_id], index_per_node_id[to_id])
+                       for from_id, to_id in edges
+                       if from_id in index_per_node_id and to_id in index_per_node_id
+                       and from_id != to_id]
+        if not index_pairs:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        index_array = np.array(index_pairs, dtype=np.int64)
+        return index_array[:, 0], index_array[:, 1]
+
+    @classmethod
+    def get_components(cls, node_count: int, sources: np.ndarray, targets: np.ndarray) \
+            -> np.ndarray:
+        # propagate the lowest index over the edges until every connected part has one label
+        labels = np.arange(node_count)
+        while True:
+            new_labels = labels.copy()
+            np.minimum.at(new_labels, sources, labels[targets])
+            np.minimum.at(new_labels, targets, labels[sources])
+            new_labels = new_labels[new_labels]
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+        return np.unique(labels, return_inverse=True)[1]
+
+    @classmethod
+    def get_levels(cls, node_count: int, sources: np.ndarray, targets: np.ndarray,
+                   components: np.ndarray) -> np.ndarray:
+        # the level of a node is its distance to the node with the most edges of its component
+        degrees = np.bincount(sources, minlength=node_count) + np.bincount(targets,
+                                                                           minlength=node_count)
+        order = np.lexsort((-degrees, components))
+        is_first_of_component = np.ones(node_count, dtype=bool)
+        is_first_of_component[1:] = components[order][1:] != components[order][:-1]
+
+        levels = np.full(node_count, -1)
+        levels[order[is_first_of_component]] = 0
+        both_sources = np.concatenate((sources, targets))
+        both_targets = np.concatenate((targets, sources))
+        level = 0
+        while True:
+            reached = (levels[both_sources] == level) & (levels[both_targets] < 0)
+            if not reached.any():
+                break
+            level += 1
+            levels[both_targets[reached]] = level
+        return levels
+
+    @classmethod
+    def hierarchical_layout(cls, node_count: int, sources: np.ndarray, targets: np.ndarray) \
+            -> np.ndarray:
+        components = cls.get_components(node_count, sources, targets)
+        levels = cls.get_levels(node_count, sources, targets, components)
+
+        positions = np.zeros((node_count, 2))
+        positions[:, 1] = levels * cls.level_separation
+        both_sources = np.concatenate((sources, targets))
+        both_targets = np.concatenate((targets, sources))
+        for level in range(1, levels.max() + 1):
+            # a node is placed below the mean position of its neighbours in the level above, the
+            # nodes of a level are pushed apart to keep node_spacing between them
+            level_nodes = np.flatnonzero(levels == level)
+            from_above = (levels[both_sources] == level - 1) & (levels[both_targets] == level)
+            sums = np.bincount(both_targets[from_above],
+                               weights=positions[both_sources[from_above], 0],
+                               minlength=node_count)
+            neighbour_counts = np.bincount(both_targets[from_above], minlength=node_count)
+            desired = sums[level_nodes] / neighbour_counts[level_nodes]
+
+            order = np.lexsort((level_nodes, desired, components[level_nodes]))
+            level_nodes, desired = level_nodes[order], desired[order]
+            level_components = components[level_nodes]
+            group_starts = np.searchsorted(level_components, level_components)
+            spacings = (np.arange(len(level_nodes)) - group_starts) * cls.node_spacing
+            # x = spacing + the running maximum of (desired - spacing) within each component,
+            # the offset per component keeps the running maximum from crossing components
+            lowest_positions = desired - spacings
+            separation = np.ptp(lowest_positions) + 1
+            running_maximum = np.maximum.accumulate(lowest_positions +
+                                                    level_components * separation)
+            x = running_maximum - level_components * separation + spacings
+            # pushing apart only moves nodes right, center them on their desired positions again
+            shifts = (np.bincount(level_components, weights=desired - x) /
+                      np.maximum(np.bincount(level_components), 1))
+            positions[level_nodes, 0] = x + shifts[level_components]
+
+        # place the components next to each other and center the network around the origin,
+        # like the positions vis.js computes itself
+        component_count = components.max() + 1
+        minimum_x = np.full(component_count, np.inf)
+        maximum_x = np.full(component_count, -np.inf)
+        np.minimum.at(minimum_x, components, positions[:, 0])
+        np.maximum.at(maximum_x, components, positions[:, 0])
+        widths = maximum_x - minimum_x + cls.component_spacing
+        offsets = np.concatenate(([0.0], np.cumsum(widths)[:-1])) - minimum_x
+        positions[:, 0] += offsets[components]
+        positions[:, 0] -= (widths.sum() - cls.component_spacing) / 2
+        return positions
+
+    @classmethod
+    def place_new_nodes(cls, positions: np.ndarray, fixed: np.ndarray, sources: np.ndarray,
+                        targets: np.ndarray, rng: np.random.Generator) -> None:
+        # a new node starts next to the fixed nodes it is connected to, otherwise around the
+        # fixed nodes, the force directed layout moves it into place
+        new = ~fixed
+        node_count = len(positions)
+        both_sources = np.concatenate((sources, targets))
+        both_targets = np.concatenate((targets, sources))
+        to_new = fixed[both_sources] & new[both_targets]
+        neighbour_counts = np.bincount(both_targets[to_new], minlength=node_count)
+        sums = np.column_stack([np.bincount(both_targets[to_new],
+                                            weights=positions[both_sources[to_new], axis],
+                                            minlength=node_count) for axis in range(2)])
+
+        center = positions[fixed].mean(axis=0)
+        spread = max(float(np.abs(positions[fixed] - center).max()), cls.ideal_edge_length)
+        new_count = int(new.sum())
+        angles = rng.uniform(0, 2 * np.pi, new_count)
+        offsets = np.column_stack((np.cos(angles), np.sin(angles)))
+
+        has_neighbours = neighbour_counts[new] > 0
+        new_positions = np.where(
+            has_neighbours[:, None],
+            sums[new] / np.maximum(neighbour_counts[new], 1)[:, None] +
+            offsets * cls.ideal_edge_length,
+            center + offsets * (spread + cls.ideal_edge_length))
+        positions[new] = new_positions
+
+    @classmethod
+    def force_directed_layout(cls, positions: np.ndarray, sources: np.ndarray,
+                              targets: np.ndarray, fixed: np.ndarray) -> None:
+        """
+        Moves the nodes that aren't fixed to a Fruchterman-Reingold layout, in place. The nodes
+        repel each other, the edges pull their nodes together and a weak gravity keeps the
+        unconnected parts together.
+        """
+
+        movable = np.flatnonzero(~fixed)
+        node_count = len(positions)
+        if len(movable) == 0:
+            return
+
+        k = cls.ideal_edge_length
+        iterations = int(min(cls.force_directed_iterations,
+                             max(cls.minimum_force_directed_iterations,
+                                 cls.force_directed_pair_budget // (len(movable) * node_count))))
+        block_size = max(1, cls.repulsion_block_pair_count // node_count)
+        gravity = 1 / np.sqrt(node_count)
+        start_temperature = k * np.sqrt(len(movable)) / 4 + k
+        for iteration in range(iterations):
+            displacements = np.zeros((node_count, 2))
+            # single precision is precise enough for the repulsion and twice as fast
+            x, y = positions.astype(np.float32).T
+            for block_start in range(0, len(movable), block_size):
+                block = movable[block_start:block_start + block_size]
+                delta_x = x[block, None] - x[None, :]
+                delta_y = y[block, None] - y[None, :]
+                repulsions = np.float32(k * k) / np.maximum(delta_x * delta_x + delta_y * delta_y,
+                                                            np.float32(1))
+                displacements[block, 0] = (delta_x * repulsions).sum(axis=1)
+                displacements[block, 1] = (delta_y * repulsions).sum(axis=1)
+
+            deltas = positions[sources] - positions[targets]
+            pulls = deltas * (np.linalg.norm(deltas, axis=1) / k)[:, None]
+            np.subtract.at(displacements, sources, pulls)
+            np.add.at(displacements, targets, pulls)
+            displacements -= positions * gravity * np.linalg.norm(positions, axis=1)[:, None] / k
+
+            lengths = np.maximum(np.linalg.norm(displacements[movable], axis=1), 1e-9)
+            temperature = start_temperature * (1 - iteration / iterations)
+            positions[movable] += (displacements[movable] *
+                                   (np.minimum(lengths, temperature) / lengths)[:, None])
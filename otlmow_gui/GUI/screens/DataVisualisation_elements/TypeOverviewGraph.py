@@ -0,0 +1,208 @@
+import math
+from collections import defaultdict
+from typing import Optional
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+from otlmow_model.OtlmowModel.Helpers.OTLObjectHelper import is_relation, is_directional_relation
+from otlmow_visuals.PyVisWrapper import PyVisWrapper
+
+from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+
+
+class TypeOverviewGraph:
+    """
+    Overview of a visualisation that is too large to draw every asset. The assets are grouped per
+    typeURI in a group node and the relations between the groups are drawn as one edge per
+    relation type with the number of relations. A click on a group node shows the next page of its
+    assets, so the browser only holds the assets that were opened.
+
+    The relations of an asset that is shown are drawn to the asset, the relations of an asset that
+    is still in its group are drawn to the group node.
+    """
+
+    group_id_prefix = "type_group_"
+    group_edge_id_prefix = "type_group_edge_"
+    group_page_size = 200
+
+    def __init__(self, objects: list[OTLObject], vis_wrap: PyVisWrapper):
+        self.vis_wrap = vis_wrap
+
+        self.asset_per_id: dict[str, OTLObject] = {}
+        self.group_id_per_asset_id: dict[str, str] = {}
+        self.asset_ids_per_group_id: dict[str, list[str]] = {}
+        self.type_uri_per_group_id: dict[str, str] = {}
+        self.relations: list[OTLObject] = []
+
+        self.shown_asset_ids: set[str] = set()
+        self.shown_asset_count_per_group_id: dict[str, int] = defaultdict(int)
+        self.shown_edges: dict[str, dict] = {}
+
+        assets_per_type_uri = defaultdict(list)
+        for otl_object in objects:
+            if is_relation(otl_object):
+                self.relations.append(otl_object)
+            else:
+                assets_per_type_uri[otl_object.typeURI].append(otl_object)
+
+        # sort on typeURI to ensure color coding is always the same for the same set of assets
+        for index, type_uri in enumerate(sorted(assets_per_type_uri)):
+            group_id = f"{self.group_id_prefix}{index}"
+            self.type_uri_per_group_id[group_id] = type_uri
+            self.asset_ids_per_group_id[group_id] = []
+            for asset in assets_per_type_uri[type_uri]:
+                asset_id = self.vis_wrap.get_corrected_identificator(asset)
+                if asset_id in self.asset_per_id:
+                    continue
+                self.asset_per_id[asset_id] = asset
+                self.group_id_per_asset_id[asset_id] = group_id
+                self.asset_ids_per_group_id[group_id].append(asset_id)
+
+        # the edges the page starts with, an expansion sends the differences with these
+        self.shown_edges = self.create_edges()
+
+    def get_group_nodes(self) -> list[dict]:
+        return [self.create_group_node(group_id) for group_id in self.asset_ids_per_group_id]
+
+    def get_edges(self) -> list[dict]:
+        self.shown_edges = self.create_edges()
+        return list(self.shown_edges.values())
+
+    def is_group(self, node_id: str) -> bool:
+        return node_id in self.asset_ids_per_group_id
+
+    def get_hidden_asset_count(self, group_id: str) -> int:
+        return (len(self.asset_ids_per_group_id[group_id]) -
+                self.shown_asset_count_per_group_id[group_id])
+
+    def expand_group(self, group_id: str) -> Optional[dict]:
+        """
+        Shows the next page of assets of a group node.
+
+        :param group_id: the id of the group node
+        :type group_id: str
+        :return: the nodes and edges to add, update and remove in the network or None if the
+            group doesn't exist
+        :rtype: Optional[dict]
+        """
+
+        if not self.is_group(group_id):
+            OTLLogger.logger.debug(f"Can't expand {group_id}, it is not a group node")
+            return None
+
+        shown_asset_count = self.shown_asset_count_per_group_id[group_id]
+        page_asset_ids = self.asset_ids_per_group_id[group_id][
+                         shown_asset_count:shown_asset_count + self.group_page_size]
+        self.shown_asset_ids.update(page_asset_ids)
+        self.shown_asset_count_per_group_id[group_id] += len(page_asset_ids)
+
+        update_nodes = []
+        remove_node_ids = []
+        if self.get_hidden_asset_count(group_id):
+            update_nodes.append(self.create_group_node(group_id))
+        else:
+            remove_node_ids.append(group_id)
+
+        edges = self.create_edges()
+        remove_edge_ids = [edge_id for edge_id in self.shown_edges if edge_id not in edges]
+        add_edges = [edge for edge_id, edge in edges.items() if self.shown_edges.get(edge_id) != edge]
+        self.shown_edges = edges
+
+        OTLLogger.logger.debug(f"Expanded {group_id}: {len(page_asset_ids)} assets shown, "
+                               f"{self.get_hidden_asset_count(group_id)} left in the group")
+        return {"groupId": group_id,
+                "addNodes": [self.create_asset_node(self.asset_per_id[asset_id])
+                             for asset_id in page_asset_ids],
+                "updateNodes": update_nodes,
+                "removeNodeIds": remove_node_ids,
+                "addEdges": add_edges,
+                "removeEdgeIds": remove_edge_ids}
+
+    def create_group_node(self, group_id: str) -> dict:
+        type_uri = self.type_uri_per_group_id[group_id]
+        class_name = type_uri.split('#')[-1].split('/')[-1]
+        hidden_asset_count = self.get_hidden_asset_count(group_id)
+        color = self.vis_wrap.random_color_if_not_in_dict(type_uri)
+        return {"id": group_id,
+                "label": f"<b>{class_name}</b>\n({hidden_asset_count})",
+                "title": f"{type_uri}\n{hidden_asset_count} / "
+                         f"{len(self.asset_ids_per_group_id[group_id])}",
+                "typeGroup": True,
+                "shape": "box",
+                "borderWidth": 3,
+                "shapeProperties": {"borderDashes": [5, 5]},
+                "color": {"border": "#000000", "background": color,
+                          "highlight": {"border": "#000000", "background": "#25bedd"},
+                          "hover": {"border": "#000000", "background": color}},
+                "font": {"multi": True}}
+
+    def create_asset_node(self, asset: OTLObject) -> dict:
+        # the color of the asset is the color of its group node in the network
+        screen_name = self.vis_wrap.get_screen_name(otl_object=asset)
+        shape = 'box'
+        if asset.typeURI.startswith('https://lgc.'):
+            shape = 'ellipse'
+        elif asset.typeURI == 'http://purl.org/dc/terms/Agent':
+            shape = 'circle'
+        tooltip = (str(asset).replace('<', '').replace('>', '').
+                   replace('\n', '<br/>').replace(' ', '&nbsp;'))
+        return {"id": self.vis_wrap.get_corrected_identificator(asset),
+                "label": f'{screen_name[:self.vis_wrap.max_screen_name_char_count]}\n'
+                         f'<b>{asset.__class__.__name__}</b>',
+                "title": {"html": f'<div style="font-family: monospace;">{tooltip}</div>'},
+                "shape": shape,
+                "size": 20,
+                "font": {"multi": True}}
+
+    def get_node_id(self, asset_id: str) -> Optional[str]:
+        # None when the asset is not in the visualisation
+        if asset_id in self.shown_asset_ids:
+            return asset_id
+        return self.group_id_per_asset_id.get(asset_id)
+
+    def create_edges(self) -> dict[str, dict]:
+        edges = {}
+        relation_count_per_group_edge = defaultdict(int)
+        for relation in self.relations:
+            bron_id = self.get_node_id(relation.bronAssetId.identificator)
+            doel_id = self.get_node_id(relation.doelAssetId.identificator)
+            if bron_id is None or doel_id is None:
+                continue
+            if bron_id in self.shown_asset_ids and doel_id in self.shown_asset_ids:
+                relation_id = relation.assetId.identificator
+                edges[relation_id] = self.create_relation_edge(relation, relation_id=relation_id,
+                                                               bron_id=bron_id, doel_id=doel_id)
+            else:
+                relation_count_per_group_edge[(bron_id, doel_id, relation.typeURI,
+                                               is_directional_relation(relation))] += 1
+
+        for (bron_id, doel_id, type_uri, directional), relation_count in \
+                relation_count_per_group_edge.items():
+            edge_id = f"{self.group_edge_id_prefix}{bron_id}_{doel_id}_{type_uri}"
+            edges[edge_id] = {"id": edge_id,
+                              "from": bron_id,
+                              "to": doel_id,
+                              "arrows": "to" if directional else None,
+                              "color": self.vis_wrap.relatie_color_dict.get(type_uri, 'brown'),
+                              "label": str(relation_count),
+                              "title": f"{relation_count} x {type_uri.split('#')[-1]}",
+                              "width": min(2 + 2 * math.log10(relation_count), 10),
+                              "arrowStrikethrough": False,
+                              "smooth": {"enabled": False}}
+        return edges
+
+    def create_relation_edge(self, relation: OTLObject, relation_id: str, bron_id: str,
+                             doel_id: str) -> dict:
+        edge = {"id": relation_id,
+                "from": bron_id,
+                "to": doel_id,
+                "arrows": "to",
+                "color": self.vis_wrap.map_relation_to_color(relation),
+                "width": 2,
+                "arrowStrikethrough": False,
+                "smooth": {"enabled": False}}
+        if not is_directional_relation(relation):
+            edge["arrows"] = None
+        elif (relation.typeURI == 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#HeeftBetrokkene'
+              and relation.rol is not None):
+            edge["label"] = relation.rol
+        return edge
@@ -1,18 +1,49 @@
 import json
-from copy import deepcopy
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+from urllib.parse import quote
 
 from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+from otlmow_model.OtlmowModel.Helpers.OTLObjectHelper import is_relation
 from otlmow_visuals.PyVisWrapper import PyVisWrapper
+from pyvis import network as pyvis_network
 
 from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.GUI.screens.DataVisualisation_elements.GraphLayout import GraphLayout, NodePositions
+from otlmow_gui.GUI.screens.DataVisualisation_elements.TypeOverviewGraph import TypeOverviewGraph
 
 
 
 class VisualisationHelper:
+    # above this number of objects the assets are grouped per type in the type overview
     object_count_limit = 100000
+    type_overview_mode = "5 Overzicht per type"
+    type_overview_options = {
+        "nodes": {"font": {"size": 25, "color": "#000000"}, "margin": 10,
+                  "widthConstraint": {"minimum": 150, "maximum": 250}},
+        "interaction": {"dragView": True, "hover": True, "selectConnectedEdges": False,
+                        "tooltipDelay": 500},
+        "physics": {"solver": "barnesHut",
+                    "barnesHut": {"gravitationalConstant": -20000, "springLength": 250,
+                                  "avoidOverlap": 0.5},
+                    "stabilization": {"enabled": True, "iterations": 200, "fit": True}}}
+
+    # the state of the network (nodes with their positions, edges and the support data of the
+    # sub-edges and collections) is saved in a script next to the html that the html loads
+    network_state_file_suffix = "_network_state.js"
+    network_state_variable_name = "savedNetworkState"
+    # increase when the layout of the network state file changes
+    network_state_version = 1
+    network_state_keys = ['nodeList', 'edgeList', 'relationIdToSubEdgesList',
+                          'relationIdToTotalSubEdgeCountList', 'relationIdToJointNodesList',
+                          'SubEdgesToOriginalRelationIdList',
+                          'edgeJointNodesIdToConnectionDataDictList']
+
+    # the node positions computed by GraphLayout are saved in a script next to the html, they are
+    # also the cache of the positions for the next html of the project
+    node_layout_file_suffix = "_layout.js"
+    node_layout_variable_name = "precomputedNodeLayout"
 
     @classmethod
     def get_std_vis_wrap_instance(cls):
@@ -25,9 +56,9 @@ class VisualisationHelper:
                     collection_threshold=-1):
 
 
-        objects_in_memory = deepcopy(objects_in_memory)
         # sort on typeURI to ensure color coding is always the same for the same set of assets
-        objects_in_memory.sort(key=lambda otl_object: otl_object.typeURI)
+        # PyVisWrapper only reads the objects, it copies the relations it redirects to a collection
+        objects_in_memory = sorted(objects_in_memory, key=lambda otl_object: otl_object.typeURI)
 
         visualisation_option = 1
         if vis_mode == "1 Hiërarchische visualisatie":
@@ -47,10 +78,199 @@ class VisualisationHelper:
         stdVis.show(list_of_objects=objects_in_memory, visualisation_option = visualisation_option,
                     html_path=Path(html_loc), launch_html=False,collection_threshold=collection_threshold)
 
-        cls.modify_html(html_loc)
+        # the network state of a previous html would replace the new network
+        cls.get_network_state_path(Path(html_loc)).unlink(missing_ok=True)
+        cls.modify_html(Path(html_loc))
 
         return stdVis
 
+    @classmethod
+    async def create_html_with_layout(cls, html_loc: Path, objects_in_memory: List[OTLObject],
+                                      vis_mode="1 Hiërarchische visualisatie",
+                                      collection_threshold=-1) -> PyVisWrapper:
+        """
+        Creates the html like create_html and computes the positions of its nodes with GraphLayout
+        in a worker process, the html shows the nodes on these positions without physics.
+        The nodes that were in the previous html of the project keep their position.
+
+        :param html_loc: the path of the html
+        :type html_loc: Path
+        :param objects_in_memory: the assets and relations of the project
+        :type objects_in_memory: List[OTLObject]
+        :param vis_mode: the visualisation mode, see create_html
+        :type vis_mode: str
+        :param collection_threshold: see create_html
+        :type collection_threshold: int
+        :return: the PyVisWrapper that created the html
+        :rtype: PyVisWrapper
+        """
+
+        html_loc = Path(html_loc)
+        node_layout_path = cls.get_node_layout_path(html_loc)
+        layout_method = cls.get_layout_method(vis_mode)
+        if layout_method is None:
+            # the shell visualisation positions its nodes itself
+            node_layout_path.unlink(missing_ok=True)
+            return cls.create_html(html_loc=html_loc, objects_in_memory=objects_in_memory,
+                                   vis_mode=vis_mode, collection_threshold=collection_threshold)
+
+        # read the cache before create_html removes the network state of the previous html
+        cached_positions = cls.load_cached_node_positions(html_loc, layout_method=layout_method)
+        std_vis_wrap = cls.create_html(html_loc=html_loc, objects_in_memory=objects_in_memory,
+                                       vis_mode=vis_mode, collection_threshold=collection_threshold)
+
+        node_ids, edges = cls.get_layout_graph(html_loc, vis_wrap=std_vis_wrap,
+                                               objects_in_memory=objects_in_memory)
+        positions = await GraphLayout.compute_layout_in_worker_process(
+            node_ids=node_ids, edges=edges, method=layout_method, cached_positions=cached_positions)
+        cls.save_node_layout(html_loc, layout_method=layout_method, positions=positions)
+        return std_vis_wrap
+
+    @classmethod
+    def get_layout_method(cls, vis_mode: str) -> Optional[str]:
+        if vis_mode == "1 Hiërarchische visualisatie":
+            return GraphLayout.hierarchical_method
+        if vis_mode == "3 Shell visualisatie":
+            return None
+        return GraphLayout.force_directed_method
+
+    @classmethod
+    def get_layout_graph(cls, html_path: Path, vis_wrap: PyVisWrapper,
+                         objects_in_memory: List[OTLObject]) -> tuple[list[str], list[tuple[str, str]]]:
+        # the edges of the html include the collection nodes and edges PyVisWrapper created, the
+        # hidden edges to the members of a collection keep the members near their collection
+        with open(html_path) as file:
+            edges_line = next((line for line in file if line.startswith("edges = new vis.DataSet(")),
+                              None)
+        edge_dicts = []
+        if edges_line is not None:
+            edge_dicts = json.loads(edges_line.strip()[len("edges = new vis.DataSet("):-len(");")])
+
+        node_ids = dict.fromkeys(vis_wrap.get_corrected_identificator(otl_object)
+                                 for otl_object in objects_in_memory
+                                 if not is_relation(otl_object))
+        edges = []
+        for edge in edge_dicts:
+            node_ids.update(dict.fromkeys((edge["from"], edge["to"])))
+            edges.append((edge["from"], edge["to"]))
+        return list(node_ids), edges
+
+    @classmethod
+    def get_node_layout_path(cls, html_path: Path) -> Path:
+        return html_path.with_name(f"{html_path.stem}{cls.node_layout_file_suffix}")
+
+    @classmethod
+    def save_node_layout(cls, html_path: Path, layout_method: str,
+                         positions: NodePositions) -> Path:
+        node_layout_path = cls.get_node_layout_path(html_path)
+        node_layout = {"method": layout_method, "positions": positions}
+        with open(node_layout_path, mode="w") as file:
+            file.write(f"var {cls.node_layout_variable_name} = {json.dumps(node_layout)};\n")
+        return node_layout_path
+
+    @classmethod
+    def load_script_variable(cls, script_path: Path, variable_name: str) -> Optional[dict]:
+        if not script_path.exists():
+            return None
+        script = script_path.read_text()
+        prefix = f"var {variable_name} = "
+        if not script.startswith(prefix):
+            return None
+        try:
+            return json.loads(script[len(prefix):].rstrip().rstrip(";"))
+        except json.JSONDecodeError:
+            OTLLogger.logger.warning(f"Can't read {variable_name} from {script_path}")
+            return None
+
+    @classmethod
+    def load_cached_node_positions(cls, html_path: Path, layout_method: str) -> NodePositions:
+        """
+        Returns the node positions of the previous html of the project that was laid out with the
+        same method: the positions GraphLayout computed, updated with the positions of the saved
+        network state, which holds the nodes the user moved.
+
+        :param html_path: the path of the html of the visualisation
+        :type html_path: Path
+        :param layout_method: the layout method of the new html
+        :type layout_method: str
+        :return: the [x, y] position per node id
+        :rtype: NodePositions
+        """
+
+        node_layout = cls.load_script_variable(cls.get_node_layout_path(html_path),
+                                               cls.node_layout_variable_name)
+        if not node_layout or node_layout.get("method") != layout_method:
+            return {}
+        positions = node_layout.get("positions", {})
+
+        network_state = cls.load_script_variable(cls.get_network_state_path(html_path),
+                                                 cls.network_state_variable_name)
+        if network_state:
+            positions.update({node["id"]: [node["x"], node["y"]]
+                              for node in network_state.get("nodeList", [])
+                              if "x" in node and "y" in node and node["id"] in positions})
+        return positions
+
+    @classmethod
+    def create_type_overview_html(cls, html_loc: Path, objects_in_memory: List[OTLObject]) \
+            -> TypeOverviewGraph:
+        """
+        Creates the html of the type overview, in which the assets are grouped per typeURI in
+        group nodes. The assets of a group are added when its group node is clicked, see
+        TypeOverviewGraph.
+
+        :param html_loc: the path of the html
+        :type html_loc: Path
+        :param objects_in_memory: the assets and relations of the project
+        :type objects_in_memory: List[OTLObject]
+        :return: the graph of the group nodes in the html
+        :rtype: TypeOverviewGraph
+        """
+
+        type_overview_graph = TypeOverviewGraph(objects=objects_in_memory,
+                                                vis_wrap=cls.get_std_vis_wrap_instance())
+
+        g = pyvis_network.Network(directed=True, height="95vh", width="100%")
+        for group_node in type_overview_graph.get_group_nodes():
+            g.add_node(group_node.pop("id"), **group_node)
+        for edge in type_overview_graph.get_edges():
+            g.add_edge(edge.pop("from"), edge.pop("to"), **edge)
+        g.set_options(json.dumps(cls.type_overview_options))
+        g.write_html(str(html_loc))
+
+        cls.get_network_state_path(Path(html_loc)).unlink(missing_ok=True)
+        cls.modify_type_overview_html(Path(html_loc))
+
+        return type_overview_graph
+
+    @classmethod
+    def modify_type_overview_html(cls, file_path: Path) -> None:
+        with open(file_path) as file:
+            file_data = file.readlines()
+
+        replace_index_lib = next((
+                index for index, line in enumerate(file_data)
+                if '<script src="lib/bindings/utils.js"></script>' in line),
+            -1)
+        if replace_index_lib > 0:
+            cls.replace_and_add_lines(file_data, replace_index_lib,
+                                      '<script src="lib/bindings/utils.js"></script>',
+                                      '<script src="lib/bindings/utils.js"></script>',
+                                      ['<script src="qrc:///qtwebchannel/qwebchannel.js"></script>'])
+
+        replace_index = next((
+                index for index, line in enumerate(file_data)
+                if "drawGraph();" in line and "function" not in line),
+            -1)
+        if replace_index > 0:
+            cls.replace_and_add_lines(file_data, replace_index, "drawGraph();",
+                                      "var network = drawGraph();",
+                                      cls.load_js_script_file("typeOverview.js"))
+
+        with open(file_path, 'w') as file:
+            for line in file_data:
+                file.write(line)
+
     @classmethod
     def modify_html(cls, file_path: Path) -> None:
         with open(file_path) as file:
@@ -65,7 +285,18 @@ class VisualisationHelper:
                                       '<script src="lib/bindings/utils.js"></script>',
                                       '<script src="lib/bindings/utils.js"></script>',
 
-                                      ['<script src="qrc:///qtwebchannel/qwebchannel.js"></script>'])
+                                      ['<script src="qrc:///qtwebchannel/qwebchannel.js"></script>',
+                                       f'<script src="{quote(cls.get_network_state_path(file_path).name)}"></script>',
+                                       f'<script src="{quote(cls.get_node_layout_path(file_path).name)}"></script>'])
+
+        replace_index_network = next((
+                index for index, line in enumerate(file_data)
+                if "network = new vis.Network(container, data, options);" in line),
+            -1)
+        if replace_index_network > 0:
+            file_data.insert(replace_index_network,
+                             "                  var networkStateLoaded = loadSavedNetworkState(nodes, edges, options);\n"
+                             "                  if (!networkStateLoaded) applyPrecomputedNodeLayout(nodes, options);\n")
 
         replace_index = next((
                 index for index, line in enumerate(file_data)
@@ -111,6 +342,8 @@ class VisualisationHelper:
                         "})"]
 
             add_data.extend(cls.create_disablePhysics_js_function_and_add_to_event())
+            add_data.extend(cls.create_loadSavedNetworkState_js_function())
+            add_data.extend(cls.create_applyPrecomputedNodeLayout_js_function())
             add_data.extend(cls.create_ExtractNodeList_js_function())
             add_data.extend(cls.create_ExtractEdgeList_js_function())
             add_data.extend(cls.create_sendCurrentCombinedDataToPython_js_function())
@@ -137,6 +370,35 @@ class VisualisationHelper:
             for line in file_data:
                 file.write(line)
 
+    @classmethod
+    def get_network_state_path(cls, html_path: Path) -> Path:
+        return html_path.with_name(f"{html_path.stem}{cls.network_state_file_suffix}")
+
+    @classmethod
+    def save_network_state(cls, html_path: Path, combined_data: dict) -> Path:
+        """
+        Saves the network state that sendCurrentCombinedDataToPython sends in the network state
+        file next to the html. The html loads this file when it is opened, so the html itself
+        doesn't change when the network is saved.
+
+        :param html_path: the path of the html of the visualisation
+        :type html_path: Path
+        :param combined_data: the data sent by sendCurrentCombinedDataToPython
+        :type combined_data: dict
+        :return: the path of the network state file
+        :rtype: Path
+        """
+
+        network_state = {key: combined_data[key] for key in cls.network_state_keys}
+        network_state['collection_id_to_list_of_relation_ids'] = combined_data.get(
+            'collection_id_to_list_of_relation_ids', {})
+        network_state['networkStateVersion'] = cls.network_state_version
+
+        network_state_path = cls.get_network_state_path(html_path)
+        with open(network_state_path, mode="w") as file:
+            file.write(f"var {cls.network_state_variable_name} = {json.dumps(network_state)};\n")
+        return network_state_path
+
     @classmethod
     def load_js_script_file(cls, script_filename):
         library_path = ProgramFileStructure.get_dynamic_library_path("javascripts_visualisation")
@@ -251,7 +513,8 @@ class VisualisationHelper:
                 "                       'relationIdToJointNodesList': relationIdToJointNodesList,"
                 "                       'SubEdgesToOriginalRelationIdList': SubEdgesToOriginalRelationIdList,"
                 "                       'edgeJointNodesIdToConnectionDataDictList' : edgeJointNodesIdToConnectionDataDictList,"
-                "                       'collection_id_to_list_of_relation_ids' : collection_id_to_list_of_relation_ids"
+                "                       'collection_id_to_list_of_relation_ids' : collection_id_to_list_of_relation_ids,"
+                f"                       'networkStateVersion' : {cls.network_state_version}"
                 "                       }",
                 '   var combinedDataStr = JSON.stringify(combinedData)',
                 # '   console.log(combinedDataStr)',
@@ -274,21 +537,72 @@ class VisualisationHelper:
     def create_ExtractNodeList_js_function(cls):
         return ["function ExtractNodeList()   "
                 "{"
-                "   var node_attributes = Object.fromEntries(network.body.data.nodes._data);",
                 "   var nodeList = [];",
-                "   for (const nodeId of network.body.data.nodes._data.keys()) ",
+                "   for (const nodeData of network.body.data.nodes._data.values()) ",
                 "   {",
-                "       if (network.body.data.nodes._data.get(nodeId).title)",
-                "       {",
-                "           var strTitle = network.body.data.nodes._data.get(nodeId).title.innerHTML; // use the innerhtml so it can be converted to json",
-                "           if (strTitle)",
-                "           node_attributes[nodeId].title = 'htmlTitle(\"' + strTitle.replace('\"','\\\"') +  '\")'; //add htmlTitle so is looks exactly like how the nodes are normally created",
-                "       }",
-                "       nodeList.push(node_attributes[nodeId]);",
+                "       // copy the node so the title in the network stays an html element",
+                "       var node = Object.assign({}, nodeData);",
+                "       if (node.title && node.title.innerHTML !== undefined)",
+                '           node.title = {"html": node.title.innerHTML}; // use the innerhtml so it can be converted to json',
+                "       nodeList.push(node);",
                 "   }",
                 "   return nodeList",
                 "}"]
 
+    @classmethod
+    def create_loadSavedNetworkState_js_function(cls):
+        return ["function loadSavedNetworkState(nodes, edges, options)",
+                "{",
+                "   // the network state file next to the html replaces the generated network",
+                f"   if (typeof {cls.network_state_variable_name} === 'undefined')",
+                "       return false;",
+                f"   var networkState = {cls.network_state_variable_name};",
+                "   nodes.clear();",
+                "   nodes.add(networkState.nodeList.map((node) =>",
+                "   {",
+                "       if (node.title && node.title.html !== undefined)",
+                "           node.title = htmlTitle(node.title.html);",
+                "       return node;",
+                "   }));",
+                "   edges.clear();",
+                "   edges.add(networkState.edgeList);",
+                "   relationIdToSubEdges = new Map(networkState.relationIdToSubEdgesList);",
+                "   relationIdToTotalSubEdgeCount = new Map(networkState.relationIdToTotalSubEdgeCountList);",
+                "   relationIdToJointNodes = new Map(networkState.relationIdToJointNodesList);",
+                "   SubEdgesToOriginalRelationId = new Map(networkState.SubEdgesToOriginalRelationIdList);",
+                "   edgeJointNodesIdToConnectionDataDict = new Map(networkState.edgeJointNodesIdToConnectionDataDictList);",
+                "   collection_id_to_list_of_relation_ids = networkState.collection_id_to_list_of_relation_ids;",
+                "   ",
+                "   // the nodes keep their saved positions",
+                "   if (options.layout && options.layout.hierarchical)",
+                "       options.layout.hierarchical.enabled = false;",
+                '   options.physics = Object.assign(options.physics || {}, {"enabled": false, "stabilization": {"enabled": false}});',
+                "   return true;",
+                "}"]
+
+    @classmethod
+    def create_applyPrecomputedNodeLayout_js_function(cls):
+        return ["function applyPrecomputedNodeLayout(nodes, options)",
+                "{",
+                "   // the positions computed in python replace the physics of the network",
+                f"   if (typeof {cls.node_layout_variable_name} === 'undefined')",
+                "       return false;",
+                f"   var positions = {cls.node_layout_variable_name}.positions;",
+                "   var positionedNodes = [];",
+                "   nodes.forEach((node) =>",
+                "   {",
+                "       var position = positions[node.id];",
+                "       if (position)",
+                '           positionedNodes.push({"id": node.id, "x": position[0], "y": position[1]});',
+                "   });",
+                "   nodes.update(positionedNodes);",
+                "   ",
+                "   if (options.layout && options.layout.hierarchical)",
+                "       options.layout.hierarchical.enabled = false;",
+                '   options.physics = Object.assign(options.physics || {}, {"enabled": false, "stabilization": {"enabled": false}});',
+                "   return true;",
+                "}"]
+
     @classmethod
     def create_setAllNonCollectionEdgesToUnhidden_js_function(cls):
         return ["function setAllNonCollectionEdgesToUnhidden(edgeList)",
@@ -1,7 +1,7 @@
 import json
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import qtawesome as qta
 
@@ -21,6 +21,7 @@ from otlmow_gui.Domain.step_domain.RelationChangeDomain import RelationChangeDom
 from otlmow_gui.Domain.util.Helpers import Helpers
 from otlmow_gui.GUI.dialog_windows.NotificationWindow import NotificationWindow
 from otlmow_gui.GUI.dialog_windows.OverwriteGraphWarningWindow import OverwriteGraphWarningWindow
+from otlmow_gui.GUI.screens.DataVisualisation_elements.TypeOverviewGraph import TypeOverviewGraph
 from otlmow_gui.GUI.screens.DataVisualisation_elements.VisualisationHelper import VisualisationHelper
 from otlmow_gui.GUI.screens.Screen import Screen
 from otlmow_gui.GUI.screens.general_elements.ButtonWidget import ButtonWidget
@@ -38,13 +39,33 @@ class Backend(QObject):
         """Receives receive_new_combined_data from JavaScript."""
         data = json.loads(message)  # Convert string back to dict
 
-        OTLLogger.logger.debug(f"Received new combined data: {message}")
+        OTLLogger.logger.debug(f"Received new combined data ({len(message)} characters)")
 
+        try:
+            html_path = self.parent_screen.get_current_html_path()
+        except:
+            OTLLogger.logger.error("Couldn't save the html because the html is outdated and the project is already closed")
+            notification = NotificationWindow(title=GlobalTranslate._("Couldn't save visualisation"),
+                                              message=GlobalTranslate._("Couldn't save the html because the html is outdated and the project is already closed\nTo fix this refresh the visualisation."))
+            notification.exec()
+            return
+
+        if data.get('networkStateVersion') == VisualisationHelper.network_state_version:
+            network_state_path = VisualisationHelper.save_network_state(html_path=html_path,
+                                                                        combined_data=data)
+            OTLLogger.logger.info(f"Saved network state to: {network_state_path}")
+        else:
+            # htmls created before the network state file keep their network in the html
+            self.save_combined_data_in_html(html_path=html_path, data=data)
+
+        global_vars.current_project.visualisation_uptodate.reset_full_state()
+        global_vars.current_project.save_visualisation_python_support_data(self.parent_screen.std_vis_wrap)
+
+    def save_combined_data_in_html(self, html_path: Path, data: dict) -> None:
         # test_json_path = global_vars.current_project.get_current_visuals_folder_path() / "new_nodes.json"
         # with open(test_json_path, 'w') as json_file:
         #     json.dump(data, json_file)
 
-
         new_node_data_str = json.dumps(data['nodeList']) #nodes and their position (including edgeJointNodes)
         new_edge_data_str = json.dumps(data['edgeList']) #edges (including subEdges)
         new_relationIdToSubEdges_data_str = json.dumps(data['relationIdToSubEdgesList']) #data supporting dynamic removal functionality
@@ -62,15 +83,6 @@ class Backend(QObject):
 
         new_node_data_str = self.correct_node_title_attributes(new_node_data_str)
 
-        try:
-            html_path = self.parent_screen.get_current_html_path()
-        except:
-            OTLLogger.logger.error("Couldn't save the html because the html is outdated and the project is already closed")
-            notification = NotificationWindow(title=GlobalTranslate._("Couldn't save visualisation"),
-                                              message=GlobalTranslate._("Couldn't save the html because the html is outdated and the project is already closed\nTo fix this refresh the visualisation."))
-            notification.exec()
-            return
-
         self.parent_screen.save_html(file_path=html_path,
                                      new_node_data=new_node_data_str,
                                      new_edge_data=new_edge_data_str,
@@ -80,8 +92,7 @@ class Backend(QObject):
                                      new_SubEdgesToOriginalRelationId_data=new_SubEdgesToOriginalRelationIdList_data_str,
                                      new_edgeJointNodesIdToConnectionDataDict_data=new_edgeJointNodesIdToConnectionDataDictList_data_str,
                                      new_collection_id_to_list_of_relation_ids_dict=new_collection_id_to_list_of_relation_ids_data_str)
-        global_vars.current_project.visualisation_uptodate.reset_full_state()
-        global_vars.current_project.save_visualisation_python_support_data(self.parent_screen.std_vis_wrap)
+
     @pyqtSlot()
     def receive_network_changed_notification(self):
         self.parent_screen.set_graph_saved_status(False)
@@ -92,6 +103,14 @@ class Backend(QObject):
         self.parent_screen.js_is_loading = False
         self.parent_screen.loading_graph_status_label.setText("")
 
+    @pyqtSlot()
+    def receive_type_overview_loaded(self):
+        self.parent_screen.reset_type_overview()
+
+    @pyqtSlot(str)
+    def receive_type_group_expand_request(self, group_id):
+        self.parent_screen.expand_type_group(group_id)
+
     @classmethod
     def correct_node_title_attributes(cls, new_node_data_str):
         # correcting the formatting of the title attribute of the node
@@ -112,6 +131,8 @@ class DynamicDataVisualisationScreen(Screen):
         # data variables
         self.objects_in_memory = []
         self.std_vis_wrap = None
+        # only set while the type overview is shown
+        self.type_overview_graph: Optional[TypeOverviewGraph] = None
         self.js_is_loading = False
         self.max_slider_value = 50
 
@@ -189,6 +210,7 @@ class DynamicDataVisualisationScreen(Screen):
                                           "2 Spinnenweb visualisatie",
                                           "3 Shell visualisatie",
                                           "4 ForceAtlas2Based visualisatie",
+                                          VisualisationHelper.type_overview_mode,
                                           ])
         self.visualisation_mode.setToolTip(self._("Options to generate the visualisation differently"))
         self.visualisation_mode.currentTextChanged.connect(self.on_visualisation_option_change)
@@ -286,19 +308,20 @@ Help voor het gebruik van het datavisualisatie scherm:
         return frame
 
     def fill_frame_layout_legend(self):
-        typeURIs_in_memory = [object_in_memory.typeURI for object_in_memory in
-                              self.objects_in_memory]
+        # every typeURI once, so the legend is made per type instead of per object
+        typeURIs_in_memory = {object_in_memory.typeURI for object_in_memory in
+                              self.objects_in_memory}
 
         initial_state_per_relation_dict = {}
-        key_list = list(self.relation_id_to_relation_show_checkbox_dict.keys())
         for relatie in typeURIs_in_memory:
-            if relatie in key_list:
+            if relatie in self.relation_id_to_relation_show_checkbox_dict:
                 initial_state_per_relation_dict[relatie] = self.relation_id_to_relation_show_checkbox_dict[
                     relatie].isChecked()
             else:
                 initial_state_per_relation_dict[relatie] =  True
 
 
+
         for i in reversed(range(self.frame_layout_legend.count())):
             item = self.frame_layout_legend.takeAt(i)
             if item.widget():
@@ -369,6 +392,8 @@ Help voor het gebruik van het datavisualisatie scherm:
 
         self.loading_graph_status_label.setText(self._("Loading graph"))
 
+        # the type overview reports itself when it is loaded
+        self.type_overview_graph = None
         self.view.setUrl(QUrl.fromLocalFile(str(html_loc).replace("\\","/")))
 
         if not self.std_vis_wrap:
@@ -378,7 +403,7 @@ Help voor het gebruik van het datavisualisatie scherm:
 
         self.set_graph_saved_status(True)
 
-    def recreate_html(self,html_path:Path):
+    async def recreate_html(self,html_path:Path):
         OTLLogger.logger.debug(
             f"Executing DataVisualisationScreen.reload_html() for project {global_vars.current_project.eigen_referentie}",
             extra={"timing_ref": f"reload_html_{global_vars.current_project.eigen_referentie}"})
@@ -393,33 +418,27 @@ Help voor het gebruik van het datavisualisatie scherm:
 
 
         object_count = len(self.objects_in_memory)
-        if object_count > VisualisationHelper.object_count_limit:
-            # OBSOLETE: since V1.1 this will nearly never be entered since the threshold is so high
-            # do not draw the visualisation when there are too many assets
-            self.view.setVisible(False)
-            if not self.too_many_objects_message.isVisible():
-                self.too_many_objects_message.setVisible(True)
-
-            translation = self._(
-                "There are too many assets and relations to create a visualisation.\nmaximum: {0}\ncurrent: {1}")
-            self.too_many_objects_message.setText(translation.format(
-                VisualisationHelper.object_count_limit,
-                object_count))
-
+        self.too_many_objects_message.setVisible(False)
+        if not self.view.isVisible():
+            self.view.setVisible(True)
+
+        if (self.visualisation_mode.currentText() == VisualisationHelper.type_overview_mode or
+                object_count > VisualisationHelper.object_count_limit):
+            # too many assets to draw each of them, they are grouped per type
+            type_overview_graph = VisualisationHelper.create_type_overview_html(
+                html_loc=html_path, objects_in_memory=self.objects_in_memory)
+            self.std_vis_wrap = type_overview_graph.vis_wrap
         else:
-
-            self.too_many_objects_message.setVisible(False)
-            if not self.view.isVisible():
-                self.view.setVisible(True)
-
-            self.std_vis_wrap = VisualisationHelper.create_html(html_loc= html_path,
-                                                                objects_in_memory=self.objects_in_memory,
-                                                                vis_mode=self.visualisation_mode.currentText(),
-                                                                collection_threshold = self.collection_threshold_slider.value())
-            global_vars.current_project.visualisation_uptodate.reset_full_state()
-            global_vars.current_project.save_visualisation_python_support_data(self.std_vis_wrap)
-            self.load_html(html_path)
-            self.set_graph_saved_status(False)
+            # the layout is computed in a worker process, the screen stays responsive meanwhile
+            self.loading_graph_status_label.setText(self._("Loading graph"))
+            self.std_vis_wrap = await VisualisationHelper.create_html_with_layout(
+                html_loc=html_path, objects_in_memory=self.objects_in_memory,
+                vis_mode=self.visualisation_mode.currentText(),
+                collection_threshold=self.collection_threshold_slider.value())
+        global_vars.current_project.visualisation_uptodate.reset_full_state()
+        global_vars.current_project.save_visualisation_python_support_data(self.std_vis_wrap)
+        self.load_html(html_path)
+        self.set_graph_saved_status(False)
 
         #reset the state of all color legend checkboxes
         self.relation_id_to_relation_show_checkbox_dict.clear()
@@ -432,6 +451,17 @@ Help voor het gebruik van het datavisualisatie scherm:
 
 
 
+    def reset_type_overview(self):
+        self.type_overview_graph = TypeOverviewGraph(
+            objects=self.load_assets(), vis_wrap=VisualisationHelper.get_std_vis_wrap_instance())
+
+    def expand_type_group(self, group_id: str):
+        if self.type_overview_graph is None:
+            return
+        expansion = self.type_overview_graph.expand_group(group_id)
+        if expansion:
+            self.view.page().runJavaScript(f"applyTypeGroupExpansion({json.dumps(expansion)});")
+
     def get_current_html_path(self):
         return global_vars.current_project.get_current_visuals_html_path()
 
@@ -440,6 +470,12 @@ Help voor het gebruik van het datavisualisatie scherm:
             self.changed_project()
 
 
+        elif self.type_overview_graph is not None:
+            # the groups of the type overview are only made again when it is refreshed
+            if not RelationChangeDomain.is_visualisation_uptodate():
+                self.set_refresh_need_label_hidden_status(False)
+                return
+
         elif not RelationChangeDomain.is_visualisation_uptodate():
             # if self.visualisation_mode.currentText() != "standaard visualisatie":
             #     self.set_refresh_need_label_hidden_status(False)
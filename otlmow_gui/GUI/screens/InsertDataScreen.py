@@ -597,12 +597,7 @@ class InsertDataScreen(Screen):
         list_item = QTreeWidgetItem()
         list_item.setText(1, doc_name)
 
-        if asset_state == FileState.OK:
-            list_item.setIcon(0, qta.icon('mdi.check', color="green"))
-        elif asset_state == FileState.WARNING:
-            list_item.setIcon(0, qta.icon('mdi.alert', color="orange"))
-        elif asset_state == FileState.ERROR:
-            list_item.setIcon(0, qta.icon('mdi.close', color="red"))
+        self.set_file_state_icon(list_item=list_item, asset_state=asset_state)
 
         list_item.setData(1, 1, file)
         list_item.setSizeHint(1, QSize(0, 30))
@@ -614,6 +609,31 @@ class InsertDataScreen(Screen):
         self.project_files_overview_field.addTopLevelItem(list_item)
         self.project_files_overview_field.setItemWidget(list_item, 2, button)
 
+    @classmethod
+    def set_file_state_icon(cls, list_item: QTreeWidgetItem, asset_state: FileState) -> None:
+        if asset_state == FileState.OK:
+            list_item.setIcon(0, qta.icon('mdi.check', color="green"))
+        elif asset_state == FileState.WARNING:
+            list_item.setIcon(0, qta.icon('mdi.alert', color="orange"))
+        elif asset_state == FileState.ERROR:
+            list_item.setIcon(0, qta.icon('mdi.close', color="red"))
+
+    def update_file_state(self, file: str, asset_state: FileState) -> None:
+        """
+        Updates the icon of a file in the frontend list, used to show the result of each file
+        while the other files of the project are still being validated.
+
+        :param file: the path of the file as added with add_file_to_frontend_list
+        :type file: str
+        :param asset_state: the new state of the file
+        :type asset_state: FileState
+        """
+
+        for index in range(self.project_files_overview_field.topLevelItemCount()):
+            list_item = self.project_files_overview_field.topLevelItem(index)
+            if str(list_item.data(1, 1)) == str(file):
+                self.set_file_state_icon(list_item=list_item, asset_state=asset_state)
+
     def add_file_overview_placeholder_to_front_end_list(self):
         file_place_holder_item = QTreeWidgetItem()
         file_place_holder_item.setText(1, self._("There are no files added to this project"))
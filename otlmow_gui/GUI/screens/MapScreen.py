@@ -9,7 +9,7 @@ import qtawesome as qta
 
 from pathlib import Path
 
-from PyQt6.QtCore import pyqtSlot, QObject, QUrl
+from PyQt6.QtCore import pyqtSlot, QObject, QUrl, pyqtSignal
 from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtWebEngineCore import QWebEngineSettings
 from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -23,6 +23,7 @@ from otlmow_visuals.PyVisWrapper import PyVisWrapper
 from otlmow_gui.Domain import global_vars
 from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
+from otlmow_gui.Domain.util.MapStateTracker import MapStateTracker
 from otlmow_gui.Domain.step_domain.RelationChangeDomain import RelationChangeDomain
 from otlmow_gui.GUI.dialog_windows.LoadingImageWindow import add_loading_screen
 from otlmow_gui.GUI.screens.Map_elements.MapHelper import MapHelper
@@ -40,9 +41,18 @@ HTML_DIR = Path.home() / 'OTLWizardProjects' / 'img' / 'html'
 class WebBridge(QObject):
     """Bridge between JavaScript and Python using QWebChannel."""
 
+    # the changes of the assets since the map was created, see MapHelper.create_asset_changes_message
+    assets_changed = pyqtSignal(str)
+
     def __init__(self,folium_map: folium.Map):
         super().__init__()
         self.folium_map = folium_map
+        self.is_map_ready = False
+
+    @pyqtSlot()
+    def map_ready(self):
+        """Called by JavaScript when the page is connected to the webchannel."""
+        self.is_map_ready = True
 
 
     @pyqtSlot(str)
@@ -80,6 +90,7 @@ class MapScreen(Screen):
             os.makedirs(HTML_DIR,exist_ok=True)
         self.map = None
         self.prev_selected_asset_id = None
+        self.map_state_tracker = MapStateTracker()
         self.parent_screen = parent_screen
 
         self.frame_layout_legend = None
@@ -196,8 +207,25 @@ class MapScreen(Screen):
             f"Executing MapScreen.reload_html() for project {global_vars.current_project.eigen_referentie}",
             extra={"timing_ref": f"reload_html_{global_vars.current_project.eigen_referentie}"})
 
+        # the whole map is only created again for another project, otherwise only the changed
+        # assets are sent to the page
+        if (self.map_state_tracker.is_rendered_for(global_vars.current_project) and
+                self.web_bridge.is_map_ready):
+            self.relation_change_screen_object_list_content_dict = self.load_assets()
+            await self.update_map()
+        else:
+            await self.regenerate_map()
+
+        object_count = len(self.relation_change_screen_object_list_content_dict)
+        OTLLogger.logger.debug(
+            f"Executing MapScreen.reload_html() for project {global_vars.current_project.eigen_referentie} ({object_count} objects)",
+            extra={"timing_ref": f"reload_html_{global_vars.current_project.eigen_referentie}"})
+
+
+    async def regenerate_map(self) -> None:
         # throw away old data before loading the new
         self.relation_change_screen_object_list_content_dict = {}
+        self.map_state_tracker.reset_full_state()
         gc.collect()
 
         self.relation_change_screen_object_list_content_dict = self.load_assets()
@@ -205,21 +233,29 @@ class MapScreen(Screen):
         map_path, self.map , self.map_id = await MapHelper.create_html_map(self.relation_change_screen_object_list_content_dict,
                                                                      IMG_DIR, HTML_DIR,self.prev_selected_asset_id)
         self.web_bridge.folium_map = self.map
+        self.web_bridge.is_map_ready = False
         # self.webView.setHtml(open(map_path).read())
         map_QUrl = QUrl.fromLocalFile(map_path.replace("\\", "/"))
         self.webView.setUrl(map_QUrl)
         OTLLogger.logger.debug(map_QUrl.toString())
 
-        # self.webView.page().setWebChannel(self.channel)
-
-        first_coordinate = None
-
-
-        object_count = len(self.relation_change_screen_object_list_content_dict)
-        OTLLogger.logger.debug(
-            f"Executing MapScreen.reload_html() for project {global_vars.current_project.eigen_referentie} ({object_count} objects)",
-            extra={"timing_ref": f"reload_html_{global_vars.current_project.eigen_referentie}"})
-
+        self.map_state_tracker.set_rendered(
+            project=global_vars.current_project,
+            asset_states=MapHelper.get_asset_states(self.relation_change_screen_object_list_content_dict))
+
+    async def update_map(self) -> None:
+        """Sends the assets that changed since the last render to the page, the viewport of the
+        map stays the same."""
+
+        asset_states = MapHelper.get_asset_states(self.relation_change_screen_object_list_content_dict)
+        changed_ids, removed_ids = self.map_state_tracker.get_changes(asset_states)
+        if changed_ids or removed_ids:
+            message = await MapHelper.create_asset_changes_message(
+                self.relation_change_screen_object_list_content_dict, changed_ids=changed_ids,
+                removed_ids=removed_ids)
+            self.web_bridge.assets_changed.emit(message)
+        self.map_state_tracker.set_rendered(project=global_vars.current_project,
+                                            asset_states=asset_states)
 
     def load_assets(self) -> dict:
         assets = RelationChangeDomain.get_current_relation_change_screen_object_list_content_dict()
@@ -1,341 +1,85 @@
 import asyncio
-import base64
+import hashlib
+import json
 import pathlib
+from typing import Optional
 
+import numpy as np
+import shapely
 from PyQt6.QtCore import QUrl
 from folium import folium, JsCode
+from folium.plugins import MarkerCluster
 
+from otlmow_gui.Domain.ProgramFileStructure import ProgramFileStructure
 from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 
-from shapely.wkt import loads
 from pyproj import Transformer
 
+# a GeoJSON geometry: {"type": "Point", "LineString" or "Polygon", "coordinates": [lng, lat] ...}
+GeoJSONGeometry = dict
+
 
 class MapHelper:
     added_layer_asset_id_list = []
     normal_color = "#FF7F00"
     highlight_color = "#004d5c"
 
+    # the geometries of the OTL are in Lambert 72, the map uses WGS84 latitude and longitude
+    source_crs = 'EPSG:31370'
+    target_crs = 'EPSG:4326'
+    transformer: Optional[Transformer] = None
+    geojson_type_per_type_id = {shapely.GeometryType.POINT: 'Point',
+                                shapely.GeometryType.LINESTRING: 'LineString',
+                                shapely.GeometryType.LINEARRING: 'LineString',
+                                shapely.GeometryType.POLYGON: 'Polygon'}
+    asset_data_element_id = 'asset-feature-collection'
+    # cluster the points and draw the lines and polygons on a canvas, for maps with many assets
+    clustered_rendering = True
+    # see get_asset_bundle_urls
+    asset_bundle_urls: Optional[dict[str, str]] = None
+    # about 1 cm, more decimals only make the html bigger
+    coordinate_decimals = 7
+
     @classmethod
     async def create_html_map(cls,id_to_object_with_text_and_data_dict:dict,IMG_DIR,HTML_DIR,prev_selected_asset_id=None):
         m = cls.create_folium_map()
 
-        OTLLogger.logger.debug(pathlib.Path.home().drive)
-        OTLLogger.logger.debug(IMG_DIR)
-        OTLLogger.logger.debug(str(
-            (IMG_DIR/ "bol_orange.png")))
-
-        img_qurl = QUrl(pathlib.Path.home().drive + str(
-            (IMG_DIR / "bol_orange.png").absolute()).replace("\\", "/"))
-        img_path = img_qurl.path()
-
-        with open(img_path, 'rb') as img_file:
-            b64_data = base64.b64encode(img_file.read()).decode('utf-8')
-
-        # Create the data URL
-        data_url = f"data:image/png;base64,{b64_data}"
-
-        click_js = ("function onMapClick(e) {\n"
-                    f"var icon_path = '{data_url}';\n ")
-        click_js += """
-                               
-                                var map_id = e.originalEvent.srcElement.id;
-                                var lat = e.latlng.lat;
-                                var lng = e.latlng.lng;
-             
-                                //drawPoint(lat,lng,map_id,"","");
-                                
-
-                                //console.log(e);-
-
-                                //drawing polygons
-                                var lat1 = lat+1;
-                                var lng1 = lng+1;
-
-                                //// var latlngs = [[lat, lng],[lat1, lng],[lat1, lng1],[lat, lng1]];// sqaure
-                                //// var latlngs = [[lat, lng],[lat1, lng]];// line
-                                var latlngs = [[lat, lng],[lat1, lng],[lat1, lng1]];// corner
-                                ////var latlngs = [[lat, lng]];// dot
-                                //var map = e.originalEvent.srcElement;
-                                
-                                ////var polygon = L.polygon(latlngs, {color: "red"}).addTo(eval(map_id));
-                                //// zoom the map to the polygon
-                                ////eval(e.originalEvent.srcElement.id).fitBounds(polygon.getBounds());
-                                
-                                //drawLines(latlngs, map_id);
-
-                                // Send coordinates to Python
-                                //activateHighlightLayer( 'e64e7fcb-d429-4e3d-8651-706297f14ca4-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4');
-                                
-                            //}
-                             activateHighlightLayer( 'a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4');
-                            if('a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4' && ('a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4' in idToLayerDict))
-                            {
-                              eval(map_id).fitBounds(idToLayerDict['a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4'].getBounds());
-                              }
-                        """
-
-        click_js += "}"
         m.add_js_link(name="QWebChannel_script", url="qrc:///qtwebchannel/qwebchannel.js")
-        m.on(click=JsCode(click_js))
-
-        js_webchannel_script =  (f"var mapEl = document.getElementById('{m.get_name()}');\n"
-                                f"var icon_path = '{data_url}';\n "
-                                 f"var normal_color = '{cls.normal_color}';\n"
-                                 f"var highlight_color = '{cls.highlight_color}';\n")
-        js_webchannel_script += """
-        
-        //global state vars
-        var previousSelectedId = null;
-        var idToLayerDict = {}
-        var featureGroup = L.featureGroup()
-        
-        //turn cursor/mousepointer into crosshair
-        mapEl.style.cursor = "crosshair";
-        
-        // add webchannel to javascript to communicate with python
-        try{
-            var channel = new QWebChannel(qt.webChannelTransport, function(channel) {
-                window.pywebchannel = channel.objects.webBridge;
-            });
-        } catch (error) {
-          console.error(error);
-          alert("MapScreen: QWebChannel creation error");
-        }
-        
-        
-        function drawLines(latlngs, map_id, text, id)
-        {
-            var line = L.polyline(latlngs, {color:normal_color, weight:5}).addTo(eval(map_id)).bindPopup(text,{autoPan:false});
-            idToLayerDict[id] = line
-            line.on('click', function (e)
-            {
-                //highlight on click
-                var layer = e.target;
-                activateHighlightLayer(id);
-                sendSelectedIdToPython(id);
-            
-            });
-            featureGroup.addLayer(line);
-        }
-        
-        function drawPolygons(latlngs, map_id, text, id)
-        {
-            var line = L.polygon(latlngs, {color:normal_color, weight:5}).addTo(eval(map_id));
-            line.bindPopup(text,{offset:L.point(0,0),autoPan:false})
-            idToLayerDict[id] = line;
-            line.on('click', function (e)
-            {
-                //highlight on click
-                var layer = e.target;
-                activateHighlightLayer(id);
-                sendSelectedIdToPython(id);
-             
-            });
-            featureGroup.addLayer(line);
-        }
-        
-        function drawPoint(lat, lng, map_id, text, id)
-        {
-            var bolIcon = L.icon(
-            {
-                    iconUrl: icon_path,
-                    iconSize:     [15, 15], // size of the icon
-                    iconAnchor:   [7.5, 7.5], // point of the icon which will correspond to marker's location
-                    popupAnchor:  [0.5, 3] // point from which the popup should open relative to the iconAnchor
-            });
-            // Add marker dynamically
-            var marker = L.marker([lat, lng], {icon: bolIcon}).addTo(eval(map_id))
-            .bindPopup(text,{autoPan:false})
-            //.openPopup();
-            idToLayerDict[id] = marker
-           
-            // sendCoordinatesToPython(lat,lng);
-            marker.on('click', function (e)
-            {
-                //highlight on click
-                var layer = e.target;
-                activateHighlightLayer(id);
-                sendSelectedIdToPython(id);
-           
-            });
-            featureGroup.addLayer(marker);
-        }
-        
-        function activateHighlightLayer(id)
-        {
-            if(id in idToLayerDict)
-            {
-                var layer = idToLayerDict[id];
-                var htmlElement = undefined
-                if (layer._icon == undefined)
-                {
-                    //if the visual is line
-                    htmlElement = layer._path
-                    if(layer.options.color == normal_color)
-                    {
-                        disablePreviousHighlightLayer();
-                        layer.setStyle({color: highlight_color, weight:8})
-                        layer.options.color = highlight_color;
-                        layer.options.weight = 8;
-                        layer.redraw()
-                        previousSelectedId = id;
-                        layer.openPopup();
-                    }
-                }
-                else
-                {
-                    //if the visual is marker
-                    htmlElement = layer._icon
-                
-                    if(!L.DomUtil.hasClass(htmlElement, 'dash-border'))
-                    {
-                        disablePreviousHighlightLayer();
-                        L.DomUtil.addClass(htmlElement,'dash-border');
-                        previousSelectedId = id
-                        layer.openPopup();
-                    }
-                }
-            }
-            else
-            {
-                disablePreviousHighlightLayer();
-                previousSelectedId = id
-            }    
-        }
-        
-        function sendCoordinatesToPython(lat,lng)
-        {
-            if (window.pywebchannel) 
-            {
-                window.pywebchannel.receive_coordinates(JSON.stringify({lat: lat, lng: lng}));
-            } 
-            else 
-            {
-                console.log("QWebChannel is not initialized yet.");
-                alert("MapScreen: QWebChannel is not initialized");
-            }
-        }
-        
-        function sendSelectedIdToPython(id)
-        {
-            if (window.pywebchannel) 
-            {
-                window.pywebchannel.receive_selection_id(JSON.stringify({id: id}));
-            } 
-            else 
-            {
-                console.log("QWebChannel is not initialized yet.");
-            }
-        }
-        
-        function disablePreviousHighlightLayer()
-        {
-            if(previousSelectedId && (previousSelectedId in idToLayerDict))
-            {
-                var prevLayer = idToLayerDict[previousSelectedId]
-                var prevLayerhtmlElement = undefined
-                if (prevLayer._icon == undefined)
-                {
-                    //if the previous visual is line
-                    prevLayer.setStyle({color: normal_color, weight:5})
-                    prevLayer.options.color = normal_color
-                    prevLayer.options.weight = 5
-                    prevLayer.redraw()
-                }
-                else
-                {
-                    //if the previous visual is marker
-                    prevLayerhtmlElement = prevLayer._icon
-                    L.DomUtil.removeClass(prevLayerhtmlElement,'dash-border');
-                }
-                    
-            }
-        }
-        
-        function goToLayer(id, map_id)
-        {
-            if(id && (id in idToLayerDict))
-            {
-                var layer = idToLayerDict[id];
-                if (layer._icon == undefined)
-                {
-                    eval(map_id).fitBounds(layer.getBounds(),{maxZoom:20.5});
-                }
-                else
-                {
-                    //this means this is a marker (point geometry)
-                    eval(map_id).panTo(layer.getLatLng())
-                }
-            }
-        }
-        
-        
-        
-            """
-
-        m.get_root().script.add_child(folium.Element(js_webchannel_script))
+        if cls.clustered_rendering:
+            for name, url in MarkerCluster.default_js:
+                m.add_js_link(name=name, url=url)
+            for name, url in MarkerCluster.default_css:
+                m.add_css_link(name=name, url=url)
+        # the static part of the map is loaded from files that QtWebEngine caches
+        asset_bundle_urls = cls.get_asset_bundle_urls(IMG_DIR)
+        m.add_js_link(name="asset_map_script", url=asset_bundle_urls["js"])
+        m.add_css_link(name="asset_map_style", url=asset_bundle_urls["css"])
+        m.on(click=JsCode("onMapClick"))
+
         marker_count = len(id_to_object_with_text_and_data_dict)
         OTLLogger.logger.debug(f"Adding markers to map ({marker_count} markers",extra={"timing_ref":"adding_marker_to_map"})
         init_script = 'document.addEventListener("DOMContentLoaded", (event) => {\n'
-        for id, otl_object_with_text_and_data in id_to_object_with_text_and_data_dict.items():
-            await asyncio.sleep(0)
-            otl_object = otl_object_with_text_and_data[0]
-
-            text_and_data = otl_object_with_text_and_data[1]
-
-            if hasattr(otl_object, "geometry") and otl_object.geometry:
-                if "POINT" in otl_object.geometry:
-
-                    transformed_geometry = MapHelper.convert_wkt_to_wgs84(otl_object.geometry)
-                    coord_list = MapHelper.extract_first_level(transformed_geometry)
-                    # MapHelper.addProjectedMarker()
-                    popup_text = text_and_data["text"].screen_name + "<br>" + text_and_data[
-                        "text"].typeURI #+ "<br>" + otl_object.geometry
-                    for coord in coord_list:
-                        init_script += MapHelper.add_projected_marker(coord, m.get_name(),popup_text, id)
-
-                if "LINESTRING" in otl_object.geometry:
-                    transformed_geometry = MapHelper.convert_wkt_to_wgs84(otl_object.geometry)
-                    coord_list = MapHelper.extract_first_level(transformed_geometry)
-
-                    popup_text = text_and_data["text"].screen_name + "<br>" + text_and_data[
-                        "text"].typeURI #+ "<br>" + otl_object.geometry
-                    for pair in coord_list:
-                        init_script += MapHelper.add_projected_line(pair.split(","), m.get_name(),popup_text, id)
-
-                if "POLYGON" in otl_object.geometry:
-                    transformed_geometry = MapHelper.convert_wkt_to_wgs84(otl_object.geometry)
-                    polygon_list = MapHelper.extract_first_level(transformed_geometry)
-                    coord_list = []
-                    for polygon in polygon_list:
-                        second_level_list = MapHelper.extract_first_level(polygon)
-                        for coordinates in second_level_list:
-                            coord_list.append(coordinates.split(","))
-
-                    popup_text = text_and_data["text"].screen_name + "<br>" + text_and_data[
-                        "text"].typeURI
-                    init_script += MapHelper.add_projected_polygon(coord_list, m.get_name(),
-                                                                popup_text, id)
+        map_settings = {"mapId": m.get_name(), "iconPath": asset_bundle_urls["icon"],
+                        "normalColor": cls.normal_color, "highlightColor": cls.highlight_color,
+                        "clusteredRendering": cls.clustered_rendering}
+        init_script += f"initAssetMap({json.dumps(map_settings)});\n"
+
+        feature_collection = await cls.create_asset_feature_collection(
+            id_to_object_with_text_and_data_dict)
+        # one JSON payload instead of a generated call per geometry, JSON.parse is a lot faster
+        # than parsing the same data as javascript code
+        m.get_root().html.add_child(folium.Element(
+            cls.get_feature_collection_script_element(feature_collection)))
+        init_script += (f"var featureCollection = JSON.parse(document.getElementById("
+                        f"'{cls.asset_data_element_id}').textContent);\n"
+                        f"loadAssetFeatureCollection(featureCollection, '{m.get_name()}');\n")
 
         OTLLogger.logger.debug(f"Added markers to map ({marker_count} markers",
                                extra={"timing_ref": "adding_marker_to_map"})
         init_script += cls.get_zoom_to_assets_js_code(map_id=m.get_name(), prev_selected_asset_id=prev_selected_asset_id)
         init_script += "});"
 
-        # make highlight style when clicked
         m.get_root().script.add_child(folium.Element(init_script))
-        dash_style = ("""
-        <style>
-        .dash-border {"""
-            f"border: 2px dashed {cls.highlight_color};"
-            f"background-color: {cls.highlight_color};"
-        """}
-        
-        
-        </style>
-        """)
-        m.get_root().header.add_child(folium.Element(dash_style))
 
         map_path = cls.get_map_html_save_path(HTML_DIR, IMG_DIR)
         m.save(map_path)
@@ -343,6 +87,32 @@ class MapHelper:
         map = m
         return map_path, map , map_id
 
+    @classmethod
+    def get_asset_bundle_urls(cls, IMG_DIR: pathlib.Path) -> dict[str, str]:
+        """
+        Returns the file urls of the static part of the map: the script, the style and the icon.
+        The script and style urls have the hash of their content as version, so QtWebEngine
+        caches them until they change. The hashes are computed once per process.
+
+        :param IMG_DIR: the folder with the images
+        :type IMG_DIR: pathlib.Path
+        :return: the urls with the keys "js", "css" and "icon"
+        :rtype: dict[str, str]
+        """
+
+        if cls.asset_bundle_urls is None:
+            library_path = ProgramFileStructure.get_dynamic_library_path("javascripts_visualisation")
+            cls.asset_bundle_urls = {
+                "js": cls.get_versioned_file_url(library_path / "asset_map.js"),
+                "css": cls.get_versioned_file_url(library_path / "asset_map.css"),
+                "icon": QUrl.fromLocalFile(str((IMG_DIR / "bol_orange.png").absolute())).toString()}
+        return cls.asset_bundle_urls
+
+    @classmethod
+    def get_versioned_file_url(cls, file_path: pathlib.Path) -> str:
+        version = hashlib.sha256(file_path.read_bytes()).hexdigest()[:12]
+        return f"{QUrl.fromLocalFile(str(file_path.absolute())).toString()}?v={version}"
+
     @classmethod
     def get_map_html_save_path(cls, HTML_DIR: pathlib.Path, IMG_DIR: pathlib.Path) -> str:
         html_dir = IMG_DIR.parent / 'html'
@@ -365,11 +135,16 @@ class MapHelper:
             overlay=False,
             control=True
         )
-        return folium.Map(
+        folium_map = folium.Map(
             zoom_start=13,
             location=coordinate,
             tiles=tile
         )
+        # add_js_link and add_css_link change the lists of the class, the links of this map
+        # shouldn't end up in every map that is created after it
+        folium_map.default_js = list(folium_map.default_js)
+        folium_map.default_css = list(folium_map.default_css)
+        return folium_map
 
     @classmethod
     def add_marker(cls, lat, lon, map_id, web_view):
@@ -382,58 +157,92 @@ class MapHelper:
         web_view.page().runJavaScript(js_code)
 
     @classmethod
-    def add_projected_marker(cls, coord:str, map_id:str, tooltip_text:str,id:str):
-        """Adds a marker dynamically without reloading the map."""
-
-        js_code = (f"var split = '{coord}'.split(' ');\n"
-            "var point = L.CRS.EPSG3857.unproject(L.point([parseFloat(split[0]), parseFloat(split[1])] ));\n"
-                   f"drawPoint(point.lat,point.lng,'{map_id}','{tooltip_text}','{id}');\n")
-
-        cls.added_layer_asset_id_list.append(id)
-
-        return js_code
+    async def create_asset_feature_collection(cls, id_to_object_with_text_and_data_dict: dict) -> dict:
+        """
+        Creates a GeoJSON FeatureCollection with a feature per geometry (part) of the assets.
+        The typeURIs are listed once in the collection, the properties of a feature are the id
+        and name of the asset and the index of its typeURI.
+
+        :param id_to_object_with_text_and_data_dict: the (object, data) tuples per asset id
+        :type id_to_object_with_text_and_data_dict: dict
+        :return: the FeatureCollection
+        :rtype: dict
+        """
+
+        geometry_per_id = {
+            id: otl_object_with_text_and_data[0].geometry
+            for id, otl_object_with_text_and_data in id_to_object_with_text_and_data_dict.items()
+            if getattr(otl_object_with_text_and_data[0], "geometry", None)}
+        # all geometries are parsed and reprojected at once
+        geometries_per_id = dict(zip(
+            geometry_per_id.keys(),
+            cls.convert_wkt_list_to_wgs84(list(geometry_per_id.values()))))
+
+        typeURI_indices: dict[str, int] = {}
+        features = []
+        for index, (id, geometries) in enumerate(geometries_per_id.items()):
+            if index % 1000 == 0:
+                await asyncio.sleep(0)
+            if not geometries:
+                continue
+            text = id_to_object_with_text_and_data_dict[id][1]["text"]
+            properties = {"id": id, "name": text.screen_name,
+                          "typeURIIndex": typeURI_indices.setdefault(text.typeURI,
+                                                                     len(typeURI_indices))}
+            features.extend({"type": "Feature", "geometry": geometry, "properties": properties}
+                            for geometry in geometries)
+            cls.added_layer_asset_id_list.append(id)
+
+        return {"type": "FeatureCollection", "typeURIs": list(typeURI_indices),
+                "features": features}
 
     @classmethod
-    def add_projected_line(cls, coord_pair: str, map_id: str, tooltip_text: str, id: str):
-        """Adds a marker dynamically without reloading the map."""
+    def get_asset_states(cls, id_to_object_with_text_and_data_dict: dict) -> dict[str, tuple]:
+        """Returns per asset id what is drawn of the asset: the geometry and the popup text."""
 
-        js_code = (f"var split_pair = {coord_pair}\n"
-                   "latlngs = [];\n"
-                   "for (const  coord of split_pair) \n"
-                   "{\n"
-                   "    //console.log(coord);\n"
-                   "    var split = coord.trim().split(' ');\n"
-                   "    var point = L.CRS.EPSG3857.unproject(L.point([parseFloat(split[0].trim()), parseFloat(split[1].trim())] ));\n"
-                   "    //console.log(point);\n"
-                   "    latlngs.push([point.lat,point.lng]);\n"
-                   "}\n"
-                    f"drawLines(latlngs,'{map_id}','{tooltip_text}','{id}');\n")
-
-        cls.added_layer_asset_id_list.append(id)
-
-        return js_code
+        asset_states = {}
+        for id, otl_object_with_text_and_data in id_to_object_with_text_and_data_dict.items():
+            geometry = getattr(otl_object_with_text_and_data[0], "geometry", None)
+            if not geometry:
+                continue
+            text = otl_object_with_text_and_data[1]["text"]
+            asset_states[id] = (geometry, text.screen_name, text.typeURI)
+        return asset_states
 
     @classmethod
-    def add_projected_polygon(cls, coord_pair: list, map_id: str, tooltip_text: str, id: str):
-        """Adds a marker dynamically without reloading the map."""
-
-        js_code = (f"var polygons = {coord_pair}\n"
-                   "for (const  split_pair of polygons) \n"
-                   "{\n"
-                       "    latlngs = [];\n"
-                       "    for (const  coord of split_pair) \n"
-                       "    {\n"
-                       "        //console.log(coord);\n"
-                       "        var split = coord.trim().split(' ');\n"
-                       "        var point = L.CRS.EPSG3857.unproject(L.point([parseFloat(split[0].trim()), parseFloat(split[1].trim())] ));\n"
-                       "        //console.log(point);\n"
-                       "        latlngs.push([point.lat,point.lng]);\n"
-                       "    }\n"
-                       f"   drawPolygons(latlngs,'{map_id}','{tooltip_text}','{id}');\n"
-                    "}\n")
-        cls.added_layer_asset_id_list.append(id)
+    async def create_asset_changes_message(cls, id_to_object_with_text_and_data_dict: dict,
+                                           changed_ids: list[str], removed_ids: list[str]) -> str:
+        """
+        Creates the message with the changes of the assets on the map that is sent to the page
+        through the webBridge. The changed assets are removed and drawn again.
+
+        :param id_to_object_with_text_and_data_dict: the (object, data) tuples per asset id
+        :type id_to_object_with_text_and_data_dict: dict
+        :param changed_ids: the ids of the assets that were added or changed
+        :type changed_ids: list[str]
+        :param removed_ids: the ids of the assets that were removed
+        :type removed_ids: list[str]
+        :return: the message as JSON
+        :rtype: str
+        """
+
+        removed_id_set = set(removed_ids) | set(changed_ids)
+        cls.added_layer_asset_id_list[:] = [id for id in cls.added_layer_asset_id_list
+                                            if id not in removed_id_set]
+        feature_collection = await cls.create_asset_feature_collection(
+            {id: id_to_object_with_text_and_data_dict[id] for id in changed_ids})
+        return json.dumps({"removedIds": removed_ids + changed_ids,
+                           "featureCollection": feature_collection}, separators=(',', ':'),
+                          ensure_ascii=False)
 
-        return js_code
+    @classmethod
+    def get_feature_collection_script_element(cls, feature_collection: dict) -> str:
+        feature_collection_json = json.dumps(feature_collection, separators=(',', ':'),
+                                             ensure_ascii=False)
+        # a name or typeURI can't end the script element
+        feature_collection_json = feature_collection_json.replace("</", "<\\/")
+        return (f'<script type="application/json" id="{cls.asset_data_element_id}">'
+                f'{feature_collection_json}</script>')
 
     @classmethod
     def activate_highlight_layer_by_id(cls, asset_id, web_view,map_id):
@@ -444,66 +253,64 @@ class MapHelper:
         web_view.page().runJavaScript(js_code)
 
     @classmethod
-    def extract_first_level(cls,s):
-        results = []
-        level = 0
-        start = None
-        for i, char in enumerate(s):
-            if char == '(':
-                level += 1
-                if level == 1:  # starting a new top-level group
-                    start = i + 1  # content starts after the '('
-            elif char == ')':
-                if level == 1 and start is not None:
-                    results.append(s[start:i])
-                level -= 1
-        return results
+    def get_transformer(cls) -> Transformer:
+        # creating a transformer is expensive, one is used for all geometries
+        if cls.transformer is None:
+            cls.transformer = Transformer.from_crs(crs_from=cls.source_crs, crs_to=cls.target_crs,
+                                                   always_xy=True)
+        return cls.transformer
 
     @classmethod
-    def convert_wkt_to_wgs84(cls,wkt_string):
-        # Load the geometry from the WKT string
-        geometry = loads(wkt_string)
-
-        # Define the source CRS (EPSG:31370)
-        source_crs = 'EPSG:31370'
-
-        # Define the target CRS (WGS84)
-        target_crs = 'EPSG:3857'
-
-        transformer = Transformer.from_crs(crs_from=source_crs, crs_to=target_crs)
-        # Transform the coordinates
-        if geometry.geom_type == 'Point':
-            x, y = geometry.x, geometry.y
-
-
-            transformer.transform(12, 12)
-            lon, lat = transformer.transform( x, y)
-            return f'POINT ({lon} {lat})'
-
-        elif geometry.geom_type in ['LineString', 'MultiPoint']:
-            transformed_coords = [
-                transformer.transform( x, y) for x, y, z in geometry.coords
-            ]
-            return f'LINESTRING ({", ".join(f"{lon} {lat}" for lon, lat in transformed_coords)})'
-
-        elif geometry.geom_type in ['Polygon', 'MultiLineString']:
-            transformed_coords = [
-                transformer.transform( x, y) for x, y,z in geometry.exterior.coords
-            ]
-            return f'POLYGON (({" , ".join(f"{lon} {lat}" for lon, lat in transformed_coords)}))'
-
-        elif geometry.geom_type == 'MultiPolygon':
-            transformed_polygons = []
-            for polygon in geometry.geoms:
-                transformed_coords = [
-                    transformer.transform( x, y) for x, y in polygon.exterior.coords
-                ]
-                transformed_polygons.append(
-                    f'POLYGON (({" , ".join(f"{lon} {lat}" for lon, lat in transformed_coords)}))')
-            return f'MULTIPOLYGON ({", ".join(transformed_polygons)})'
-
-        else:
-            raise ValueError(f"Unsupported geometry type: {geometry.geom_type}")
+    def convert_wkt_list_to_wgs84(cls, wkt_strings: list[str]) -> list[list[GeoJSONGeometry]]:
+        """
+        Converts WKT geometries in Lambert 72 to the GeoJSON geometries that are drawn on the
+        map. All geometries are parsed with the vectorised API of shapely and all coordinates are
+        reprojected in one NumPy batch.
+
+        Every geometry results in a list of GeoJSON geometries: multi geometries and collections
+        in one geometry per part, polygons by their exterior ring. The coordinates are
+        [longitude, latitude] as GeoJSON requires. Invalid WKT results in an empty list.
+
+        :param wkt_strings: the WKT of the geometries
+        :type wkt_strings: list[str]
+        :return: the GeoJSON geometries of each geometry, in the order of wkt_strings
+        :rtype: list[list[GeoJSONGeometry]]
+        """
+
+        geojson_geometries: list[list[GeoJSONGeometry]] = [[] for _ in wkt_strings]
+        if not wkt_strings:
+            return geojson_geometries
+
+        geometries = shapely.from_wkt(np.array(wkt_strings, dtype=object), on_invalid='ignore')
+        for wkt_string in np.array(wkt_strings, dtype=object)[shapely.is_missing(geometries)]:
+            OTLLogger.logger.warning(f"Invalid geometry is not shown on the map: {wkt_string}")
+
+        parts, geometry_indices = shapely.get_parts(geometries, return_index=True)
+        type_ids = shapely.get_type_id(parts)
+        # nested collections are not shown
+        is_shown = np.isin(type_ids, list(cls.geojson_type_per_type_id)) & ~shapely.is_empty(parts)
+        parts, geometry_indices, type_ids = (parts[is_shown], geometry_indices[is_shown],
+                                             type_ids[is_shown])
+        is_polygon = type_ids == shapely.GeometryType.POLYGON
+        parts[is_polygon] = shapely.get_exterior_ring(parts[is_polygon])
+        geojson_types = [cls.geojson_type_per_type_id[type_id] for type_id in type_ids.tolist()]
+
+        coordinates, part_indices = shapely.get_coordinates(parts, return_index=True)
+        lng, lat = cls.get_transformer().transform(coordinates[:, 0], coordinates[:, 1])
+        lng_lats = np.round(np.column_stack([lng, lat]), cls.coordinate_decimals)
+
+        # the coordinates of a part are consecutive
+        part_starts = np.searchsorted(part_indices, np.arange(len(parts) + 1))
+        for part_index, (geometry_index, geojson_type) in enumerate(zip(geometry_indices,
+                                                                        geojson_types)):
+            part_lng_lats = lng_lats[part_starts[part_index]:part_starts[part_index + 1]].tolist()
+            if geojson_type == 'Point':
+                part_lng_lats = part_lng_lats[0]
+            elif geojson_type == 'Polygon':
+                part_lng_lats = [part_lng_lats]
+            geojson_geometries[geometry_index].append({"type": geojson_type,
+                                                       "coordinates": part_lng_lats})
+        return geojson_geometries
 
     @classmethod
     def zoom_to_assets(cls,web_view,map_id, prev_selected_asset_id=None):
@@ -518,7 +325,8 @@ class MapHelper:
                   {
                       activateHighlightLayer(previousSelectedId)
                   """)
-        js_code += f"eval('{map_id}').fitBounds(idToLayerDict[previousSelectedId].getBounds());"
+        # a marker has no bounds and can be in a cluster
+        js_code += f"goToLayer(previousSelectedId, '{map_id}');"
         js_code += ("""
                   }
                   else if(featureGroup)
@@ -367,9 +367,8 @@ class RelationChangeScreen(RelationChangeScreenInterface):
         :returns: None
         """
 
-        add_namespace = RelationChangeHelpers.is_unique_across_namespaces(
-            typeURI=relation_typeURI,
-            objects=RelationChangeDomain.shown_objects)
+        add_namespace = RelationChangeDomain.is_unique_across_namespaces(
+            typeURI=relation_typeURI)
         abbr_relation_typeURI = RelationChangeHelpers.get_abbreviated_typeURI(
             typeURI=relation_typeURI,
             add_namespace=add_namespace,
@@ -389,9 +388,8 @@ class RelationChangeScreen(RelationChangeScreenInterface):
         :returns: None
         """
 
-        add_namespace = RelationChangeHelpers.is_unique_across_namespaces(
-            typeURI=relation_typeURI,
-            objects=RelationChangeDomain.shown_objects)
+        add_namespace = RelationChangeDomain.is_unique_across_namespaces(
+            typeURI=relation_typeURI)
         abbr_relation_typeURI = RelationChangeHelpers.get_abbreviated_typeURI(
             typeURI=relation_typeURI,
             add_namespace=add_namespace,
@@ -1,11 +1,13 @@
 import abc
+import heapq
 from typing import Optional, Collection
 
-from PyQt6.QtCore import Qt, QModelIndex, QItemSelectionModel
-from PyQt6.QtGui import QColor, QStandardItem, QPixmap, QIcon, QPainter, QBrush, QFont
+from PyQt6.QtCore import Qt, QModelIndex, QItemSelectionModel, QTimer
+
+from PyQt6.QtGui import QColor, QPixmap, QIcon, QPainter, QBrush, QFont, QFontMetrics
 from PyQt6.QtWidgets import QTreeWidget, QFrame, QVBoxLayout, QLabel, QListWidget, QListWidgetItem, \
     QHeaderView, QTreeWidgetItem, QHBoxLayout, QLineEdit, QPushButton, QTreeView, \
-    QStyledItemDelegate
+    QStyledItemDelegate, QStyle
 
 import qtawesome as qta
 from otlmow_model.OtlmowModel.Classes.ImplementatieElement.AIMObject import AIMObject
@@ -17,17 +19,28 @@ from otlmow_gui.Domain.step_domain.RelationChangeDomain import RelationChangeDom
 from otlmow_gui.GUI.Styling import Styling
 from otlmow_gui.GUI.screens.general_elements.ButtonWidget import ButtonWidget
 from otlmow_gui.GUI.screens.RelationChange_elements.FolderTreeView import FolderTreeView
+from otlmow_gui.GUI.screens.RelationChange_elements.InstanceListModel import InstanceListModel, \
+    InstanceListRow, InstanceListItem
 
 IMG_DIR = ProgramFileStructure.get_dynamic_library_path('img')
 MULTI_SELECTION = QListWidget.SelectionMode.MultiSelection
 
 
 class AbstractInstanceListWidget:
+    # the column widths are measured on the rows with the longest texts instead of on all rows
+    column_width_sample_size = 50
+    column_width_padding = 12
+    # the search is applied when the typing pauses for this long
+    search_delay_ms = 250
 
     def __init__(self, language_settings,parent,labels,list_gui_style_class=None,needs_source_object= False):
         self._ = language_settings
         self.parent = parent
         self.search_text = ""
+        self.search_timer = QTimer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.search_delay_ms)
+        self.search_timer.timeout.connect(self.apply_search)
 
         self.search_bar = None
         self.clear_search_bar_button = None
@@ -49,10 +62,10 @@ class AbstractInstanceListWidget:
         self.selected_item = None
         self.list_gui_style_class = list_gui_style_class
 
-        self.item_type_data_index = 3
-        self.data_1_index = 4
-        self.data_last_added_index = 5
-        self.data_item_count_index = 8
+        self.item_type_data_index = InstanceListModel.item_type_role
+        self.data_1_index = InstanceListModel.data_1_role
+        self.data_last_added_index = InstanceListModel.last_added_role
+        self.data_item_count_index = InstanceListModel.item_count_role
 
         # self.data_1_index = 4
         # self.data_2_index = 5
@@ -68,7 +81,13 @@ class AbstractInstanceListWidget:
         self.multi_col_list = True
 
         self.id_to_object_with_text_and_data_dict: dict = {}
+        self.icon_cache: dict[tuple[str, str], QIcon] = {}
 
+        self.type_folder_font = QFont()
+        self.type_folder_font.setBold(True)
+        self.type_folder_font.setPointSize(10)
+        self.placeholder_font = QFont()
+        self.placeholder_font.setItalic(True)
 
     class LastAddedHighlightDelegate(QStyledItemDelegate):
 
@@ -89,7 +108,7 @@ class AbstractInstanceListWidget:
                 self.first_paint = True
 
             # Apply custom background for specific rows or items
-            if  self.parent.list_gui.model.itemFromIndex(index.siblingAtColumn(0)).data(self.parent.data_last_added_index) :
+            if index.siblingAtColumn(0).data(self.parent.data_last_added_index):
                 painter.fillRect(option.rect, QBrush(Styling.last_added_color))
 
             painter.restore()
@@ -121,6 +140,8 @@ class AbstractInstanceListWidget:
             self.list_gui.setSelectionMode(QTreeView.SelectionMode.MultiSelection)
         if self.list_gui_style_class:
             self.list_gui.setObjectName(self.list_gui_style_class)
+        self.list_gui.setSortingEnabled(True)
+        self.list_gui.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
 
 
@@ -204,10 +225,7 @@ class AbstractInstanceListWidget:
 
         # sourcery skip: remove-dict-keys
         # objects = RelationChangeDomain.objects
-        self.list_gui.setSortingEnabled(False)
-        self.list_gui.clear()
-
-        item_list = []
+        model: InstanceListModel = self.list_gui.model
         type_to_instance_dict = {}
         self.list_gui.itemDelegate().first_paint = False
         self.list_gui.itemDelegate().second_paint = False
@@ -215,12 +233,6 @@ class AbstractInstanceListWidget:
         text_and_data_per_element = self.extract_text_and_data_per_item(source_object, objects,
                                                                         last_added)
 
-        if self.needs_source_object and not source_object:
-            self.add_no_asset_selected_placeholder()
-        elif not objects:
-            self.add_no_options_placeholder()
-
-
         for text_and_data in text_and_data_per_element:
 
             abbr_typeURI = text_and_data['text'].typeURI
@@ -230,112 +242,137 @@ class AbstractInstanceListWidget:
             else:
                 type_to_instance_dict[abbr_typeURI] = [text_and_data]
 
-        folder_items_expanded = []
-        previously_selected_item = None
+        folder_rows = []
         self.multi_col_list = False
         for asset_type, text_and_data_list in type_to_instance_dict.items():
 
-            add_folder_based_on_search_text = False
-            folder_item = self.create_asset_type_standard_item(asset_type,text_and_data_list)
-            folder_item_font = QFont()
-            folder_item_font.setBold(True)
-            folder_item_font.setPointSize(10)
-            folder_item.setFont(folder_item_font)
-
-            # self.type_to_items_dict[asset_type] = []
+            folder_row = self.create_asset_type_folder_row(asset_type, text_and_data_list)
 
             if asset_type not in self.type_open_status:
                 self.type_open_status[asset_type] = False
-            elif self.type_open_status[asset_type]:
-                folder_items_expanded.append(folder_item)
 
             for text_and_data in text_and_data_list:
 
-                instance_item_tuple: tuple[QStandardItem] = self.create_instance_standard_item(text_and_data)
-                search_match = False
-
-                # search on all columns
-                for instance_item in instance_item_tuple:
-                    if (    self.search_text in instance_item.text().lower() or
-                            self.search_text in folder_item.text().lower()):
-                        search_match = True
-
-                        instance_item.setEditable(False)  # Make the item name non-editable
-                        if self.is_last_added(text_and_data):
-                            instance_item.setBackground(QBrush(QColor("#ecf0f1")))
-
-
-                if search_match:
-                    if self.is_previously_selected_requirement(text_and_data):
-                        previously_selected_item = instance_item_tuple[0]
-
-                    if len(instance_item_tuple) > 1:
-                        instance_item_tuple[1].setData(instance_item_tuple[0].data(self.data_1_index), self.data_1_index)
-                        instance_item_tuple[1].setData(instance_item_tuple[0].data(self.item_type_data_index), self.item_type_data_index)
-                        instance_item_tuple[1].setEditable(False)
-                        self.multi_col_list = True
+                instance_row = self.create_instance_row(text_and_data)
+                # the search is on all columns and on the type of the folder
+                instance_row.search_terms = (*instance_row.search_terms, asset_type)
+                if len(instance_row.texts) > 1:
+                    self.multi_col_list = True
 
-                    folder_item.appendRow(instance_item_tuple)
-                    add_folder_based_on_search_text = True
+                folder_row.rows.append(instance_row)
 
-                    if self.search_text:
-                        #if you are searching then open all the folders that have the results
-                        folder_items_expanded.append(folder_item)
+            folder_rows.append(folder_row)
 
-            if add_folder_based_on_search_text:
-                item_list.append(folder_item)
+        previously_selected_key = self.get_selected_row_key()
+        self.clear_selection_silently()
 
+        is_first_fill = not model.has_instance_rows()
+        model.set_column_count(2 if self.multi_col_list else 1)
+        # only the rows that changed are inserted, removed or updated in the view, the rows that
+        # don't match the search text are hidden by the model
+        inserted_rows = model.set_rows(folder_rows)
 
-        for folder_item in item_list:
-            folder_item.sortChildren(0,Qt.SortOrder.AscendingOrder)
-            if self.multi_col_list:
-                padding_item = QStandardItem("")
-                padding_item.setData(folder_item.data(self.data_1_index), self.data_1_index)
-                padding_item.setData(folder_item.data(self.item_type_data_index), self.item_type_data_index)
-                padding_item.setEditable(False)  # Make the folder name non-editable
-                padding_item.setSelectable(False)  # Optional: make the folder itself non-selectable
-
-                self.list_gui.addItem((folder_item, padding_item))
-            else:
-                self.list_gui.addItem(folder_item)
+        if self.needs_source_object and not source_object:
+            self.add_no_asset_selected_placeholder()
+        elif not objects:
+            self.add_no_options_placeholder()
 
-        self.list_gui.setSortingEnabled(True)
-        self.list_gui.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        self.resize_columns_to_rows(rows=inserted_rows, reset=is_first_fill)
+        self.update_expanded_folders()
+        self.reselect_row(previously_selected_key)
 
-        self.list_gui.expandAll()
-        self.list_gui.resizeColumnToContents(0)  # Resizes the first column based on its content
-        if self.multi_col_list:
-            self.list_gui.resizeColumnToContents(1)
 
-        self.list_gui.collapseAll()
+        if self.needs_source_object and not source_object:
+            model.setHeaderData(0, Qt.Orientation.Horizontal,"")
+        elif not objects:
+            model.setHeaderData(0, Qt.Orientation.Horizontal,"")
+        else:
+            for i in range(len(self.labels)):
+                model.setHeaderData(i, Qt.Orientation.Horizontal, self.labels[i])
 
-        # expand previously expanded items
-        for folder_item in folder_items_expanded:
-            folder_item_index = self.list_gui.model.indexFromItem(folder_item)
-            self.list_gui.expand(folder_item_index)
+        OTLLogger.logger.debug(
+            f"Execute AbstractInstanceListWidget.fill_list() ({object_list_length} objects) in list: {list_label_text} ",
+            extra={"timing_ref": timing_ref})
 
-        # select previously selected item
+    def clear_selection_silently(self) -> None:
+        # the selection is reset on every fill and search, as the model used to be rebuilt,
+        # without signalling the deselection
+        selection_model = self.list_gui.selectionModel()
+        selection_model.blockSignals(True)
+        selection_model.clear()
+        selection_model.blockSignals(False)
+
+        model: InstanceListModel = self.list_gui.model
+        for folder_row in model.root.rows:
+            if folder_row.selected_item_count:
+                self.reset_selected_item_count(InstanceListItem(model, folder_row))
+        self.list_gui.viewport().update()
+
+    def reselect_row(self, previously_selected_key) -> None:
+        model: InstanceListModel = self.list_gui.model
+        previously_selected_item = None
+        if previously_selected_key is not None:
+            previously_selected_row = model.get_instance_row(previously_selected_key)
+            if previously_selected_row and model.is_attached(previously_selected_row):
+                previously_selected_item = InstanceListItem(model, previously_selected_row)
         self.select_object_id(previously_selected_item=previously_selected_item)
         if not previously_selected_item:
             self.set_list_button_enabled( False)
             self.selected_object = None
             self.selected_item = None
 
+    def update_expanded_folders(self) -> None:
+        # expand previously expanded items, the instances of a folder are fetched on expanding
+        model: InstanceListModel = self.list_gui.model
+        for row in range(model.rowCount()):
+            folder_index = model.index(row, 0)
+            if folder_index.data(self.item_type_data_index) != "type":
+                continue
+            # if you are searching then open all the folders that have the results
+            is_expanded = bool(self.search_text or
+                               self.type_open_status.get(folder_index.data(self.data_1_index)))
+            if self.list_gui.isExpanded(folder_index) != is_expanded:
+                self.list_gui.setExpanded(folder_index, is_expanded)
+
+    def resize_columns_to_rows(self, rows: list[InstanceListRow], reset: bool = False) -> None:
+        """
+        Widens the columns to fit the given rows, without the view having to measure every row.
+        Per column only the rows with the longest texts are measured.
 
-        if self.needs_source_object and not source_object:
-            self.list_gui.model.setHeaderData(0, Qt.Orientation.Horizontal,"")
-        elif not objects:
-            self.list_gui.model.setHeaderData(0, Qt.Orientation.Horizontal,"")
-        else:
-            for i in range(len(self.labels)):
-                self.list_gui.model.setHeaderData(i, Qt.Orientation.Horizontal, self.labels[i])
+        :param rows: the rows that were added to the list
+        :type rows: list[InstanceListRow]
+        :param reset: the columns are fitted to the given rows, also if they get smaller
+        :type reset: bool
+        :return: None
+        """
 
-        OTLLogger.logger.debug(
-            f"Execute AbstractInstanceListWidget.fill_list() ({object_list_length} objects) in list: {list_label_text} ",
-            extra={"timing_ref": timing_ref})
+        model: InstanceListModel = self.list_gui.model
+        style = self.list_gui.style()
+        icon_width = style.pixelMetric(QStyle.PixelMetric.PM_SmallIconSize) + 4
+        indentation = self.list_gui.indentation()
+        font_metrics_per_font = {}
+
+        def get_width(row: InstanceListRow, column: int) -> int:
+            font = row.font or self.list_gui.font()
+            font_key = font.key()
+            if font_key not in font_metrics_per_font:
+                font_metrics_per_font[font_key] = QFontMetrics(font)
+            width = font_metrics_per_font[font_key].horizontalAdvance(model.get_text(row, column))
+            if column < len(row.icons) and row.icons[column] is not None:
+                width += icon_width
+            if column == 0:
+                width += indentation * (2 if row.item_type == "instance" else 1)
+            return width + self.column_width_padding
+
+        for column in range(model.columnCount()):
+            sampled_rows = heapq.nlargest(self.column_width_sample_size, rows,
+                                          key=lambda row: len(model.get_text(row, column)))
+            width = max((get_width(row, column) for row in sampled_rows), default=0)
+            if width and (reset or width > self.list_gui.columnWidth(column)):
+                self.list_gui.setColumnWidth(column, width)
 
     @abc.abstractmethod
-    def create_instance_standard_item(self, text_and_data):
+    def create_instance_row(self, text_and_data) -> InstanceListRow:
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -391,6 +428,7 @@ class AbstractInstanceListWidget:
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText(self._("search_button"))
         self.search_bar.textChanged.connect(self.search_listener)
+        self.search_bar.returnPressed.connect(self.apply_search)
 
         self.clear_search_bar_button = QPushButton()
         self.set_clear_icon(self.clear_search_bar_button)
@@ -403,21 +441,39 @@ class AbstractInstanceListWidget:
         return frame
 
     def search_listener(self,text:str) -> None:
-        self.search_text = text.lower()
-        if not self.search_text:
-            self.set_all_folder_items_collapsed()
+        # typing restarts the timer, the list is only filtered when the typing pauses
+        self.search_timer.start()
 
-        self.update_this_gui_list_content()
+    def apply_search(self) -> None:
+        """
+        Filters the list on the text of the search bar. The rows aren't recreated, the model
+        hides the rows that don't match, so the objects don't have to be collected again.
 
+        :return: None
+        """
+        self.search_timer.stop()
+        search_text = self.search_bar.text().lower()
+        if search_text == self.search_text:
+            return
 
-        # RelationChangeDomain.update_frontend()
+        self.search_text = search_text
+        if not self.search_text:
+            self.set_all_folder_items_collapsed()
+
+        model: InstanceListModel = self.list_gui.model
+        previously_selected_key = self.get_selected_row_key()
+        self.clear_selection_silently()
+        model.set_search_text(self.search_text)
+        self.update_expanded_folders()
+        self.reselect_row(previously_selected_key)
 
     def clear_search_listener(self) -> None:
-        self.search_bar.setText("")
-        RelationChangeDomain.update_frontend()
+        self.set_search_text("")
 
     def set_search_text(self, text) -> None:
+        # text that is set by the program is applied immediately
         self.search_bar.setText(text)
+        self.apply_search()
 
     def filter_on_search_text(self, items:list[QListWidgetItem]) -> list[QListWidgetItem]:
 
@@ -428,32 +484,30 @@ class AbstractInstanceListWidget:
         return self._("no_instance_selected")
 
 
-    def create_asset_type_standard_item(self, asset_type:str, text_and_data_list) -> QStandardItem:
+    def create_asset_type_folder_row(self, asset_type:str, text_and_data_list) -> InstanceListRow:
         item_count = len(text_and_data_list)
-        selected_item_count = 0
 
-        item = QStandardItem()
-        self.set_type_folder_text(type_folder_item= item,
-                                  otl_type= asset_type,
-                                  item_count=item_count,
-                                  selected_item_count=selected_item_count)
-        item.setEditable(False)  # Make the folder name non-editable
-        item.setSelectable(False)  # Optional: make the folder itself non-selectable
-
-        item.setData(asset_type,self.data_1_index)
-        item.setData("type", self.item_type_data_index)
-        item.setData(False, self.data_last_added_index)
-
-        # there are only so many data indexes you can use so we have to bundle information
-        item.setData([selected_item_count,item_count],self.data_item_count_index)
+        # the folder stays in place when its text changes with the selected item count
+        return InstanceListRow(key=asset_type,
+                               texts=(self.get_type_folder_text(otl_type=asset_type,
+                                                                item_count=item_count),),
+                               sort_texts=(asset_type,),
+                               data=asset_type,
+                               item_type="type",
+                               selectable=False,
+                               font=self.type_folder_font)
 
-        return item
-
-    def set_type_folder_text(self, type_folder_item, otl_type, item_count, selected_item_count = 0):
+    @classmethod
+    def get_type_folder_text(cls, otl_type, item_count, selected_item_count = 0) -> str:
         if not selected_item_count:
-            type_folder_item.setText(f"{otl_type} ({item_count})")
-        else:
-            type_folder_item.setText(f"{otl_type} ({selected_item_count}/{item_count})")
+            return f"{otl_type} ({item_count})"
+        return f"{otl_type} ({selected_item_count}/{item_count})"
+
+    def set_type_folder_text(self, type_folder_item: InstanceListItem, otl_type, item_count,
+                             selected_item_count = 0):
+        type_folder_item.setText(self.get_type_folder_text(otl_type=otl_type,
+                                                           item_count=item_count,
+                                                           selected_item_count=selected_item_count))
 
     def update_selected_count_data(self, type_folder_item, selected_item_count):
         item_count = type_folder_item.data(self.data_item_count_index)[1]
@@ -469,21 +523,22 @@ class AbstractInstanceListWidget:
                                   item_count=item_count,
                                   selected_item_count=selected_item_count)
 
-    def select_object_id(self, previously_selected_item: QStandardItem):
+    def select_object_id(self, previously_selected_item: Optional[InstanceListItem]):
         pass
 
-    def is_previously_selected_requirement(self, text_and_data):
-        return False
+    def get_selected_row_key(self):
+        # the key of the row that is selected again after the list is filled or filtered
+        return None
 
     def record_expanse_listener(self, index):
-        folder_item: QStandardItem = self.is_item_a_type_folder_at_row(index)
+        folder_item: InstanceListItem = self.is_item_a_type_folder_at_row(index)
         if folder_item:
             asset_type = folder_item.data(self.data_1_index)
             self.type_open_status[asset_type] = True
 
     def record_collapse_listener(self, index):
 
-        folder_item: QStandardItem = self.is_item_a_type_folder_at_row(index)
+        folder_item: InstanceListItem = self.is_item_a_type_folder_at_row(index)
         if folder_item:
             asset_type = folder_item.data(self.data_1_index)
             self.type_open_status[asset_type] = False
@@ -498,25 +553,27 @@ class AbstractInstanceListWidget:
     def set_all_folder_items_collapsed(self):
         self.type_open_status.clear()
 
-    def add_direction_icon_to_item(self, instance_item: QStandardItem, direction: str, typeURI: str):
+    def get_direction_icon(self, direction: str, typeURI: str) -> QIcon:
         direction_icon_path = f'{str(IMG_DIR)}/bidirect.png'
         if direction == "-->":
             direction_icon_path = f'{str(IMG_DIR)}/right.png'
         elif direction == "<--":
             direction_icon_path = f'{str(IMG_DIR)}/left.png'
 
-        pixmap = QPixmap(direction_icon_path)
-        self.apply_relation_color(pixmap, typeURI)
-
-        instance_item.setIcon(QIcon(pixmap))
-
-    def add_colored_relation_bol_icon_to_item(self, instance_item: QStandardItem, typeURI: str):
-        direction_icon_path = f'{str(IMG_DIR)}/bol.png'
+        return self.get_colored_icon(direction_icon_path, typeURI)
 
-        pixmap = QPixmap(direction_icon_path)
-        self.apply_relation_color(pixmap, typeURI)
+    def get_colored_relation_bol_icon(self, typeURI: str) -> QIcon:
+        return self.get_colored_icon(f'{str(IMG_DIR)}/bol.png', typeURI)
 
-        instance_item.setIcon(QIcon(pixmap))
+    def get_colored_icon(self, icon_path: str, typeURI: Optional[str] = None) -> QIcon:
+        # the icons are shared by all rows with the same icon and relation type
+        icon_key = (icon_path, typeURI)
+        if icon_key not in self.icon_cache:
+            pixmap = QPixmap(icon_path)
+            if typeURI is not None:
+                self.apply_relation_color(pixmap, typeURI)
+            self.icon_cache[icon_key] = QIcon(pixmap)
+        return self.icon_cache[icon_key]
 
     def apply_relation_color(self, pixmap, typeURI):
         painter = QPainter(pixmap)
@@ -534,22 +591,15 @@ class AbstractInstanceListWidget:
         pass
 
     def add_no_options_placeholder(self):
-        place_holder_item = QStandardItem(
-            self._("no_options_available"))
-        place_holder_item.setEditable(False)
-        place_holder_item.setEnabled(False)
-        place_holder_item.setSelectable(False)
+        self.list_gui.addItem(self.create_placeholder_row(self._("no_options_available")))
 
-        placeholder_font = QFont()
-        placeholder_font.setItalic(True)
-        place_holder_item.setFont(placeholder_font)
-
-        # padding_item = QStandardItem("")
-        # padding_item.setEditable(False)
-        # padding_item.setEnabled(False)
-        # padding_item.setSelectable(False)
-
-        self.list_gui.addItem([place_holder_item])
+    def create_placeholder_row(self, text: str) -> InstanceListRow:
+        return InstanceListRow(key=("placeholder", text),
+                               texts=(text,),
+                               item_type=None,
+                               selectable=False,
+                               enabled=False,
+                               font=self.placeholder_font)
 
     @classmethod
     def add_attribute_field_placeholder(cls, field,text):
@@ -562,17 +612,7 @@ class AbstractInstanceListWidget:
         field.addTopLevelItem(place_holder_item)
 
     def add_loading_placeholder(self):
-        place_holder_item = QStandardItem(
-            self._("loading"))
-        place_holder_item.setEditable(False)
-        place_holder_item.setEnabled(False)
-        place_holder_item.setSelectable(False)
-
-        placeholder_font = QFont()
-        placeholder_font.setItalic(True)
-        place_holder_item.setFont(placeholder_font)
-
-        self.list_gui.addItem(place_holder_item)
+        self.list_gui.addItem(self.create_placeholder_row(self._("loading")))
 
     def clear(self):
         self.list_gui.clear()
@@ -1,7 +1,6 @@
 from collections import namedtuple
 
 from PyQt6.QtCore import Qt, QItemSelectionModel
-from PyQt6.QtGui import QStandardItem
 from PyQt6.QtWidgets import QFrame
 from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper
 
@@ -9,6 +8,7 @@ from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.Domain.step_domain.RelationChangeDomain import RelationChangeDomain
 from otlmow_gui.GUI.screens.RelationChange_elements.AbstractInstanceListWidget import \
     AbstractInstanceListWidget
+from otlmow_gui.GUI.screens.RelationChange_elements.InstanceListModel import InstanceListRow
 
 from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import RelationChangeHelpers
 from otlmow_gui.exception_handler.ExceptionHandlers import create_task_reraise_exception
@@ -95,26 +95,20 @@ class ExistingRelationListWidget(AbstractInstanceListWidget):
         self.list_button.setProperty('class', 'remove_relation-button')
         return self.list_button
 
-    def create_instance_standard_item(self, text_and_data):
+    def create_instance_row(self, text_and_data) -> InstanceListRow:
         text = f"{text_and_data['text'].name_source}"
-        instance_item = QStandardItem(text)
-        instance_item.setData(text_and_data["data"].index, self.data_1_index)
-        instance_item.setData("instance", self.item_type_data_index)
-        instance_item.setData(text_and_data["data"].last_added, self.data_last_added_index)
-
-        instance_item.setTextAlignment(Qt.AlignmentFlag.AlignRight)
-
         text2 = f"{text_and_data['text'].name_target}"
-        instance_item2 = QStandardItem(text2)
-        instance_item2.setTextAlignment(Qt.AlignmentFlag.AlignTop)
-        # instance_item2.setData(text_and_data["data"].index, self.data_1_index)
-        # instance_item2.setData("instance", self.item_type_data_index)
-
-        self.add_direction_icon_to_item(instance_item=instance_item2,
-                                        direction=text_and_data['text'].direction,
-                                        typeURI= text_and_data['text'].full_typeURI)
 
-        return instance_item, instance_item2
+        direction_icon = self.get_direction_icon(direction=text_and_data['text'].direction,
+                                                 typeURI= text_and_data['text'].full_typeURI)
+        # the index of a relation changes when a relation before it is removed, so the row is
+        # keyed on the relation itself
+        return InstanceListRow(key=text_and_data["key"],
+                               texts=(text, text2),
+                               data=text_and_data["data"].index,
+                               last_added=text_and_data["data"].last_added,
+                               icons=(None, direction_icon),
+                               alignments=(Qt.AlignmentFlag.AlignRight, Qt.AlignmentFlag.AlignTop))
 
     def existing_relations_selected(self):
         indices: list[int] = self.get_selected_data()
@@ -123,7 +117,7 @@ class ExistingRelationListWidget(AbstractInstanceListWidget):
 
     def get_selected_data(self):
         return [
-            self.list_gui.model.itemFromIndex(model_i).data(self.data_1_index)
+            model_i.data(self.data_1_index)
             for model_i in self.list_gui.selectionModel().selectedIndexes() if model_i.column() == 0]
 
     def remove_existing_relations_listener(self):
@@ -145,11 +139,13 @@ class ExistingRelationListWidget(AbstractInstanceListWidget):
                 identificator=relation_object.bronAssetId.identificator)
             target_object = RelationChangeDomain.get_object(
                 identificator=relation_object.doelAssetId.identificator)
-            screen_name_source = RelationChangeHelpers.get_screen_name(otl_object=source_object)
-            screen_name_target = RelationChangeHelpers.get_screen_name(otl_object=target_object)
-            add_namespace = RelationChangeHelpers.is_unique_across_namespaces(
-                typeURI=relation_object.typeURI,
-                objects=RelationChangeDomain.shown_objects)
+            source_display_record = RelationChangeDomain.get_display_record(source_object)
+            target_display_record = RelationChangeDomain.get_display_record(target_object)
+            screen_name_source = source_display_record.screen_name if source_display_record else None
+            screen_name_target = target_display_record.screen_name if target_display_record else None
+
+            add_namespace = RelationChangeDomain.is_unique_across_namespaces(
+                typeURI=relation_object.typeURI)
             abbr_typeURI = RelationChangeHelpers.get_abbreviated_typeURI(
                 typeURI=relation_object.typeURI,
                 add_namespace=add_namespace,
@@ -163,7 +159,8 @@ class ExistingRelationListWidget(AbstractInstanceListWidget):
 
             list_of_corresponding_values.append({
                 "text": Text(abbr_typeURI, screen_name_source, direction, screen_name_target,relation_object.typeURI),
-                "data": Data(i,relation_object in last_added)
+                "data": Data(i,relation_object in last_added),
+                "key": id(relation_object)
             })
 
         list_of_corresponding_values.sort(key=lambda val: (
@@ -176,13 +173,13 @@ class ExistingRelationListWidget(AbstractInstanceListWidget):
     def is_last_added(self, text_and_data: dict):
         return text_and_data["data"].last_added
 
-    def create_asset_type_standard_item(self, asset_type, text_and_data_list):
-        folder_item = super().create_asset_type_standard_item(asset_type, text_and_data_list)
+    def create_asset_type_folder_row(self, asset_type, text_and_data_list) -> InstanceListRow:
+        folder_row = super().create_asset_type_folder_row(asset_type, text_and_data_list)
 
         if text_and_data_list:
             full_typeURI = text_and_data_list[0]["text"].full_typeURI
-            self.add_colored_relation_bol_icon_to_item(folder_item, full_typeURI)
-        return folder_item
+            folder_row.icons = (self.get_colored_relation_bol_icon(full_typeURI),)
+        return folder_row
 
     def get_no_instance_selected_message(self):
         return self._("no_relation_selected")
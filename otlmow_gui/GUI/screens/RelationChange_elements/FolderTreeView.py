@@ -1,21 +1,15 @@
-from PyQt6.QtCore import Qt, QModelIndex
-from PyQt6.QtGui import QStandardItemModel, QStandardItem
-from PyQt6.QtWidgets import QTreeView, QVBoxLayout
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtWidgets import QTreeView
+
+from otlmow_gui.GUI.screens.RelationChange_elements.InstanceListModel import InstanceListModel, \
+    InstanceListRow
 
 
 class FolderTreeView(QTreeView):
     def __init__(self):
         super().__init__()
 
-        # Create the QStandardItemModel
-        self.model = QStandardItemModel()
-        # self.model.setHorizontalHeaderLabels(["Folders and Items"])
-
-        # Add custom folders and items
-        # self.add_folder_with_items("Folder 1", ["Item 1.1", "Item 1.2", "Item 1.3"])
-        # self.add_folder_with_items("Folder 2", ["Item 2.1", "Item 2.2"])
-        # self.add_folder_with_items("Folder 3", ["Item 3.1", "Item 3.2", "Item 3.3", "Item 3.4"])
-
+        self.model = InstanceListModel()
         self.setModel(self.model)
 
 
@@ -45,30 +39,11 @@ class FolderTreeView(QTreeView):
             self.setColumnWidth(0, half_width)
             # self.setColumnWidth(1, half_width)
 
-    def add_folder_with_items(self, folder_name, items):
-        # Create a folder item (top-level item)
-        folder_item = QStandardItem(folder_name)
-        folder_item.setEditable(False)  # Make the folder name non-editable
-        folder_item.setSelectable(False)  # Optional: make the folder itself non-selectable
-        folder_item.setToolTip("")
-        folder_item.setData(None, Qt.ItemDataRole.ToolTipRole)
-
-        # Add items to the folder
-        for item_name in items:
-            item = QStandardItem(item_name)
-            item.setEditable(False)  # Make the item name non-editable
-            item.setToolTip("")
-            item.setData(None, Qt.ItemDataRole.ToolTipRole)
-            folder_item.appendRow(item)
-
-        # Add the folder to the model
-        self.model.appendRow(folder_item)
-
     def clear(self):
         self.model.clear()
 
-    def addItem(self,folder_item):
-        self.model.appendRow(folder_item)
+    def addItem(self, row: InstanceListRow):
+        self.model.add_top_level_row(row)
 
     def event(self, event):
         if event.type() == event.Type.ToolTip:
@@ -0,0 +1,593 @@
+from typing import Any, Hashable, Iterable, Optional
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor, QFont
+
+
+class InstanceListRow:
+    """
+    A row of the InstanceListModel, either a type folder, an instance in a type folder or a
+    placeholder. A type folder keeps its instances in rows, the instances that match the search
+    text in visible_rows, of which only the first fetched_count rows are known by the view.
+    """
+
+    def __init__(self, key: Hashable, texts: tuple, data: Any = None, item_type: str = "instance",
+                 last_added: bool = False, icons: tuple = (), alignments: tuple = (),
+                 sort_texts: Optional[tuple] = None, selectable: bool = True,
+                 enabled: bool = True, font: Optional[QFont] = None,
+                 search_terms: tuple = ()):
+        self.key = key
+        self.texts = texts
+        self.sort_texts = sort_texts if sort_texts is not None else texts
+        self.data = data
+        self.item_type = item_type
+        self.last_added = last_added
+        self.icons = icons
+        self.alignments = alignments
+        self.selectable = selectable
+        self.enabled = enabled
+        self.font = font
+        self.search_terms = search_terms
+        self.search_text: Optional[str] = None
+
+        self.selected_item_count = 0
+        self.rows: list[InstanceListRow] = []
+        self.visible_rows: list[InstanceListRow] = []
+        self.fetched_count = 0
+        self.parent_row: Optional[InstanceListRow] = None
+        self.position = 0
+
+    def is_displayed_as(self, other: "InstanceListRow") -> bool:
+        return (self.texts == other.texts and self.last_added == other.last_added and
+                self.icons == other.icons and self.alignments == other.alignments and
+                self.font == other.font)
+
+    def update_from(self, other: "InstanceListRow") -> None:
+        if self.texts != other.texts or self.search_terms != other.search_terms:
+            self.search_terms = other.search_terms
+            self.search_text = other.search_text
+        self.texts = other.texts
+        self.data = other.data
+        self.last_added = other.last_added
+        self.icons = other.icons
+        self.alignments = other.alignments
+        self.font = other.font
+        self.selected_item_count = other.selected_item_count
+
+    def get_search_text(self) -> str:
+        # lowered once and kept with the row, the search only looks for a substring in it
+        if self.search_text is None:
+            self.search_text = "\n".join(text.lower() for text in (*self.texts, *self.search_terms)
+                                         if text)
+        return self.search_text
+
+
+class InstanceListItem:
+    """
+    QStandardItem-like access to a row of the InstanceListModel, so code that walks the list
+    (folder.child(row).text(), item.parent(), ...) doesn't depend on how the rows are stored.
+    """
+
+    def __init__(self, model: "InstanceListModel", row: InstanceListRow, column: int = 0):
+        self.model = model
+        self.row_data = row
+        self.column = column
+
+    def text(self) -> str:
+        return self.model.get_text(self.row_data, self.column)
+
+    def setText(self, text: str) -> None:
+        self.model.set_text(self.row_data, text)
+
+    def data(self, role: int) -> Any:
+        return self.model.get_row_data(self.row_data, self.column, role)
+
+    def setData(self, value: Any, role: int) -> None:
+        if role == InstanceListModel.item_count_role:
+            self.model.set_selected_item_count(self.row_data, value[0])
+
+    def parent(self) -> Optional["InstanceListItem"]:
+        parent_row = self.row_data.parent_row
+        if parent_row is None or parent_row is self.model.root:
+            return None
+        return InstanceListItem(self.model, parent_row)
+
+    def child(self, row: int, column: int = 0) -> "InstanceListItem":
+        return InstanceListItem(self.model, self.row_data.visible_rows[row], column)
+
+    def rowCount(self) -> int:
+        return len(self.row_data.visible_rows)
+
+    def hasChildren(self) -> bool:
+        return bool(self.row_data.visible_rows)
+
+    def isSelectable(self) -> bool:
+        return self.row_data.selectable
+
+    def row(self) -> int:
+        return self.row_data.position
+
+    def index(self) -> QModelIndex:
+        return self.model.index_of_row(self.row_data, self.column)
+
+
+class InstanceListModel(QAbstractItemModel):
+    """
+    Tree model of type folders with their instances for the lists of the RelationChangeScreen.
+
+    The rows are kept by the model instead of as QStandardItems, set_rows() compares the new rows
+    with the current rows on their key and only inserts, removes or changes the rows that
+    differ, so the view keeps its expanded folders and only repaints what changed. The instances
+    of a folder are handed to the view in batches (canFetchMore/fetchMore) when the folder is
+    expanded or scrolled. The search hides the rows that don't match instead of removing them.
+    """
+
+    # user roles, so the data doesn't show up as tooltip or background of the rows
+    item_type_role = Qt.ItemDataRole.UserRole.value
+    data_1_role = Qt.ItemDataRole.UserRole.value + 1
+    last_added_role = Qt.ItemDataRole.UserRole.value + 2
+    item_count_role = Qt.ItemDataRole.UserRole.value + 3
+
+    fetch_batch_size = 200
+    last_added_color = "#ecf0f1"
+
+    def __init__(self):
+        super().__init__()
+        self.root = InstanceListRow(key=None, texts=())
+        self.column_count = 1
+        self.header_labels: dict[int, str] = {}
+        self.sort_column = 0
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.key_to_instance_row: dict[Hashable, InstanceListRow] = {}
+        self.search_text = ""
+        # the instances that match the search text, None without search text
+        self.matching_rows: Optional[set[InstanceListRow]] = None
+
+    # QAbstractItemModel interface
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() and parent.column() > 0:
+            return QModelIndex()
+        parent_row = self.get_row(parent)
+        if (row < 0 or column < 0 or column >= self.column_count or
+                row >= self.get_fetched_count(parent_row)):
+            return QModelIndex()
+        # child indexes point to their folder, top level indexes don't have a pointer
+        if parent_row is self.root:
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, parent_row)
+
+    def parent(self, child: QModelIndex = None) -> Any:
+        if child is None:
+            return super().parent()
+        if not child.isValid():
+            return QModelIndex()
+        folder = child.internalPointer()
+        if folder is None:
+            return QModelIndex()
+        return self.createIndex(folder.position, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid() and parent.column() > 0:
+            return 0
+        return self.get_fetched_count(self.get_row(parent))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self.column_count
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.isValid() and parent.column() > 0:
+            return False
+        return bool(self.get_row(parent).visible_rows)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        parent_row = self.get_row(parent)
+        return (parent_row is not self.root and
+                parent_row.fetched_count < len(parent_row.visible_rows))
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        parent_row = self.get_row(parent)
+        self.fetch_rows(parent_row, parent_row.fetched_count + self.fetch_batch_size)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        row = self.get_row(index)
+        flags = Qt.ItemFlag.NoItemFlags
+        if row.enabled:
+            flags |= Qt.ItemFlag.ItemIsEnabled
+        if row.selectable:
+            flags |= Qt.ItemFlag.ItemIsSelectable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        return self.get_row_data(self.get_row(index), index.column(), role)
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if (orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole and
+                section < self.column_count):
+            return self.header_labels.get(section, str(section + 1))
+        return super().headerData(section, orientation, role)
+
+    def setHeaderData(self, section: int, orientation: Qt.Orientation, value: Any,
+                      role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if orientation != Qt.Orientation.Horizontal or section >= self.column_count:
+            return False
+        if self.header_labels.get(section) != value:
+            self.header_labels[section] = value
+            self.headerDataChanged.emit(orientation, section, section)
+        return True
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        self.sort_column = column
+        self.sort_order = order
+
+        self.layoutAboutToBeChanged.emit()
+        persistent_indexes = self.persistentIndexList()
+        persistent_rows = [(self.get_row(index), index.column()) for index in persistent_indexes]
+
+        for parent_row in (self.root, *self.root.rows):
+            self.sort_rows(parent_row.rows)
+            self.sort_rows(parent_row.visible_rows)
+            self.renumber(parent_row, 0)
+
+        self.changePersistentIndexList(
+            persistent_indexes,
+            [self.index_of_row(row, column, fetch=False) for row, column in persistent_rows])
+        self.layoutChanged.emit()
+
+    # QStandardItemModel-like access, used to walk through the list
+
+    def item(self, row: int, column: int = 0) -> Optional[InstanceListItem]:
+        if row >= len(self.root.visible_rows):
+            return None
+        return InstanceListItem(self, self.root.visible_rows[row], column)
+
+    def itemFromIndex(self, index: QModelIndex) -> Optional[InstanceListItem]:
+        if not index.isValid():
+            return None
+        return InstanceListItem(self, self.get_row(index), index.column())
+
+    def indexFromItem(self, item: InstanceListItem) -> QModelIndex:
+        return item.index()
+
+    # rows
+
+    def get_row(self, index: QModelIndex) -> InstanceListRow:
+        if not index.isValid():
+            return self.root
+        folder = index.internalPointer()
+        if folder is None:
+            return self.root.visible_rows[index.row()]
+        return folder.visible_rows[index.row()]
+
+    def get_fetched_count(self, parent_row: InstanceListRow) -> int:
+        # the type folders themselves are always known by the view
+        if parent_row is self.root:
+            return len(parent_row.visible_rows)
+        return parent_row.fetched_count
+
+    def get_instance_row(self, key: Hashable) -> Optional[InstanceListRow]:
+        return self.key_to_instance_row.get(key)
+
+    def has_instance_rows(self) -> bool:
+        return bool(self.key_to_instance_row)
+
+    def get_text(self, row: InstanceListRow, column: int) -> str:
+        if column < len(row.texts):
+            return row.texts[column]
+        return ""
+
+    def get_row_data(self, row: InstanceListRow, column: int, role: int) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.get_text(row, column)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return row.icons[column] if column < len(row.icons) else None
+        if role == Qt.ItemDataRole.FontRole:
+            return row.font
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return row.alignments[column] if column < len(row.alignments) else None
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return QBrush(QColor(self.last_added_color)) if row.last_added else None
+        if role == self.data_1_role:
+            return row.data
+        if role == self.item_type_role:
+            return row.item_type
+        if role == self.last_added_role:
+            return row.last_added
+        if role == self.item_count_role and row.item_type == "type":
+            return [row.selected_item_count, len(row.rows)]
+        return None
+
+    def is_attached(self, row: InstanceListRow) -> bool:
+        parent_row = row.parent_row
+        if parent_row is None or (parent_row is not self.root and
+                                  not self.is_attached(parent_row)):
+            return False
+        return (row.position < len(parent_row.visible_rows) and
+                parent_row.visible_rows[row.position] is row)
+
+    def index_of_row(self, row: InstanceListRow, column: int = 0, fetch: bool = True) -> QModelIndex:
+        if not self.is_attached(row):
+            return QModelIndex()
+        parent_row = row.parent_row
+        if parent_row is not self.root and row.position >= parent_row.fetched_count:
+            if not fetch:
+                return QModelIndex()
+            self.fetch_rows(parent_row, row.position + 1)
+        if parent_row is self.root:
+            return self.createIndex(row.position, column)
+        return self.createIndex(row.position, column, parent_row)
+
+    def fetch_rows(self, folder: InstanceListRow, fetched_count: int) -> None:
+        fetched_count = min(fetched_count, len(folder.visible_rows))
+
+        if fetched_count <= folder.fetched_count:
+            return
+        self.beginInsertRows(self.index_of_row(folder), folder.fetched_count, fetched_count - 1)
+        folder.fetched_count = fetched_count
+        self.endInsertRows()
+
+    def set_text(self, row: InstanceListRow, text: str) -> None:
+        row.texts = (text, *row.texts[1:])
+        self.emit_row_changed(row)
+
+    def set_selected_item_count(self, row: InstanceListRow, selected_item_count: int) -> None:
+        row.selected_item_count = selected_item_count
+
+    def emit_row_changed(self, row: InstanceListRow) -> None:
+        index = self.index_of_row(row, fetch=False)
+        if index.isValid():
+            self.dataChanged.emit(index, index.siblingAtColumn(self.column_count - 1))
+
+    def set_column_count(self, column_count: int) -> None:
+        if column_count > self.column_count:
+            self.beginInsertColumns(QModelIndex(), self.column_count, column_count - 1)
+            self.column_count = column_count
+            self.endInsertColumns()
+        elif column_count < self.column_count:
+            self.beginRemoveColumns(QModelIndex(), column_count, self.column_count - 1)
+            self.column_count = column_count
+            self.endRemoveColumns()
+
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.root.rows = []
+        self.root.visible_rows = []
+        self.key_to_instance_row.clear()
+        if self.matching_rows is not None:
+            self.matching_rows = set()
+        self.endResetModel()
+
+    def add_top_level_row(self, row: InstanceListRow) -> None:
+        self.attach_rows(self.root, [row])
+        self.root.rows.append(row)
+        self.insert_children(self.root, [row], len(self.root.visible_rows))
+
+    def set_rows(self, rows: list[InstanceListRow]) -> list[InstanceListRow]:
+        """
+        Updates the model to the given top level rows (type folders with their instances in
+        rows). Rows with the same key as a current row are kept and only get a dataChanged when
+        their display changes, so the cost depends on what changed instead of on the list size.
+        The current search text is applied to the new rows.
+
+        :param rows: the new top level rows
+        :type rows: list[InstanceListRow]
+        :return: the rows that were added to the model, folders and instances
+        :rtype: list[InstanceListRow]
+        """
+        inserted_rows = []
+        kept_rows = []
+        kept_folders = self.merge_children(self.root, rows, inserted_rows)
+        for folder, new_folder in kept_folders:
+            kept_rows.extend(self.merge_children(folder, new_folder.rows, inserted_rows))
+        kept_rows.extend(kept_folders)
+
+        changed_rows = [current_row for current_row, new_row in kept_rows
+                        if not current_row.is_displayed_as(new_row)]
+        for current_row, new_row in kept_rows:
+            current_row.update_from(new_row)
+
+        if self.matching_rows is not None:
+            self.match_rows(self.key_to_instance_row.values())
+        self.update_visible_rows()
+
+        for changed_row in changed_rows:
+            self.emit_row_changed(changed_row)
+        return inserted_rows
+
+    def merge_children(self, parent_row: InstanceListRow, new_rows: list[InstanceListRow],
+                       inserted_rows: list[InstanceListRow]
+                       ) -> list[tuple[InstanceListRow, InstanceListRow]]:
+        # only the rows of the model are updated here, the view follows in update_visible_rows()
+        current_key_to_row = {row.key: row for row in parent_row.rows}
+
+        # a row that moves to another place in the sort order is removed and inserted again
+        kept_rows = []
+        kept_current_rows = set()
+        merged_rows = []
+        added_rows = []
+        for new_row in new_rows:
+            current_row = current_key_to_row.get(new_row.key)
+            if (current_row is not None and current_row not in kept_current_rows and
+                    current_row.sort_texts == new_row.sort_texts):
+                kept_rows.append((current_row, new_row))
+                kept_current_rows.add(current_row)
+                merged_rows.append(current_row)
+            else:
+                added_rows.append(new_row)
+                merged_rows.append(new_row)
+
+        self.forget_rows([row for row in parent_row.rows if row not in kept_current_rows])
+
+        # the kept rows are in the same order in both lists, ties keep their current order
+        current_positions = {id(row): position for position, row in enumerate(parent_row.rows)}
+        merged_rows.sort(key=lambda row: current_positions.get(id(row), -1))
+        self.sort_rows(merged_rows)
+        parent_row.rows = merged_rows
+
+        self.attach_rows(parent_row, added_rows)
+        for added_row in added_rows:
+            inserted_rows.append(added_row)
+            inserted_rows.extend(added_row.rows)
+        return kept_rows
+
+    def update_visible_rows(self) -> None:
+        """
+        Shows the rows that match the search text and hides the others, like a
+        QSortFilterProxyModel but without a second model. Only the rows that appear or
+        disappear are signalled, a type folder is hidden when none of its instances are visible.
+        """
+        visible_top_level_rows = []
+        for row in self.root.rows:
+            if row.item_type != "type":
+                visible_top_level_rows.append(row)
+                continue
+
+            visible_rows = self.filter_rows(row.rows)
+            if self.is_attached(row):
+                self.update_visible_children(row, visible_rows)
+            else:
+                # the view doesn't know the instances of a hidden folder
+                row.visible_rows = visible_rows
+                row.fetched_count = 0
+                self.renumber(row, 0)
+            if visible_rows:
+                visible_top_level_rows.append(row)
+        self.update_visible_children(self.root, visible_top_level_rows)
+
+    def filter_rows(self, rows: list[InstanceListRow]) -> list[InstanceListRow]:
+        if self.matching_rows is None:
+            return list(rows)
+        return [row for row in rows if row in self.matching_rows]
+
+    def update_visible_children(self, parent_row: InstanceListRow,
+                                visible_rows: list[InstanceListRow]) -> None:
+        # both lists are in the sort order, so removing the hidden rows first leaves the rows
+        # that stay visible at the right place for the insertions
+        visible_row_set = set(visible_rows)
+        self.remove_children(parent_row, [position for position, row
+                                          in enumerate(parent_row.visible_rows)
+                                          if row not in visible_row_set])
+
+        current_row_set = set(parent_row.visible_rows)
+        insert_start = None
+        for position, row in enumerate(visible_rows):
+            if row in current_row_set:
+                if insert_start is not None:
+                    self.insert_children(parent_row, visible_rows[insert_start:position],
+                                         insert_start)
+                    insert_start = None
+            elif insert_start is None:
+                insert_start = position
+        if insert_start is not None:
+            self.insert_children(parent_row, visible_rows[insert_start:], insert_start)
+
+    def remove_children(self, parent_row: InstanceListRow, positions: list[int]) -> None:
+        # remove consecutive positions at once, starting at the end so the positions stay valid
+        for first, last in reversed(self.get_ranges(positions)):
+            fetched_count = self.get_fetched_count(parent_row)
+            removed_rows = parent_row.visible_rows[first:last + 1]
+            if first < fetched_count:
+                visible_last = min(last, fetched_count - 1)
+                self.beginRemoveRows(self.index_of_row(parent_row), first, visible_last)
+                del parent_row.visible_rows[first:last + 1]
+                parent_row.fetched_count -= visible_last - first + 1
+                self.renumber(parent_row, first)
+                self.endRemoveRows()
+            else:
+                del parent_row.visible_rows[first:last + 1]
+                self.renumber(parent_row, first)
+            # the instances of a removed folder have to be fetched again when it is shown
+            for removed_row in removed_rows:
+                removed_row.fetched_count = 0
+
+    def insert_children(self, parent_row: InstanceListRow, rows: list[InstanceListRow],
+                        position: int) -> None:
+        fetched_count = self.get_fetched_count(parent_row)
+        is_fully_fetched = fetched_count == len(parent_row.visible_rows)
+        # rows that are inserted after the fetched rows are handed to the view by fetchMore
+        if position > fetched_count or (position == fetched_count and not is_fully_fetched):
+            parent_row.visible_rows[position:position] = rows
+            self.renumber(parent_row, position)
+            return
+
+        self.beginInsertRows(self.index_of_row(parent_row), position, position + len(rows) - 1)
+        parent_row.visible_rows[position:position] = rows
+        self.renumber(parent_row, position)
+        parent_row.fetched_count += len(rows)
+        self.endInsertRows()
+
+    def attach_rows(self, parent_row: InstanceListRow, rows: list[InstanceListRow]) -> None:
+        for row in rows:
+            row.parent_row = parent_row
+            if row.item_type == "instance":
+                self.key_to_instance_row[row.key] = row
+            self.sort_rows(row.rows)
+            for child_row in row.rows:
+                child_row.parent_row = row
+                self.key_to_instance_row[child_row.key] = child_row
+
+    def forget_rows(self, rows: list[InstanceListRow]) -> None:
+        for row in rows:
+            for forgotten_row in (row, *row.rows):
+                if self.key_to_instance_row.get(forgotten_row.key) is forgotten_row:
+                    del self.key_to_instance_row[forgotten_row.key]
+
+    # search
+
+    def set_search_text(self, search_text: str) -> None:
+        """
+        Filters the instances on the search text, without recreating any rows. A search text
+        that extends the previous one only searches in the previous matches.
+
+        :param search_text: the text to search in the texts and search terms of the instances
+        :type search_text: str
+        :return: None
+        """
+        search_text = search_text.lower()
+        if search_text == self.search_text:
+            return
+
+        previous_matching_rows = self.matching_rows
+        is_narrowed = previous_matching_rows is not None and self.search_text in search_text
+        self.search_text = search_text
+        if not search_text:
+            self.matching_rows = None
+        elif is_narrowed:
+            self.match_rows(previous_matching_rows)
+        else:
+            self.match_rows(self.key_to_instance_row.values())
+        self.update_visible_rows()
+
+    def match_rows(self, rows: Iterable[InstanceListRow]) -> None:
+        search_text = self.search_text
+        self.matching_rows = {row for row in rows if search_text in row.get_search_text()}
+
+    # order
+
+    @classmethod
+    def renumber(cls, parent_row: InstanceListRow, start: int) -> None:
+        rows = parent_row.visible_rows
+        for position in range(start, len(rows)):
+            rows[position].position = position
+
+    def sort_rows(self, rows: list[InstanceListRow]) -> None:
+        # sort() is stable for both orders, so equal rows keep their order
+        column = self.sort_column
+        rows.sort(key=lambda row: (row.sort_texts[column] or "") if column < len(row.sort_texts)
+                  else "", reverse=self.sort_order == Qt.SortOrder.DescendingOrder)
+
+    @classmethod
+    def get_ranges(cls, positions: list[int]) -> list[tuple[int, int]]:
+        ranges = []
+        for position in positions:
+            if ranges and ranges[-1][1] == position - 1:
+                ranges[-1] = (ranges[-1][0], position)
+            else:
+                ranges.append((position, position))
+        return ranges
@@ -1,14 +1,14 @@
 from collections import namedtuple
 
 from PyQt6.QtCore import QItemSelectionModel
-from PyQt6.QtGui import QStandardItem, QFont
 from PyQt6.QtWidgets import QFrame
-from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper
 
 from otlmow_gui.Domain.step_domain.RelationChangeDomain import RelationChangeDomain
 from otlmow_gui.GUI.dialog_windows.AddExternalAssetWindow import AddExternalAssetWindow
 from otlmow_gui.GUI.screens.RelationChange_elements.AbstractInstanceListWidget import \
     AbstractInstanceListWidget
+from otlmow_gui.GUI.screens.RelationChange_elements.InstanceListModel import InstanceListItem, \
+    InstanceListRow
 
 from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import RelationChangeHelpers
 from otlmow_gui.exception_handler.ExceptionHandlers import create_task_reraise_exception
@@ -83,14 +83,12 @@ class ObjectListWidget(AbstractInstanceListWidget):
         create_task_reraise_exception(RelationChangeDomain.set_possible_relations(selected_object=self.selected_object))
 
     def select_item_via_identificator(self,identificator):
-        for i in range(self.list_gui.model.rowCount()):
-
-            folder_item = self.list_gui.model.item(i)
-            for j in range(folder_item.rowCount()):
-                item = folder_item.child(j)
-                if item.data(self.data_1_index) == identificator:
-                    self.select_object_id(item)
-                    self.parent.set_existing_relation_search_bar_text(item.text())
+        # the instance rows are keyed on their identificator
+        row = self.list_gui.model.get_instance_row(identificator)
+        if row:
+            item = InstanceListItem(self.list_gui.model, row)
+            self.select_object_id(item)
+            self.parent.set_existing_relation_search_bar_text(item.text())
 
     def create_button(self):
         self.list_button.setEnabled(True)
@@ -104,42 +102,41 @@ class ObjectListWidget(AbstractInstanceListWidget):
         add_asset_window = AddExternalAssetWindow(self._)
         add_asset_window.draw_add_external_asset_window()
 
-    def is_previously_selected_requirement(self, text_and_data):
-        return self.selected_object and RelationChangeHelpers.get_corrected_identificator(self.selected_object) == text_and_data['data'].selected_object_id
+    def get_selected_row_key(self):
+        # the instance rows are keyed on their identificator
+        if not self.selected_object:
+            return None
+        return RelationChangeHelpers.get_corrected_identificator(self.selected_object)
 
     def extract_text_and_data_per_item(self, source_object, objects, last_added):
         list_of_corresponding_values = []
         self.id_to_object_with_text_and_data_dict.clear() # for usage in MapScreen
 
         for OTL_object in objects:
-            screen_name = RelationChangeHelpers.get_screen_name(OTL_object)
-            add_namespace = RelationChangeHelpers.is_unique_across_namespaces(
-                OTL_object.typeURI,
-                RelationChangeDomain.shown_objects)
-            abbr_typeURI = RelationChangeHelpers.get_abbreviated_typeURI(
-                OTL_object.typeURI,
-                add_namespace,
-                OTLObjectHelper.is_relation(OTL_object))
-
-            correct_id:str = RelationChangeHelpers.get_corrected_identificator(OTL_object)
+            display_record = RelationChangeDomain.get_display_record(OTL_object)
+            add_namespace = RelationChangeDomain.is_unique_across_namespaces(
+                OTL_object.typeURI)
+            abbr_typeURI = display_record.get_abbreviated_typeURI(add_namespace)
+
+            correct_id:str = display_record.identificator
             text_and_data = {
-                "text": self.Text(abbr_typeURI,screen_name,OTL_object.typeURI),
+                "text": self.Text(abbr_typeURI,display_record.screen_name,OTL_object.typeURI),
                 "data": self.Data(correct_id, False)
             }
             list_of_corresponding_values.append(text_and_data)
 
             self.id_to_object_with_text_and_data_dict[correct_id] = [OTL_object,text_and_data]
         return list_of_corresponding_values
-    def create_instance_standard_item(self, text_and_data):
+    def create_instance_row(self, text_and_data) -> InstanceListRow:
         text = f"{text_and_data['text'].screen_name}"
-        instance_item = QStandardItem(text)
-        instance_item.setData(text_and_data['data'].selected_object_id, self.data_1_index)
-        instance_item.setData("instance", self.item_type_data_index)
-        instance_item.setData(text_and_data["data"].last_added, self.data_last_added_index)
+        return InstanceListRow(key=text_and_data['data'].selected_object_id,
+                               texts=(text,),
+                               data=text_and_data['data'].selected_object_id,
+                               last_added=text_and_data["data"].last_added,
+                               search_terms=(text_and_data['data'].selected_object_id,))
 
-        return instance_item,
 
-    def select_object_id(self, previously_selected_item: QStandardItem):
+    def select_object_id(self, previously_selected_item: InstanceListItem):
         if previously_selected_item:
             previously_selected_item_index = self.list_gui.model.indexFromItem(
                 previously_selected_item)
@@ -154,19 +151,6 @@ class ObjectListWidget(AbstractInstanceListWidget):
     def is_last_added(self, text_and_data: dict):
         pass
 
-    def add_no_options_placeholder(self):
-        place_holder_item = QStandardItem(
-            self._("no_options_available"))
-        place_holder_item.setEditable(False)
-        place_holder_item.setEnabled(False)
-        place_holder_item.setSelectable(False)
-
-        placeholder_font = QFont()
-        placeholder_font.setItalic(True)
-        place_holder_item.setFont(placeholder_font)
-
-        self.list_gui.addItem(place_holder_item)
-
     def asset_clicked_listener(self):
         # automatically set the 3rd column (existing relations) to search for
         # the selected asset
@@ -1,8 +1,7 @@
 from collections import namedtuple
-from typing import Union
+from typing import Optional, Union
 
 from PyQt6.QtCore import QItemSelectionModel, Qt
-from PyQt6.QtGui import QStandardItem, QPixmap, QIcon, QFont
 from PyQt6.QtWidgets import QFrame, QCheckBox
 from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper
 from otlmow_model.OtlmowModel.BaseClasses.OTLObject import \
@@ -12,6 +11,7 @@ from otlmow_gui.Domain.logger.OTLLogger import OTLLogger
 from otlmow_gui.Domain.step_domain.RelationChangeDomain import RelationChangeDomain
 from otlmow_gui.GUI.screens.RelationChange_elements.AbstractInstanceListWidget import \
     AbstractInstanceListWidget, IMG_DIR
+from otlmow_gui.GUI.screens.RelationChange_elements.InstanceListModel import InstanceListRow
 from otlmow_gui.GUI.screens.RelationChange_elements.RelationChangeHelpers import RelationChangeHelpers
 from otlmow_gui.exception_handler.ExceptionHandlers import create_task_reraise_exception
 
@@ -41,23 +41,9 @@ class PossibleRelationListWidget(AbstractInstanceListWidget):
         return frame
 
     def add_no_asset_selected_placeholder(self):
-        place_holder_item = QStandardItem(
-            self._("Select_an_OTL-asset_to_see_possible_relations"))
-        place_holder_item.setEditable(False)
-        place_holder_item.setEnabled(False)
-        place_holder_item.setSelectable(False)
-
-        placeholder_font = QFont()
-        placeholder_font.setItalic(True)
-        place_holder_item.setFont(placeholder_font)
-
-        # padding_item = QStandardItem("")
-        # padding_item.setEditable(False)
-        # padding_item.setEnabled(False)
-        # padding_item.setSelectable(False)
-
-        # self.list_gui.addItem([place_holder_item,padding_item ])
-        self.list_gui.addItem([place_holder_item])
+        self.list_gui.addItem(self.create_placeholder_row(
+            self._("Select_an_OTL-asset_to_see_possible_relations")))
+
     def create_attribute_field(self):
         attribute_field = super().create_attribute_field()
         attribute_field.setProperty("class","attribute_field_possible_relation")
@@ -128,27 +114,22 @@ class PossibleRelationListWidget(AbstractInstanceListWidget):
         self.list_button.setProperty('class', 'add_relation-button')
         return self.list_button
 
-    def create_instance_standard_item(self, text_and_data):
+    def create_instance_row(self, text_and_data) -> InstanceListRow:
         text = f"{text_and_data['text'].screen_name}"
-        instance_item = QStandardItem(f"{text}")
-        instance_item.setData([text_and_data['data'].source_id,text_and_data['data'].target_id,text_and_data['data'].index], self.data_1_index)
-        # instance_item.setData(text_and_data['data'].source_id, self.data_1_index)
-        # instance_item.setData(text_and_data['data'].target_id, self.data_2_index)
-        # instance_item.setData(text_and_data['data'].index, self.data_3_index)
-        instance_item.setData("instance", self.item_type_data_index)
-        instance_item.setData(text_and_data["data"].last_added, self.data_last_added_index)
-
         text2 = f"{text_and_data['text'].target_typeURI}"
-        instance_item2 = QStandardItem(text2)
+        data = text_and_data['data']
 
-        pixmap = QPixmap(f'{str(IMG_DIR)}/bar_pipe.png')
-        instance_item2.setIcon(QIcon(pixmap))
+        direction_icon = self.get_direction_icon(direction=text_and_data['text'].direction,
+                                                 typeURI=text_and_data['text'].full_typeURI)
+        # a possible relation is the index-th relation of its target
+        return InstanceListRow(key=(data.target_id, data.index, text_and_data['text'].full_typeURI),
+                               texts=(text, text2),
+                               data=[data.source_id, data.target_id, data.index],
+                               last_added=data.last_added,
+                               search_terms=(data.target_id,),
+                               icons=(direction_icon,
 
-        self.add_direction_icon_to_item(instance_item=instance_item,
-                                        direction=text_and_data['text'].direction,
-                                        typeURI=text_and_data['text'].full_typeURI)
-
-        return instance_item,instance_item2
+                                      self.get_colored_icon(f'{str(IMG_DIR)}/bar_pipe.png')))
 
 
 
@@ -172,16 +153,14 @@ class PossibleRelationListWidget(AbstractInstanceListWidget):
 
     def get_selected_data(self):
         return [
-            self.Data(self.list_gui.model.itemFromIndex(model_i).data(self.data_1_index)[0],
-                      self.list_gui.model.itemFromIndex(model_i).data(self.data_1_index)[1],
-                      self.list_gui.model.itemFromIndex(model_i).data(self.data_1_index)[2], False)
-
+            self.Data(*model_i.data(self.data_1_index), False)
             for model_i in self.list_gui.selectionModel().selectedIndexes()
             if model_i.column() == 0] # we want one model_i per row, so only column == 0 is taken
 
 
     def extract_text_and_data_per_item(self, source_object: OTLObject, objects: Union[list[OTLObject],dict] , last_added):
         list_of_corresponding_values = []
+        source_display_record = RelationChangeDomain.get_display_record(source_object)
         for target_identificator, target_relations in objects.items():
 
             for i, relation in enumerate(target_relations):
@@ -219,22 +198,22 @@ class PossibleRelationListWidget(AbstractInstanceListWidget):
                 else:
                     direction = RelationChangeHelpers.unspecified_direction_icon
 
-                real_source_id: str = RelationChangeHelpers.get_corrected_identificator(
-                    otl_object=source_object)
+                real_source_id: str = source_display_record.identificator
                 abbr_relation_typeURI: str = RelationChangeHelpers.get_abbreviated_typeURI(
                     typeURI=relation.typeURI,
                     add_namespace=False,
                     is_relation=OTLObjectHelper.is_relation(relation))
-                target_screen_name:str = RelationChangeHelpers.get_screen_name(otl_object=target_object)
+                target_display_record = RelationChangeDomain.get_display_record(target_object)
+                # the target can't be found when its identificator is duplicated, the relation is
+                # logged and skipped below
+                target_screen_name: Optional[str] = (
+                    target_display_record.screen_name if target_display_record else None)
 
                 try:
-                    add_target_namespace:bool = RelationChangeHelpers.is_unique_across_namespaces(
-                        typeURI=target_object.typeURI,
-                        objects=RelationChangeDomain.shown_objects)
-                    abbr_target_object_typeURI:str = RelationChangeHelpers.get_abbreviated_typeURI(
-                        typeURI=target_object.typeURI,
-                        add_namespace=add_target_namespace,
-                        is_relation=OTLObjectHelper.is_relation(target_object))
+                    add_target_namespace:bool = RelationChangeDomain.is_unique_across_namespaces(
+                        typeURI=target_object.typeURI)
+                    abbr_target_object_typeURI:str = target_display_record.get_abbreviated_typeURI(
+                        add_target_namespace)
 
                     is_last_added:bool =    (relation.assetId.identificator in
                                             [e.assetId.identificator for e in last_added])
@@ -251,14 +230,6 @@ class PossibleRelationListWidget(AbstractInstanceListWidget):
                                           last_added=is_last_added)
                     })
                 except Exception as e:
-                    target_screen_name: str = RelationChangeHelpers.get_screen_name(
-                        otl_object=target_object)
-                    abbr_relation_typeURI: str = RelationChangeHelpers.get_abbreviated_typeURI(
-                        typeURI=relation.typeURI,
-                        add_namespace=False,
-                        is_relation=OTLObjectHelper.is_relation(relation))
-                    real_source_id: str = RelationChangeHelpers.get_corrected_identificator(
-                        otl_object=source_object)
                     OTLLogger.logger.debug(f"Couldn't make relation {abbr_relation_typeURI}: {real_source_id} {direction} {target_screen_name} because \n{e}")
         list_of_corresponding_values.sort(key=lambda val: (
             val['text'].target_typeURI, val['text'].screen_name, val['text'].typeURI))
@@ -267,13 +238,13 @@ class PossibleRelationListWidget(AbstractInstanceListWidget):
     def is_last_added(self, text_and_data: dict):
         return text_and_data["data"].last_added
 
-    def create_asset_type_standard_item(self, asset_type:str, text_and_data_list) -> QStandardItem:
-        folder_item = super().create_asset_type_standard_item(asset_type,text_and_data_list)
+    def create_asset_type_folder_row(self, asset_type:str, text_and_data_list) -> InstanceListRow:
+        folder_row = super().create_asset_type_folder_row(asset_type,text_and_data_list)
 
         if text_and_data_list:
             full_typeURI = text_and_data_list[0]["text"].full_typeURI
-            self.add_colored_relation_bol_icon_to_item(folder_item, full_typeURI)
-        return folder_item
+            folder_row.icons = (self.get_colored_relation_bol_icon(full_typeURI),)
+        return folder_row
 
     def get_no_instance_selected_message(self) -> str:
         return self._("no_relation_selected")
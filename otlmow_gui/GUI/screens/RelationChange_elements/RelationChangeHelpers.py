@@ -1,19 +1,16 @@
-import inspect
-import os
+from collections import Counter
 from pathlib import Path
-from typing import Optional, List, cast
+from typing import Optional, cast, Iterable
 
 from otlmow_model.OtlmowModel.BaseClasses.RelationInteractor import RelationInteractor
 from otlmow_model.OtlmowModel.Classes.Agent import Agent
 from otlmow_model.OtlmowModel.Classes.ImplementatieElement.AIMObject import AIMObject
 from otlmow_model.OtlmowModel.Helpers import OTLObjectHelper
-from otlmow_template.SubsetTemplateCreator import ROOT_DIR
 
 from otlmow_gui.Domain import global_vars
 from otlmow_gui.GUI.translation.GlobalTranslate import GlobalTranslate
 
 ROOT_DIR_GUI = Path(__file__).parent.parent.parent.parent
-SITE_PACKAGES_ROOT = ROOT_DIR
 class RelationChangeHelpers:
 
     unspecified_direction_icon:str = "<->"
@@ -68,17 +65,28 @@ class RelationChangeHelpers:
         return id.split("-")[0] + "-..." if OTLObjectHelper.is_aim_id(id) else id
 
     @classmethod
-    def is_unique_across_namespaces(cls, typeURI,objects):
-        split_typeURI = typeURI.split("#")
-        type_name = split_typeURI[-1]
-
-        unique_typeURIs = {otl_object.typeURI for otl_object in objects}
-        list_type_names = [typeURI.split("#")[-1] for typeURI in unique_typeURIs]
+    def get_type_name_counts(cls, typeURIs: Iterable[str]) -> dict[str, int]:
+        """
+        Counts per type name (the part of the typeURI after #) how many different typeURIs
+        have that name, so checking if a type name is used in more than one namespace is a
+        lookup.
+
+        :param typeURIs: the typeURIs of the objects, duplicates are counted once
+        :type typeURIs: Iterable[str]
+        :return: the number of typeURIs per type name
+        :rtype: dict[str, int]
+        """
+        return Counter(typeURI.split("#")[-1] for typeURI in set(typeURIs))
 
-        list_of_non_unique_type_names = filter(
-            lambda type_name: list_type_names.count(type_name) < 2, list_type_names)
-
-        return type_name not in list_of_non_unique_type_names
+    @classmethod
+    def is_unique_across_namespaces(cls, typeURI, objects=None,
+                                    type_name_counts: Optional[dict[str, int]] = None):
+        # True when the namespace has to be shown: the type name is used by another typeURI
+        # of the objects or the typeURI isn't one of the objects
+        if type_name_counts is None:
+            type_name_counts = cls.get_type_name_counts(
+                otl_object.typeURI for otl_object in objects)
+        return type_name_counts.get(typeURI.split("#")[-1], 0) != 1
 
     @classmethod
     def get_screen_icon_direction(cls, input_richting:str) -> str:
@@ -91,51 +99,21 @@ class RelationChangeHelpers:
 
 
     @classmethod
-    def list_all_non_abstract_class_type_uris(cls, otl_assets_only=False,
-                                              model_directory='otlmow_model/OtlmowModel'):
-        classes_to_instantiate = {}
-        type_uri_list: List[str] = []
-
-        class_location = Path(SITE_PACKAGES_ROOT) / model_directory / 'Classes/'
-
-        for location, dirs, file in os.walk(class_location):
-            dirs.remove("__pycache__")
-
-            for dir in dirs:
-                dir_location = Path(location, dir)
-
-                for f in os.listdir(dir_location):
-                    f = str(f)
-                    if not os.path.isfile(dir_location / f):
-                        continue
-                    classes_to_instantiate[Path(f).stem] = Path(
-                        dir_location / Path(f).stem).resolve()
-
-        classes_to_instantiate['Agent'] = class_location / 'Agent'
-
-        for class_name, file_path in classes_to_instantiate.items():
-            
-            import_path = f'{file_path.parts[-3]}.{file_path.parts[-2]}.{file_path.parts[-1]}'
-            if "Agent" in str(file_path.absolute()):
-                import_path = f'{file_path.parts[-2]}.{file_path.parts[-1]}'
-            if 'otlmow_model' not in import_path:
-                import_path = f'otlmow_model.OtlmowModel.{import_path}'
-
-            try:
-                py_mod = __import__(name=import_path, fromlist=f'{class_name}')
-            except ModuleNotFoundError as e:
-                raise ModuleNotFoundError(f'Could not import the module for {import_path}'
-                ) from e
-
-            class_ = getattr(py_mod, class_name)
-
-            if not inspect.isabstract(class_):
-                instance = class_()
-                if hasattr(instance, "typeURI"):
-                    if otl_assets_only and OTLObjectHelper.is_relation(instance):
-                        continue
-                    type_uri_list.append(instance.typeURI)
-        return type_uri_list
+    def list_all_non_abstract_class_type_uris(cls, otl_assets_only=False) -> list[str]:
+        """
+        Returns the typeURIs of all classes of the otlmow-model library that can be
+        instantiated, read from the class catalogue instead of importing every class.
+
+        :param otl_assets_only: leave out the relation classes
+        :type otl_assets_only: bool
+        :return: the sorted typeURIs of the non-abstract classes
+        :rtype: list[str]
+        """
+        # imported here, the class catalogue uses Helpers which imports this module
+        from otlmow_gui.Domain.database.ClassCatalogue import ClassCatalogue
+
+        return [entry.typeURI for entry in
+                ClassCatalogue.get_non_abstract_entries(otl_assets_only=otl_assets_only)]
 
     @classmethod
     def get_corrected_identificator(cls, otl_object: RelationInteractor):
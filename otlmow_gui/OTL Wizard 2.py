@@ -1,5 +1,8 @@
+import multiprocessing
+
 from otlmow_gui.wizard_main import otl_wizard_2_main
 
 if __name__ == '__main__':
+    # needed for the worker processes that validate documents in the frozen application
+    multiprocessing.freeze_support()
     otl_wizard_2_main()
-
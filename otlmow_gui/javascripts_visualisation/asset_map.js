@@ -0,0 +1,346 @@
+// Static runtime of the asset map that MapHelper.create_html_map creates, the map only contains
+// the data of the assets and calls initAssetMap with its settings.
+// ========
+
+//global state vars
+var mapId = null;
+var normal_color = null;
+var highlight_color = null;
+var previousSelectedId = null;
+var idToLayerDict = {}
+// an asset with a multi geometry has a layer per part
+var idToLayersDict = {}
+var featureGroup = null;
+var bolIcon = null;
+
+// in clustered rendering the points are clustered at low zoom and only the markers in
+// the viewport are added to the page, the lines and polygons are drawn on one canvas
+// that only draws the features in the viewport
+var canvasRenderer = undefined;
+var markerClusterGroup = null;
+
+function initAssetMap(settings)
+{
+    mapId = settings.mapId;
+    normal_color = settings.normalColor;
+    highlight_color = settings.highlightColor;
+    document.documentElement.style.setProperty('--highlight-color', highlight_color);
+    featureGroup = L.featureGroup();
+
+    bolIcon = L.icon(
+    {
+            iconUrl: settings.iconPath,
+            iconSize:     [15, 15], // size of the icon
+            iconAnchor:   [7.5, 7.5], // point of the icon which will correspond to marker's location
+            popupAnchor:  [0.5, 3] // point from which the popup should open relative to the iconAnchor
+    });
+
+    if (settings.clusteredRendering)
+    {
+        canvasRenderer = L.canvas({padding: 0.5});
+        if (L.markerClusterGroup)
+        {
+            markerClusterGroup = L.markerClusterGroup(
+            {
+                chunkedLoading: true,
+                removeOutsideVisibleBounds: true,
+                disableClusteringAtZoom: 20
+            });
+        }
+    }
+
+    //turn cursor/mousepointer into crosshair
+    document.getElementById(mapId).style.cursor = "crosshair";
+
+    // add webchannel to javascript to communicate with python
+    try{
+        var channel = new QWebChannel(qt.webChannelTransport, function(channel) {
+            window.pywebchannel = channel.objects.webBridge;
+            // python sends the assets that changed since the map was created
+            window.pywebchannel.assets_changed.connect(updateAssets);
+            window.pywebchannel.map_ready();
+        });
+    } catch (error) {
+      console.error(error);
+      alert("MapScreen: QWebChannel creation error");
+    }
+}
+
+function bindAssetLayer(layer, text, id)
+{
+    layer.bindPopup(text,{autoPan:false});
+    idToLayerDict[id] = layer;
+    (idToLayersDict[id] = idToLayersDict[id] || []).push(layer);
+    layer.on('click', function (e)
+    {
+        //highlight on click
+        activateHighlightLayer(id);
+        sendSelectedIdToPython(id);
+    });
+    if (layer instanceof L.Marker)
+    {
+        // the icon of a marker is created again when it leaves a cluster
+        layer.on('add', function (e)
+        {
+            if (previousSelectedId === id)
+            {
+                L.DomUtil.addClass(layer._icon,'dash-border');
+            }
+        });
+    }
+    else if (previousSelectedId === id)
+    {
+        // the selected asset was drawn again after a change
+        layer.setStyle({color: highlight_color, weight:8});
+    }
+    featureGroup.addLayer(layer);
+}
+
+function addMarkers(markers, map_id)
+{
+    if (markerClusterGroup)
+    {
+        markerClusterGroup.addTo(eval(map_id));
+        markerClusterGroup.addLayers(markers);
+    }
+    else
+    {
+        markers.forEach(function (marker) { marker.addTo(eval(map_id)); });
+    }
+}
+
+// calls callback when the marker is on the map, a marker in a cluster is shown first
+function showMarker(marker, callback)
+{
+    if (markerClusterGroup && !marker._icon && markerClusterGroup.hasLayer(marker))
+    {
+        markerClusterGroup.zoomToShowLayer(marker, callback);
+    }
+    else
+    {
+        callback();
+    }
+}
+
+function drawLines(latlngs, map_id, text, id)
+{
+    var line = L.polyline(latlngs, {color:normal_color, weight:5, renderer:canvasRenderer}).addTo(eval(map_id));
+    bindAssetLayer(line, text, id);
+}
+
+function drawPolygons(latlngs, map_id, text, id)
+{
+    var polygon = L.polygon(latlngs, {color:normal_color, weight:5, renderer:canvasRenderer}).addTo(eval(map_id));
+    bindAssetLayer(polygon, text, id);
+}
+
+function drawPoint(lat, lng, map_id, text, id)
+{
+    // Add marker dynamically
+    var marker = L.marker([lat, lng], {icon: bolIcon});
+    bindAssetLayer(marker, text, id);
+    addMarkers([marker], map_id);
+}
+
+// adds all assets of a GeoJSON FeatureCollection, one layer for the lines and polygons
+// and one for the points, the features have the properties id, name and typeURIIndex,
+// an index in the typeURIs of the collection
+function loadAssetFeatureCollection(featureCollection, map_id)
+{
+    var typeURIs = featureCollection.typeURIs;
+    function bindFeature(feature, layer)
+    {
+        var properties = feature.properties;
+        bindAssetLayer(layer, properties.name + "<br>" + typeURIs[properties.typeURIIndex],
+                       properties.id);
+    }
+    function isPoint(feature) { return feature.geometry.type === 'Point'; }
+
+    L.geoJSON(featureCollection,
+    {
+        filter: function (feature) { return !isPoint(feature); },
+        renderer: canvasRenderer,
+        style: function (feature) { return {color:normal_color, weight:5}; },
+        onEachFeature: bindFeature
+    }).addTo(eval(map_id));
+    var pointLayer = L.geoJSON(featureCollection,
+    {
+        filter: isPoint,
+        pointToLayer: function (feature, latlng) { return L.marker(latlng, {icon: bolIcon}); },
+        onEachFeature: bindFeature
+    });
+    addMarkers(pointLayer.getLayers(), map_id);
+}
+
+function removeAssets(ids)
+{
+    ids.forEach(function (id)
+    {
+        (idToLayersDict[id] || []).forEach(function (layer)
+        {
+            if (markerClusterGroup && markerClusterGroup.hasLayer(layer))
+            {
+                markerClusterGroup.removeLayer(layer);
+            }
+            else
+            {
+                layer.remove();
+            }
+            featureGroup.removeLayer(layer);
+        });
+        delete idToLayersDict[id];
+        delete idToLayerDict[id];
+    });
+}
+
+// applies the changes that python sends, the viewport of the map stays the same
+function updateAssets(message)
+{
+    var changes = JSON.parse(message);
+    removeAssets(changes.removedIds);
+    loadAssetFeatureCollection(changes.featureCollection, mapId);
+}
+
+function activateHighlightLayer(id)
+{
+    if(id in idToLayerDict)
+    {
+        var layer = idToLayerDict[id];
+        if (!(layer instanceof L.Marker))
+        {
+            //if the visual is line
+            if(layer.options.color == normal_color)
+            {
+                disablePreviousHighlightLayer();
+                layer.setStyle({color: highlight_color, weight:8})
+                layer.options.color = highlight_color;
+                layer.options.weight = 8;
+                layer.redraw()
+                previousSelectedId = id;
+                layer.openPopup();
+            }
+        }
+        else
+        {
+            //if the visual is marker
+            showMarker(layer, function ()
+            {
+                if(!L.DomUtil.hasClass(layer._icon, 'dash-border'))
+                {
+                    disablePreviousHighlightLayer();
+                    L.DomUtil.addClass(layer._icon,'dash-border');
+                    previousSelectedId = id
+                    layer.openPopup();
+                }
+            });
+        }
+    }
+    else
+    {
+        disablePreviousHighlightLayer();
+        previousSelectedId = id
+    }    
+}
+
+function sendCoordinatesToPython(lat,lng)
+{
+    if (window.pywebchannel) 
+    {
+        window.pywebchannel.receive_coordinates(JSON.stringify({lat: lat, lng: lng}));
+    } 
+    else 
+    {
+        console.log("QWebChannel is not initialized yet.");
+        alert("MapScreen: QWebChannel is not initialized");
+    }
+}
+
+function sendSelectedIdToPython(id)
+{
+    if (window.pywebchannel) 
+    {
+        window.pywebchannel.receive_selection_id(JSON.stringify({id: id}));
+    } 
+    else 
+    {
+        console.log("QWebChannel is not initialized yet.");
+    }
+}
+
+function disablePreviousHighlightLayer()
+{
+    if(previousSelectedId && (previousSelectedId in idToLayerDict))
+    {
+        var prevLayer = idToLayerDict[previousSelectedId]
+        if (!(prevLayer instanceof L.Marker))
+        {
+            //if the previous visual is line
+            prevLayer.setStyle({color: normal_color, weight:5})
+            prevLayer.options.color = normal_color
+            prevLayer.options.weight = 5
+            prevLayer.redraw()
+        }
+        else
+        {
+            //if the previous visual is marker, a clustered marker has no icon
+            if (prevLayer._icon)
+            {
+                L.DomUtil.removeClass(prevLayer._icon,'dash-border');
+            }
+        }
+
+    }
+}
+
+function goToLayer(id, map_id)
+{
+    if(id && (id in idToLayerDict))
+    {
+        var layer = idToLayerDict[id];
+        if (!(layer instanceof L.Marker))
+        {
+            eval(map_id).fitBounds(layer.getBounds(),{maxZoom:20.5});
+        }
+        else
+        {
+            //this means this is a marker (point geometry)
+            showMarker(layer, function () { eval(map_id).panTo(layer.getLatLng()); });
+        }
+    }
+}
+
+function onMapClick(e)
+{
+    var map_id = e.originalEvent.srcElement.id;
+    var lat = e.latlng.lat;
+    var lng = e.latlng.lng;
+
+    //drawPoint(lat,lng,map_id,"","");
+
+    //console.log(e);-
+
+    //drawing polygons
+    var lat1 = lat+1;
+    var lng1 = lng+1;
+
+    //// var latlngs = [[lat, lng],[lat1, lng],[lat1, lng1],[lat, lng1]];// sqaure
+    //// var latlngs = [[lat, lng],[lat1, lng]];// line
+    var latlngs = [[lat, lng],[lat1, lng],[lat1, lng1]];// corner
+    ////var latlngs = [[lat, lng]];// dot
+    //var map = e.originalEvent.srcElement;
+
+    ////var polygon = L.polygon(latlngs, {color: "red"}).addTo(eval(map_id));
+    //// zoom the map to the polygon
+    ////eval(e.originalEvent.srcElement.id).fitBounds(polygon.getBounds());
+
+    //drawLines(latlngs, map_id);
+
+    // Send coordinates to Python
+    //activateHighlightLayer( 'e64e7fcb-d429-4e3d-8651-706297f14ca4-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4');
+
+    activateHighlightLayer( 'a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4');
+    if('a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4' && ('a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4' in idToLayerDict))
+    {
+        eval(map_id).fitBounds(idToLayerDict['a303e80b-9863-4b47-b0c0-dadb8fc9b651-b25kZXJkZWVsI1ZvZXJ0dWlnbGFudGFhcm4'].getBounds());
+    }
+}
@@ -0,0 +1,96 @@
+// Overview of a large visualisation
+// ========
+// the assets are grouped per type in group nodes, a click on a group node asks python for the
+// next page of its assets and adds them around the group node
+
+var hiddenRelationColors = new Set();
+
+// text to html element
+function htmlTitle(html) {
+    const container = document.createElement("div");
+    container.innerHTML = html;
+    return container;
+}
+
+function onTypeOverviewClick(params)
+{
+    if (params.nodes.length === 0)
+        return;
+
+    var clickedNode = network.body.data.nodes.get(params.nodes[0]);
+    if (clickedNode && clickedNode.typeGroup && window.backend)
+        window.backend.receive_type_group_expand_request(clickedNode.id);
+}
+
+function applyTypeGroupExpansion(expansion)
+{
+    var groupNode = network.body.data.nodes.get(expansion.groupId);
+    var groupPosition = network.getPosition(expansion.groupId);
+    var radius = 150 + 15 * expansion.addNodes.length;
+
+    var addNodes = expansion.addNodes.map((node, index) =>
+    {
+        var angle = 2 * Math.PI * index / expansion.addNodes.length;
+        node.x = groupPosition.x + radius * Math.cos(angle);
+        node.y = groupPosition.y + radius * Math.sin(angle);
+        node.color = groupNode.color;
+        if (node.title && node.title.html !== undefined)
+            node.title = htmlTitle(node.title.html);
+        return node;
+    });
+    var addEdges = expansion.addEdges.map((edge) =>
+    {
+        edge.hidden = hiddenRelationColors.has(edge.color);
+        return edge;
+    });
+
+    network.body.data.edges.remove(expansion.removeEdgeIds);
+    network.body.data.nodes.add(addNodes);
+    network.body.data.nodes.update(expansion.updateNodes);
+    network.body.data.nodes.remove(expansion.removeNodeIds);
+    network.body.data.edges.update(addEdges);
+}
+
+function UpdateAllRelationHiddenStatesOfColor(color, hidden)
+{
+    if (hidden)
+        hiddenRelationColors.add(color);
+    else
+        hiddenRelationColors.delete(color);
+
+    var newAttributesEdgesList = [];
+    network.body.data.edges.forEach((edge) =>
+    {
+        if (edge.color == color)
+            newAttributesEdgesList.push({"id": edge.id, "hidden": hidden});
+    });
+    network.body.data.edges.update(newAttributesEdgesList);
+}
+
+function sendCurrentCombinedDataToPython()
+{
+    // the overview is generated again when it is opened, its layout isn't saved
+}
+
+document.addEventListener("DOMContentLoaded", function()
+{
+    network.on('click', onTypeOverviewClick);
+    try
+    {
+        new QWebChannel(qt.webChannelTransport, function(channel)
+        {
+            window.backend = channel.objects.backend;
+            if (window.backend)
+            {
+                window.backend.receive_type_overview_loaded();
+                window.backend.receive_network_loaded_notification();
+            }
+            else
+                console.log('QWebChannel is not initialized yet.');
+        });
+    }
+    catch (error)
+    {
+        console.error(error);
+    }
+});